@@ -1,725 +1,1578 @@
-# Interface.py 
-# -------------------------------------------------------------------
-
-import pygame
-import sys
-import math
-from world import World
-from player import Player
-
-try:
-    from save_load import save_game, load_game
-    HAS_SAVE_SYSTEM = True
-except ImportError:
-    HAS_SAVE_SYSTEM = False
-
-# -------- Configurações Visuais --------
-CELL = 40
-GRID_W = 15
-GRID_H = 15
-SIDEBAR_W = 300
-SCREEN_W = CELL * GRID_W + SIDEBAR_W
-SCREEN_H = CELL * GRID_H
-FPS = 60
-
-# Cores
-BG = (18, 18, 22)
-WALL_COLOR = (20, 23, 30)
-GROUND_COLOR = (38, 46, 57)
-GRID_LINE_COLOR = (28, 34, 44)
-FOG_COLOR = (10, 10, 12, 230)
-
-PLAYER_COLOR = (0, 190, 255)
-PLAYER_GLOW = (0, 150, 255, 60)
-CHEST_CLOSED = (183, 102, 205)
-CHEST_OPEN = (110, 90, 120)
-EXIT_LOCKED = (245, 188, 75)
-EXIT_OPEN = (140, 230, 150)
-INTERMEDIATE_NODE = (60, 70, 80)
-
-PATH_HIGHLIGHT = (255, 215, 0, 120)
-
-TEXT_COLOR = (235, 235, 240)
-SIDEBAR_BG = (30, 30, 40)
-SIDEBAR_BORDER = (80, 80, 95)
-
-# Inicialização
-pygame.init()
-FONT = pygame.font.SysFont("arial", 16)
-FONT_SMALL = pygame.font.SysFont("arial", 12)
-FONT_TITLE = pygame.font.SysFont("arial", 22, bold=True)
-FONT_VICTORY = pygame.font.SysFont("arial", 40, bold=True)
-
-# -------- Funções Auxiliares --------
-
-def draw_text(surf, txt, x, y, font=FONT, color=TEXT_COLOR):
-    img = font.render(txt, True, color)
-    surf.blit(img, (x, y))
-
-def node_to_coord(name, world):
-    """Converte nome do nó para (x, y) no grid."""
-    if name in world.room_positions:
-        return world.room_positions[name]
-    if name.startswith("N"): 
-        try:
-            parts = name[1:].split("_")
-            return int(parts[0]), int(parts[1])
-        except:
-            return None
-    return None
-
-def coord_to_node_at(gx, gy, world):
-    """Retorna o nome do nó na posição (gx, gy) do grid."""
-    for name, pos in world.room_positions.items():
-        if pos == (gx, gy):
-            return name
-    if 0 <= gx < GRID_W and 0 <= gy < GRID_H:
-        if world.map_grid[gy][gx] in (".", "P", "B", "E"):
-            return f"N{gx}_{gy}"
-    return None
-
-def draw_arrow_line(surface, color, start, end, width=3):
-    """Desenha uma linha com uma seta na ponta indicando direção."""
-    
-    pygame.draw.line(surface, color, start, end, width)
-    
-    rotation = math.degrees(math.atan2(start[1] - end[1], end[0] - start[0])) + 90
-
-    arrow_len = 10
-    angle = math.radians(rotation)
-    
-    tip = (end[0] - math.sin(angle) * 5, 
-           end[1] - math.cos(angle) * 5)
-    
-    side_len = 8
-    angle1 = math.radians(rotation - 150)
-    angle2 = math.radians(rotation + 150)
-    
-    p1 = (tip[0] + math.sin(angle1) * side_len, tip[1] + math.cos(angle1) * side_len)
-    p2 = (tip[0] + math.sin(angle2) * side_len, tip[1] + math.cos(angle2) * side_len)
-    
-    pygame.draw.polygon(surface, color, [tip, p1, p2])
-# -------- Classe Principal --------
-
-class Game:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
-        pygame.display.set_caption("Explorador de Território 2D - Final")
-        self.clock = pygame.time.Clock()
-
-        # Backend
-        self.world = World()
-        self.player = Player("Explorador", self.world.start_node)
-        self.graph = self.world.graph
-
-        # Estado Visual
-        self.highlight_path = [] 
-        self.message = "Use WASD ou Setas para mover!"
-        self.message_timer = 180
-        self.event_log = [] 
-        self.game_over = False
-        self.victory_timer = 0
-        self.show_comparison = False  
-        self.machine_path_cache = []
-
-    def set_message(self, txt):
-        self.message = txt
-        self.message_timer = 180
-        self.event_log.append(txt)
-        if len(self.event_log) > 6:
-            self.event_log.pop(0)
-
-    # --- Lógica de Movimento ---
-    def try_move_player(self, target_node):
-        """Tenta mover o jogador para o nó alvo."""
-        if not target_node: return
-
-        current = self.player.position
-        neighbors = self.graph.get_neighbors(current)
-
-        if target_node in neighbors:
-            self.player.move(target_node)
-            self.highlight_path = [] 
-            
-            venceu, msg = self.world.check_event(self.player)
-            if msg: self.set_message(msg)
-            if venceu:
-                self.game_over = True
-                self.machine_path_cache = self.calculate_machine_best_route(from_current_state=False)
-                self.set_message("VITÓRIA!")
-        else:
-            if target_node == current:
-                self.set_message("Você já está aqui.")
-            else:
-                self.set_message("Parede ou caminho bloqueado!")
-
-    # --- Lógica de Save/Load ---
-    def do_save(self):
-        if HAS_SAVE_SYSTEM:
-            save_game(self.player)
-            self.set_message("Jogo Salvo!")
-        else:
-            self.set_message("Erro: save_load.py ausente")
-
-    def do_load(self):
-        if HAS_SAVE_SYSTEM:
-            # Agora recebe 3 valores
-            pos, inv, steps = load_game()
-            if pos:
-                self.world = World() 
-                self.player = Player("Explorador", pos)
-                self.player.inventory = inv
-                self.player.step_count = steps # Restaura passos
-                
-                self.graph = self.world.graph
-                self.reveal_area()
-                self.highlight_path = []
-                self.set_message("Jogo Carregado!")
-            else:
-                self.set_message("Nenhum save encontrado.")
-        else:
-            self.set_message("Erro: save_load.py ausente")
-
-    # --- Input ---
-    def handle_click(self, mx, my):
-        if self.game_over: return
-        if mx > GRID_W * CELL: return
-        
-        gx, gy = mx // CELL, my // CELL
-        target = coord_to_node_at(gx, gy, self.world)
-        self.try_move_player(target)
-
-    def handle_keys(self, event):
-        # -------------------------------------------------
-        # 1. COMANDOS DE FIM DE JOGO (Vitória/Game Over)
-        # -------------------------------------------------
-        if self.game_over:
-            if event.key == pygame.K_ESCAPE:
-                pygame.event.post(pygame.event.Event(pygame.QUIT))
-            
-            elif event.key == pygame.K_c:
-                self.show_comparison = not self.show_comparison
-            # --------------------------------
-                
-            return 
-
-        # -------------------------------------------------
-        # 2. MOVIMENTAÇÃO 
-        # -------------------------------------------------
-        dx, dy = 0, 0
-        if event.key in [pygame.K_UP, pygame.K_w]: dy = -1
-        elif event.key in [pygame.K_DOWN, pygame.K_s]: dy = 1
-        elif event.key in [pygame.K_LEFT, pygame.K_a]: dx = -1
-        elif event.key in [pygame.K_RIGHT, pygame.K_d]: dx = 1
-        
-        if dx != 0 or dy != 0:
-            current_coord = node_to_coord(self.player.position, self.world)
-            if current_coord:
-                cx, cy = current_coord
-                target_node = coord_to_node_at(cx + dx, cy + dy, self.world)
-                self.try_move_player(target_node)
-            return
-
-        # -------------------------------------------------
-        # 3. FERRAMENTAS E DEBUG
-        # -------------------------------------------------
-        
-        # B: BFS (Caminho mais curto APENAS para a saída)
-        if event.key == pygame.K_b:
-            path = self.graph.bfs(self.player.position, self.world.exit_node)
-            if path:
-                self.highlight_path = path
-                self.set_message("Dica Ativada (BFS Simples)")
-            else:
-                self.set_message("Sem caminho possível.")
-
-        # V: DFS (Varredura - Visualizar algoritmo)
-       # elif event.key == pygame.K_v:
-       #     path = self.graph.dfs(self.player.position)
-       #     if path:
-       #         self.highlight_path = path
-       #         self.set_message("Visualizando DFS (Varredura)")
-       #     else:
-       #         self.set_message("Erro no DFS")
-        
-        # H: Hint Avançado (Rota Ótima da Máquina: Coletar tudo -> Sair)
-        elif event.key == pygame.K_h:
-            path = self.calculate_machine_best_route(from_current_state=True)
-            if path:
-                self.highlight_path = path
-                self.set_message("Rota Ótima (Coletar tudo -> Sair)")
-            else:
-                self.set_message("Não consigo calcular rota completa.")
-
-        # -------------------------------------------------
-        # 4. SISTEMA (Save / Load)
-        # -------------------------------------------------
-        elif event.key == pygame.K_F5:
-            self.do_save()
-            
-        elif event.key == pygame.K_F9:
-            self.do_load()
-
-    # --- Renderização ---
-    def draw(self):
-        self.screen.fill(BG)
-        
-        # 1. Grid
-        for y in range(GRID_H):
-            for x in range(GRID_W):
-                rect = (x*CELL, y*CELL, CELL, CELL)
-                color = WALL_COLOR if self.world.map_grid[y][x] == "#" else GROUND_COLOR
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, GRID_LINE_COLOR, rect, 1)
-
-        # 2. Dica 
-        if self.highlight_path:
-            # A. PREPARAÇÃO
-            coords = []
-            for node in self.highlight_path:
-                c = node_to_coord(node, self.world)
-                if c: coords.append(c)
-            
-            # B. FUNDO (Marca o território percorrido)
-            s = pygame.Surface((CELL, CELL), pygame.SRCALPHA)
-            s.fill((255, 215, 0, 50)) 
-            
-            for cx, cy in coords:
-                self.screen.blit(s, (cx*CELL, cy*CELL))
-                pygame.draw.rect(self.screen, (255, 215, 0), (cx*CELL, cy*CELL, CELL, CELL), 1)
-
-           # C. SETAS 
-            if len(coords) > 1:
-                COLORS = [
-                    (0, 255, 255),   # 1. Ciano
-                    (255, 140, 0),   # 2. Laranja
-                    (255, 0, 255),   # 3. Magenta
-                    (50, 255, 50),   # 4. Verde
-                    (255, 255, 0),   # 5. Amarelo
-                    (255, 255, 255)  # 6. Branco
-                ]
-                
-                color_idx = 0
-                current_layer_history = set()
-                current_layer_history.add(tuple(coords[0]))
-                
-                tile_visit_counts = {}
-                
-                total_points = len(coords)
-                
-                for i in range(total_points - 1):
-                    curr = coords[i]
-                    next_p = coords[i+1]
-                 
-                    if tuple(next_p) in current_layer_history:
-                        color_idx = (color_idx + 1) % len(COLORS)
-                        current_layer_history.clear() 
-                    
-                    current_layer_history.add(tuple(next_p))
-                    
-                    tile_key = (curr[0], curr[1])
-                    pass_count = tile_visit_counts.get(tile_key, 0)
-                    tile_visit_counts[tile_key] = pass_count + 1
-                    
-                    dx = next_p[0] - curr[0]
-                    dy = next_p[1] - curr[1]
-                    
-                    center_x = curr[0]*CELL + CELL//2
-                    center_y = curr[1]*CELL + CELL//2
-                    
-                    forward_shift = 9
-                    
-                    if pass_count == 0: side_shift = 0
-                    elif pass_count % 2 == 1: side_shift = 5
-                    else: side_shift = -5
-                    
-                    cx = center_x + (dx * forward_shift) + (dy * side_shift)
-                    cy = center_y + (dy * forward_shift) + (dx * side_shift)
-                    
-                    size = 5
-                    if dx == 1:   points = [(cx+size, cy), (cx-size, cy-size), (cx-size, cy+size)]
-                    elif dx == -1: points = [(cx-size, cy), (cx+size, cy-size), (cx+size, cy+size)]
-                    elif dy == 1:  points = [(cx, cy+size), (cx-size, cy-size), (cx+size, cy-size)]
-                    elif dy == -1: points = [(cx, cy-size), (cx-size, cy+size), (cx+size, cy+size)]
-                    else: continue
-
-                    current_color = COLORS[color_idx]
-                    
-                    pygame.draw.polygon(self.screen, current_color, points)
-                    pygame.draw.polygon(self.screen, (0,0,0), points, 1)
-
-            # D. DESTINO
-            if coords:
-                end_x, end_y = coords[-1]
-                pygame.draw.circle(self.screen, (255, 50, 50), 
-                                 (end_x*CELL + CELL//2, end_y*CELL + CELL//2), 6)
-        # 3. Entidades (Baús e Saída)
-        for name, pos in self.world.room_positions.items():
-            cx, cy = pos[0]*CELL + CELL//2, pos[1]*CELL + CELL//2
-            
-            # Baús
-            if name.startswith("Bau"): 
-                if name in self.world.chest_rooms:
-                    color = CHEST_CLOSED
-                else:
-                    color = CHEST_OPEN
-                
-                pygame.draw.rect(self.screen, color, (cx-10, cy-10, 20, 20), border_radius=4)
-            
-            # Saída
-            elif name == "Portão":
-                color = EXIT_OPEN if self.player.has_item("Chave") else EXIT_LOCKED
-                pygame.draw.circle(self.screen, color, (cx, cy), 12, width=3)
-                draw_text(self.screen, "SAÍDA", cx-15, cy-25, FONT_SMALL, color=color)
-                
-            # Entrada
-            elif name == "Entrada":
-                pygame.draw.circle(self.screen, (100, 100, 100), (cx, cy), 8)
-
-        # 4. Jogador (Quadrado)
-        pc = node_to_coord(self.player.position, self.world)
-        if pc:
-            rect = (pc[0] * CELL, pc[1] * CELL, CELL, CELL)
-            pygame.draw.rect(self.screen, PLAYER_COLOR, rect)
-            pygame.draw.rect(self.screen, (255, 255, 255), rect, 2)
-
-        # 6. Sidebar (Menu lateral)
-        self.draw_sidebar()
-
-        if self.game_over:
-            if self.show_comparison:
-                self.draw_comparison_screen()
-            else:
-                self.draw_victory_screen()
-        # --------------------------------------
-
-        pygame.display.flip()
-
-    def draw_sidebar(self):
-        # Fundo
-        rect = (GRID_W*CELL, 0, SIDEBAR_W, SCREEN_H)
-        pygame.draw.rect(self.screen, SIDEBAR_BG, rect)
-        pygame.draw.line(self.screen, SIDEBAR_BORDER, (GRID_W*CELL, 0), (GRID_W*CELL, SCREEN_H), 2)
-        
-        x = GRID_W*CELL + 20
-        y = 20
-        
-        draw_text(self.screen, "EXPLORADOR 2D", x, y, FONT_TITLE)
-        y += 30
-        draw_text(self.screen, f"Local: {self.player.position}", x, y, FONT_SMALL)
-        y += 20
-        # Exibe os passos do jogador
-        draw_text(self.screen, f"Passos: {self.player.step_count}", x, y, FONT, (255, 255, 0))
-        y += 30
-        
-        # Inventário
-        draw_text(self.screen, "INVENTÁRIO (AVL)", x, y, FONT, (100, 200, 255))
-        y += 20
-        items = []
-        def collect(node):
-            if node:
-                collect(node.left)
-                items.append(node.key)
-                collect(node.right)
-        collect(self.player.inventory.root)
-        
-        if not items:
-            draw_text(self.screen, "- Vazio", x, y, color=(150,150,150))
-            y += 20
-        else:
-            for item in items:
-                col = (255, 215, 0) if item == "Chave" else TEXT_COLOR
-                draw_text(self.screen, f"- {item}", x, y, color=col)
-                y += 20
-        
-        # Menu de Controles
-        y = SCREEN_H - 220
-        draw_text(self.screen, "CONTROLES", x, y, FONT, (200, 200, 100))
-        y += 25
-        controls = [
-            "WSAD / Setas : Mover",
-            "B : Dica (BFS)",
-           # "V : Varredura (DFS)",
-            "H : Rota Ótima (Coletar Tudo)",
-            "F5 : Salvar",
-            "F9 : Carregar"
-        ]
-        for c in controls:
-            draw_text(self.screen, c, x, y, FONT_SMALL, (180, 180, 180))
-            y += 18
-
-        # Mensagens
-        y = SCREEN_H - 80
-        if self.message_timer > 0:
-            self.message_timer -= 1
-            draw_text(self.screen, f"> {self.message}", x, y, color=(255, 100, 100))
-
-    def calculate_machine_best_route(self, from_current_state=False):
-        """
-        Calcula a rota da máquina.
-    
-        """
-        
-        if from_current_state:
-            start = self.player.position
-            baus_para_pegar = list(self.world.chest_rooms) 
-        else:
-            start = self.world.start_node 
-            baus_para_pegar = list(self.world.all_chests_backup) 
-        
-        saida = self.world.exit_node
-        
-        if hasattr(self.graph, 'get_collection_path'):
-            rota = self.graph.get_collection_path(start, baus_para_pegar, saida)
-            return rota
-        
-        return []
-    
-    def draw_comparison_screen(self):
-        """Desenha a tela dividida com dois mini-mapas."""
-        self.screen.fill((10, 10, 15)) 
-        
-        # Título
-        draw_text(self.screen, "ANÁLISE DE DESEMPENHO", SCREEN_W//2 - 100, 30, FONT_TITLE, (255, 255, 255))
-        
-        mini_cell = 20
-        margin_x = 50
-        start_y = 100
-        
-        # --- LADO ESQUERDO: JOGADOR ---
-        draw_text(self.screen, "SUA ROTA", margin_x, start_y - 30, FONT, (0, 190, 255))
-        player_path_list = self.player.history 
-        
-        self.draw_mini_map(margin_x, start_y, mini_cell, player_path_list, (0, 190, 255), is_list=True)
-        # -----------------
-        
-        # Estatísticas Jogador
-        stats_y = start_y + (15 * mini_cell) + 20
-        draw_text(self.screen, f"Passos: {self.player.step_count}", margin_x, stats_y, FONT_SMALL)
-        
-        
-        # --- LADO DIREITO: MÁQUINA ---
-        machine_x = margin_x + (15 * mini_cell) + 100
-        draw_text(self.screen, "ROTA OTIMIZADA (IA)", machine_x, start_y - 30, FONT, (255, 215, 0))
-        
-        machine_path_list = self.machine_path_cache
-        self.draw_mini_map(machine_x, start_y, mini_cell, machine_path_list, (255, 215, 0), is_list=True)
-        
-        # Estatísticas Máquina
-        passos_ia = len(machine_path_list) if machine_path_list else 0
-        draw_text(self.screen, f"Passos Ideais: {passos_ia}", machine_x, stats_y, FONT_SMALL, (255, 215, 0))
-        
-        # Diferença
-        diff = self.player.step_count - passos_ia
-        color_diff = (100, 255, 100) if diff <= 5 else (255, 100, 100)
-        draw_text(self.screen, f"Diferença: {diff} passos", SCREEN_W//2 - 60, stats_y + 40, FONT, color_diff)
-        
-        # Rodapé
-        draw_text(self.screen, "Pressione 'C' para voltar | ESC para sair", SCREEN_W//2 - 120, SCREEN_H - 40, FONT_SMALL, (150, 150, 150))
-
-    def draw_mini_map(self, offset_x, offset_y, cell_size, path_data, base_color, is_list=False):
-        """Mini-mapa com lógica de Cores por Camada ."""
-        
-        # 1. Desenha o Grid 
-        for y in range(15):
-            for x in range(15):
-                rect = (offset_x + x*cell_size, offset_y + y*cell_size, cell_size, cell_size)
-                char = self.world.map_grid[y][x]
-                
-                if char == "#": color = (30, 30, 40)
-                elif char == "E": color = (80, 40, 40)
-                elif char == "P": color = (40, 40, 80)
-                else: color = (15, 15, 20)
-                
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (25, 25, 30), rect, 1)
-
-        # 2. Desenha o Caminho
-        if is_list: 
-            coords = []
-            for node in path_data:
-                if isinstance(node, tuple): coords.append(node)
-                else:
-                    c = node_to_coord(node, self.world)
-                    if c: coords.append(c)
-            
-            if len(coords) > 1:
-                COLORS = [
-                    (0, 255, 255),   # 1. Ciano
-                    (255, 140, 0),   # 2. Laranja
-                    (255, 0, 255),   # 3. Magenta
-                    (50, 255, 50),   # 4. Verde
-                    (255, 255, 0),   # 5. Amarelo
-                    (255, 255, 255)  # 6. Branco
-                ]
-                
-                color_idx = 0
-                current_layer_history = set()
-                current_layer_history.add(tuple(coords[0]))
-                
-                tile_visit_counts = {}
-                total_points = len(coords)
-                
-                for i in range(total_points - 1):
-                    curr = coords[i]
-                    next_p = coords[i+1]
-                    
-                    if tuple(next_p) in current_layer_history:
-                        color_idx = (color_idx + 1) % len(COLORS)
-                        current_layer_history.clear()
-                    
-                    current_layer_history.add(tuple(next_p))
-                    
-                    tile_key = (curr[0], curr[1])
-                    pass_count = tile_visit_counts.get(tile_key, 0)
-                    tile_visit_counts[tile_key] = pass_count + 1
-                    
-                    dx = next_p[0] - curr[0]
-                    dy = next_p[1] - curr[1]
-                    
-                    center_x = offset_x + curr[0]*cell_size + cell_size//2
-                    center_y = offset_y + curr[1]*cell_size + cell_size//2
-                    
-                    forward_shift = cell_size // 2 - 2  
-                    
-                    if pass_count == 0: side_shift = 0
-                    elif pass_count % 2 == 1: side_shift = 3  
-                    else: side_shift = -3
-                    
-                    cx = center_x + (dx * forward_shift) + (dy * side_shift)
-                    cy = center_y + (dy * forward_shift) + (dx * side_shift)
-                
-                    size = 3 
-                    
-                    if dx == 1:   points = [(cx+size, cy), (cx-size, cy-size), (cx-size, cy+size)]
-                    elif dx == -1: points = [(cx-size, cy), (cx+size, cy-size), (cx+size, cy+size)]
-                    elif dy == 1:  points = [(cx, cy+size), (cx-size, cy-size), (cx+size, cy-size)]
-                    elif dy == -1: points = [(cx, cy-size), (cx-size, cy+size), (cx+size, cy+size)]
-                    else: continue
-
-                    current_color = COLORS[color_idx]
-                    
-                    pygame.draw.polygon(self.screen, current_color, points)
-
-                # Ponto Final 
-                last = coords[-1]
-                lx = offset_x + last[0]*cell_size + cell_size//2
-                ly = offset_y + last[1]*cell_size + cell_size//2
-                pygame.draw.circle(self.screen, (255, 50, 50), (lx, ly), 3)
-
-        else: 
-            for (tile_x, tile_y) in path_data:
-                 rect = (offset_x + tile_x*cell_size, offset_y + tile_y*cell_size, cell_size, cell_size)
-                 pygame.draw.rect(self.screen, base_color, rect)
-                 pygame.draw.rect(self.screen, (255, 255, 255), rect, 1)
-
-    def draw_victory_screen(self):
-
-
-        self.victory_timer += 1
-        
-        # 1. Fundo Escurecido
-        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220)) 
-        self.screen.blit(overlay, (0,0))
-        
-        center_x = SCREEN_W // 2
-        
-        # 2. Título
-        cols = [(255,215,0), (255,100,100), (100,255,100)]
-        c = cols[(self.victory_timer // 10) % 3]
-        
-        txt = FONT_VICTORY.render("VITÓRIA!", True, c)
-        self.screen.blit(txt, txt.get_rect(center=(center_x, SCREEN_H//2 - 110)))
-        
-        sub = FONT.render("Você escapou do labirinto!", True, (255, 255, 255))
-        self.screen.blit(sub, sub.get_rect(center=(center_x, SCREEN_H//2 - 60)))
-
-        # 3. Estatísticas do Jogador (Contagem de Itens)
-        player_items_count = 0
-        def count_inv(node):
-            nonlocal player_items_count
-            if node:
-                player_items_count += 1
-                count_inv(node.left)
-                count_inv(node.right)
-        count_inv(self.player.inventory.root)
-        
-        # Total de baús possíveis (Máquina sempre pega tudo)
-        total_items_possible = len(self.world.all_chests_backup)
-        
-        # 4. Cálculos da Máquina
-        rota_maquina = self.machine_path_cache if self.machine_path_cache else self.calculate_machine_best_route()
-        passos_maquina = len(rota_maquina) if rota_maquina else 0
-        
-        # 5. Avaliação Inteligente
-        if player_items_count < total_items_possible:
-            avaliacao = "Exploração Incompleta!"
-            cor_av = (255, 165, 0) # Laranja
-        else:
-            # Se pegou tudo, compara os passos
-            diff = self.player.step_count - passos_maquina
-            if diff <= 5:
-                avaliacao = "PERFEITO! (100% + Rota Ótima)"
-                cor_av = (100, 255, 100)
-            elif diff < 20:
-                avaliacao = "Muito bom! (100% Coletado)"
-                cor_av = (255, 255, 100)
-            else:
-                avaliacao = "Eficiência Baixa..."
-                cor_av = (255, 100, 100)
-
-        # 6. Renderização das Estatísticas
-        stats_y = SCREEN_H // 2 
-        
-        # --- BLOCO 1: JOGADOR ---
-        draw_text(self.screen, "--- SEU DESEMPENHO ---", center_x - 90, stats_y, FONT_SMALL, (0, 200, 255))
-        draw_text(self.screen, f"Passos: {self.player.step_count}", center_x - 80, stats_y + 20, FONT, (200, 255, 255))
-        
-        # Cor condicional para itens do jogador
-        col_item = (100, 255, 100) if player_items_count == total_items_possible else (255, 100, 100)
-        draw_text(self.screen, f"Itens: {player_items_count} / {total_items_possible}", center_x - 80, stats_y + 45, FONT, col_item)
-        
-        # --- BLOCO 2: MÁQUINA (IA) ---
-        stats_y += 85
-        draw_text(self.screen, "--- DESEMPENHO IDEAL (IA) ---", center_x - 90, stats_y, FONT_SMALL, (255, 215, 0))
-        draw_text(self.screen, f"Passos: {passos_maquina}", center_x - 80, stats_y + 20, FONT, (255, 255, 200))
-        draw_text(self.screen, f"Itens: {total_items_possible} / {total_items_possible} (100%)", center_x - 80, stats_y + 45, FONT, (255, 215, 0))
-        
-        # --- BLOCO 3: CONCLUSÃO ---
-        stats_y += 80
-        draw_text(self.screen, f"Resultado: {avaliacao}", center_x - 80, stats_y, FONT, cor_av)
-        
-        # 7. Rodapé (Teclas)
-        info2 = FONT_SMALL.render("[ TECLA 'C' ] COMPARAR ROTAS VISUALMENTE", True, (0, 255, 255))
-        self.screen.blit(info2, info2.get_rect(center=(center_x, SCREEN_H - 70)))
-        
-        info = FONT_SMALL.render("Pressione ESC para sair", True, (150, 150, 150))
-        self.screen.blit(info, info.get_rect(center=(center_x, SCREEN_H - 40)))
-
-        # 8. Efeito de Confete
-        import random
-        random.seed(self.victory_timer // 5)
-        for _ in range(25): 
-            sx = random.randint(0, SCREEN_W)
-            sy = random.randint(0, SCREEN_H)
-            pygame.draw.circle(self.screen, (255, 255, 200), (sx, sy), 2)
-   
-    def run(self):
-        running = True
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT: running = False
-                if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                    self.handle_click(event.pos[0], event.pos[1])
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE: running = False
-                    else: self.handle_keys(event)
-            
-            self.draw()
-            self.clock.tick(FPS)
-        pygame.quit()
-        sys.exit()
-
-if __name__ == "__main__":
-    Game().run()
+# Interface.py 
+# -------------------------------------------------------------------
+
+import pygame
+import sys
+import math
+from collections import OrderedDict
+import os
+import profiler
+from world import World
+from world_pool import get_pool, get_world
+from player import Player
+from camera import Camera
+from route_worker import RouteWorker
+from fog import FogOfWar
+from open_world import ChunkedWorld
+
+try:
+    from save_load import save_game, load_game
+    HAS_SAVE_SYSTEM = True
+except ImportError:
+    HAS_SAVE_SYSTEM = False
+
+# -------- Configurações Visuais --------
+CELL = 40
+GRID_W = 15
+GRID_H = 15
+SIDEBAR_W = 300
+SCREEN_W = CELL * GRID_W + SIDEBAR_W
+SCREEN_H = CELL * GRID_H
+FPS = 60
+
+# Área do mapa na tela (o resto é a sidebar)
+VIEW_W = CELL * GRID_W
+VIEW_H = CELL * GRID_H
+VIEW_RECT = pygame.Rect(0, 0, VIEW_W, VIEW_H)
+NEAR_ZOOM = 20    # abaixo disso (pixels por casa) usa a textura reduzida
+CHUNK = 16        # casas por bloco pré-renderizado
+MAX_CHUNKS = 32   # blocos mantidos em cache (LRU)
+MINI_BOX = 300    # lado (pixels) dos mini-mapas da tela de comparação
+
+# Nome exibido da busca usada na dica B (Graph.search)
+SEARCH_LABELS = {"bfs": "BFS Simples", "astar": "A*", "bidir": "BFS Bidirecional",
+                 "dijkstra": "Dijkstra", "jps": "Jump Point Search", "hpa": "Hierárquica"}
+# A partir deste nº de casas a dica B usa a busca em blocos (World.hierarchical_path)
+HPA_MIN_CELLS = 250_000
+
+# Cores
+BG = (18, 18, 22)
+WALL_COLOR = (20, 23, 30)
+GROUND_COLOR = (38, 46, 57)
+# Terrenos com custo (world.TERRAIN_COSTS)
+TERRAIN_COLORS = {
+    ",": (66, 54, 40),   # lama
+    "=": (70, 62, 84),   # escada
+    "~": (30, 58, 92),   # água
+}
+TILE_COLORS = {"#": WALL_COLOR, **TERRAIN_COLORS}
+GRID_LINE_COLOR = (28, 34, 44)
+FOG_COLOR = (10, 10, 12, 230)
+
+PLAYER_COLOR = (0, 190, 255)
+PLAYER_GLOW = (0, 150, 255, 60)
+CHEST_CLOSED = (183, 102, 205)
+CHEST_OPEN = (110, 90, 120)
+EXIT_LOCKED = (245, 188, 75)
+EXIT_OPEN = (140, 230, 150)
+INTERMEDIATE_NODE = (60, 70, 80)
+
+PATH_HIGHLIGHT = (255, 215, 0, 120)
+
+# Cores das "camadas" de setas (troca quando o caminho repete uma casa)
+PATH_COLORS = [
+    (0, 255, 255),   # 1. Ciano
+    (255, 140, 0),   # 2. Laranja
+    (255, 0, 255),   # 3. Magenta
+    (50, 255, 50),   # 4. Verde
+    (255, 255, 0),   # 5. Amarelo
+    (255, 255, 255)  # 6. Branco
+]
+
+def _palette(colors, default):
+    """Paleta de 256 cores + tabela de tradução caractere do grid -> índice."""
+    palette = [default] + [c for c in colors.values()]
+    palette += [(0, 0, 0)] * (256 - len(palette))
+    table = bytearray(256)  # índice 0 = cor padrão
+    for i, ch in enumerate(colors, start=1):
+        table[ord(ch)] = i
+    return palette, bytes(table)
+
+# Texturas 1 pixel por casa (zoom distante e mini-mapas grandes)
+PALETTES = {
+    "mapa": _palette(TILE_COLORS, GROUND_COLOR),
+    "mini": _palette({"#": (30, 30, 40), "E": (80, 40, 40), "P": (40, 40, 80)}, (15, 15, 20)),
+}
+
+TEXT_COLOR = (235, 235, 240)
+SIDEBAR_BG = (30, 30, 40)
+SIDEBAR_BORDER = (80, 80, 95)
+
+# Fontes (criadas no primeiro uso: SysFont varre as fontes do sistema)
+class LazyFont:
+    """Representa uma SysFont que só é carregada quando usada pela primeira vez."""
+
+    def __init__(self, name, size, bold=False):
+        self.name = name
+        self.size_pt = size
+        self.bold = bold
+        self._font = None
+
+    def load(self):
+        if self._font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            self._font = pygame.font.SysFont(self.name, self.size_pt, bold=self.bold)
+        return self._font
+
+    def __getattr__(self, attr):
+        # render(), size(), get_height()... vão para a fonte real
+        return getattr(self.load(), attr)
+
+FONT = LazyFont("arial", 16)
+FONT_SMALL = LazyFont("arial", 12)
+FONT_TITLE = LazyFont("arial", 22, bold=True)
+FONT_VICTORY = LazyFont("arial", 40, bold=True)
+
+# -------- Funções Auxiliares --------
+
+class TextCache:
+    """Cache LRU de textos renderizados, chave (texto, fonte, cor)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, txt, color):
+        key = (txt, font, color)
+        img = self._items.get(key)
+        if img is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return img
+
+        self.misses += 1
+        img = font.render(txt, True, color)
+        self._items[key] = img
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+            self.evictions += 1
+        return img
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self):
+        return {"size": len(self._items), "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
+
+TEXT_CACHE = TextCache()
+
+def draw_text(surf, txt, x, y, font=FONT, color=TEXT_COLOR):
+    img = TEXT_CACHE.render(font, txt, color)
+    surf.blit(img, (x, y))
+
+def node_to_coord(name, world):
+    """Converte o nó (id da casa ou nome da sala) para (x, y) no grid."""
+    return world.coord_of(name)
+
+def coord_to_node_at(gx, gy, world):
+    """Retorna o nó na posição (gx, gy) do grid."""
+    return world.node_at(gx, gy)
+
+def path_coords(path, world):
+    """Converte uma lista de nós (ou tuplas) em coordenadas do grid."""
+    coords = []
+    for node in path:
+        if isinstance(node, tuple):
+            coords.append(node)
+        else:
+            c = node_to_coord(node, world)
+            if c: coords.append(c)
+    return coords
+
+def path_arrows(coords, cell_size, offset_x, offset_y, forward_shift, side_step, size):
+    """
+    Pré-calcula as setas de um caminho: lista de (cor, pontos do triângulo).
+    Feito uma vez por caminho; o desenho por quadro só percorre a lista.
+    """
+    arrows = []
+    if len(coords) < 2:
+        return arrows
+
+    color_idx = 0
+    current_layer_history = {tuple(coords[0])}
+    tile_visit_counts = {}
+
+    for i in range(len(coords) - 1):
+        curr = coords[i]
+        next_p = coords[i+1]
+
+        if tuple(next_p) in current_layer_history:
+            color_idx = (color_idx + 1) % len(PATH_COLORS)
+            current_layer_history.clear()
+
+        current_layer_history.add(tuple(next_p))
+
+        tile_key = (curr[0], curr[1])
+        pass_count = tile_visit_counts.get(tile_key, 0)
+        tile_visit_counts[tile_key] = pass_count + 1
+
+        dx = next_p[0] - curr[0]
+        dy = next_p[1] - curr[1]
+
+        center_x = offset_x + curr[0]*cell_size + cell_size//2
+        center_y = offset_y + curr[1]*cell_size + cell_size//2
+
+        if pass_count == 0: side_shift = 0
+        elif pass_count % 2 == 1: side_shift = side_step
+        else: side_shift = -side_step
+
+        cx = center_x + (dx * forward_shift) + (dy * side_shift)
+        cy = center_y + (dy * forward_shift) + (dx * side_shift)
+
+        if dx == 1:   points = [(cx+size, cy), (cx-size, cy-size), (cx-size, cy+size)]
+        elif dx == -1: points = [(cx-size, cy), (cx+size, cy-size), (cx+size, cy+size)]
+        elif dy == 1:  points = [(cx, cy+size), (cx-size, cy-size), (cx+size, cy-size)]
+        elif dy == -1: points = [(cx, cy-size), (cx-size, cy+size), (cx+size, cy+size)]
+        else: continue
+
+        arrows.append((PATH_COLORS[color_idx], points))
+    return arrows
+
+def draw_arrow_line(surface, color, start, end, width=3):
+    """Desenha uma linha com uma seta na ponta indicando direção."""
+    
+    pygame.draw.line(surface, color, start, end, width)
+    
+    rotation = math.degrees(math.atan2(start[1] - end[1], end[0] - start[0])) + 90
+
+    arrow_len = 10
+    angle = math.radians(rotation)
+    
+    tip = (end[0] - math.sin(angle) * 5, 
+           end[1] - math.cos(angle) * 5)
+    
+    side_len = 8
+    angle1 = math.radians(rotation - 150)
+    angle2 = math.radians(rotation + 150)
+    
+    p1 = (tip[0] + math.sin(angle1) * side_len, tip[1] + math.cos(angle1) * side_len)
+    p2 = (tip[0] + math.sin(angle2) * side_len, tip[1] + math.cos(angle2) * side_len)
+    
+    pygame.draw.polygon(surface, color, [tip, p1, p2])
+# -------- Classe Principal --------
+
+class Game:
+    def __init__(self, world=None, headless=False):
+        # headless: desenha numa Surface fora da tela (CI / benchmark, sem display)
+        self.headless = headless
+        if headless:
+            pygame.font.init()  # sem display: só o módulo de fontes
+            self.screen = pygame.Surface((SCREEN_W, SCREEN_H))
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+            pygame.display.set_caption("Explorador de Território 2D - Final")
+        self.clock = pygame.time.Clock()
+
+        # Câmera (rolagem + zoom) sobre a área do mapa
+        self.camera = Camera(VIEW_W, VIEW_H)
+
+        # Rotas calculadas fora do loop (dicas B/H e rota ideal da vitória)
+        self.routes = RouteWorker()
+        self._hint_messages = None      # (mensagem de sucesso, de falha) da dica pedida
+
+        # Backend
+        if world is None:
+            world = self.wait_for_world()  # da reserva de mundos prontos
+        self.set_world(world)
+        self.player = Player("Explorador", self.world.start_node, self.world.coord_of,
+                             self.world.verbose, fog=FogOfWar(self.world.map_grid),
+                             step_cost=self.graph.edge_weight)
+
+        # Estado Visual
+        self.highlight_path = [] 
+        self.message = "Use WASD ou Setas para mover!"
+        self.message_timer = 180
+        self.event_log = [] 
+        self.game_over = False
+        self.victory_timer = 0
+        self.show_comparison = False  
+        self.machine_path_cache = []
+        self.show_debug = False  # overlay do profiler (F3)
+
+        # Cache de renderização
+        self._render_key = None         # (mundo, zoom) dos caches abaixo
+        self._map_chunks = OrderedDict()  # blocos de paredes/chão (LRU)
+        self._overviews = {}            # texturas 1px/casa por paleta
+        self._scaled_cache = {}         # texturas já reduzidas (zoom "mapa inteiro")
+        self._path_geom = {}            # dica pré-calculada por bloco
+        self._path_geom_src = None      # lista de nós usada para gerá-la
+        self._path_chunks = {}          # blocos da dica pré-renderizados
+        self._path_overview = None      # dica em 1px/casa
+        self._full_redraw = True        # próximo quadro redesenha tudo
+        self._dirty_tiles = set()       # casas alteradas desde o último quadro
+        self._sidebar_key = None        # estado exibido na sidebar
+        self._mini_map_cache = {}       # (x, y, célula) -> (caminho, Surface)
+        self._fog_texture = None        # neblina 1px/casa (atualizada no lugar)
+        self._fog_scaled = None         # (chave, Surface ampliada, posição na tela)
+
+    def wait_for_world(self):
+        """
+        Retira um mundo da reserva. Se nenhum estiver pronto, mostra a tela
+        de carregamento (mantendo a janela responsiva) enquanto a thread da
+        reserva termina a geração, em vez de gerar um segundo mundo aqui.
+        """
+        # Janela: sem os logs de terminal do Graph/World (cada edição ou
+        # busca imprimiria no stdout)
+        pool = get_pool()
+        if self.headless or pool.ready_count():
+            return pool.get(verbose=False)
+
+        frame = 0
+        while not pool.ready_count():
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+            self.screen.fill(BG)
+            pontos = "." * (frame // 15 % 4)
+            draw_text(self.screen, f"Carregando mundo{pontos}", SCREEN_W//2 - 80, SCREEN_H//2 - 10, FONT_TITLE)
+            pygame.display.flip()
+            self.clock.tick(FPS)
+            frame += 1
+        return pool.get(verbose=False)
+
+    def set_message(self, txt):
+        self.message = txt
+        self.message_timer = 180
+        self.event_log.append(txt)
+        if len(self.event_log) > 6:
+            self.event_log.pop(0)
+
+    # --- Lógica de Movimento ---
+    def try_move_player(self, target_node):
+        """Tenta mover o jogador para o nó alvo."""
+        if target_node is None: return  # id 0 (casa 0, 0) também é nó
+
+        current = self.player.position
+        neighbors = self.graph.get_neighbors(current)
+
+        if target_node in neighbors:
+            self.mark_dirty(current)
+            self.mark_dirty(target_node)
+            self.player.move(target_node)
+            self.routes.cancel("dica")  # a dica pedida era da posição antiga
+            if self.highlight_path:
+                self._full_redraw = True
+            self.highlight_path = [] 
+            
+            venceu, msg = self.world.check_event(self.player)
+            if msg:
+                self.set_message(msg)
+                self._full_redraw = True  # baú aberto / portão muda de cor
+            if venceu:
+                self.game_over = True
+                self.routes.submit("vitoria", self.graph.get_collection_path,
+                                   *self.machine_route_args(from_current_state=False), *self.collection_search())
+                self.set_message("VITÓRIA!")
+        else:
+            if target_node == current:
+                self.set_message("Você já está aqui.")
+            else:
+                self.set_message("Parede ou caminho bloqueado!")
+
+    # --- Lógica de Save/Load ---
+    def do_save(self):
+        if HAS_SAVE_SYSTEM:
+            save_game(self.player, self.world.node_name, self.world.map_id())
+            self.set_message("Jogo Salvo!")
+        else:
+            self.set_message("Erro: save_load.py ausente")
+
+    def do_load(self):
+        if HAS_SAVE_SYSTEM:
+            # Posição, inventário, passos, neblina e o mapa em que foi salvo
+            pos, inv, steps, neblina, mapa = load_game()
+            if pos:
+                # Mesmo mapa: continua nele, com a neblina salva. Outro mapa
+                # (ou save antigo, sem 'mapa'): mundo novo e neblina zerada
+                mesmo_mapa = mapa is not None and mapa == self.world.map_id()
+                if not mesmo_mapa:
+                    self.set_world(get_world(verbose=False))
+                pos = self.world.parse_node(pos)
+                if pos is None:
+                    pos = self.world.start_node
+                fog = FogOfWar(self.world.map_grid)
+                if neblina and mesmo_mapa:
+                    fog.load_text(neblina)
+                self.player = Player("Explorador", pos, self.world.coord_of, self.world.verbose,
+                                     fog=fog, step_cost=self.graph.edge_weight)
+                self.player.inventory = inv
+                self.player.step_count = steps # Restaura passos
+                
+                self.reveal_area()
+                self.highlight_path = []
+                self._full_redraw = True
+                self.set_message("Jogo Carregado!")
+            else:
+                self.set_message("Nenhum save encontrado.")
+        else:
+            self.set_message("Erro: save_load.py ausente")
+
+    def reveal_area(self):
+        """Revela a visão em volta do jogador e refaz a neblina desenhada."""
+        self.player.reveal_around()
+        self.player.fog.pop_changes()
+        self._fog_texture = None
+        self._fog_scaled = None
+        self._full_redraw = True
+
+    # --- Input ---
+    def handle_click(self, mx, my):
+        if self.game_over: return
+        if mx >= VIEW_W: return
+        
+        gx, gy = self.camera.to_tile(mx, my)
+        target = coord_to_node_at(gx, gy, self.world)
+        self.try_move_player(target)
+
+    def handle_keys(self, event):
+        # -------------------------------------------------
+        # 0. DEPURAÇÃO (funciona em qualquer estado)
+        # -------------------------------------------------
+        if event.key == pygame.K_F3:
+            self._full_redraw = True
+            self.show_debug = not self.show_debug
+            profiler.enable(self.show_debug)
+            return
+        if event.key == pygame.K_F4:
+            profiler.export_json(os.path.join("data", "profile.json"))
+            profiler.export_csv(os.path.join("data", "profile.csv"))
+            self.set_message("Profiler exportado em data/")
+            return
+
+        # -------------------------------------------------
+        # 1. COMANDOS DE FIM DE JOGO (Vitória/Game Over)
+        # -------------------------------------------------
+        if self.game_over:
+            if event.key == pygame.K_ESCAPE:
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+            
+            elif event.key == pygame.K_c:
+                self.show_comparison = not self.show_comparison
+            # --------------------------------
+                
+            return 
+
+        # -------------------------------------------------
+        # 2. MOVIMENTAÇÃO 
+        # -------------------------------------------------
+        dx, dy = 0, 0
+        if event.key in [pygame.K_UP, pygame.K_w]: dy = -1
+        elif event.key in [pygame.K_DOWN, pygame.K_s]: dy = 1
+        elif event.key in [pygame.K_LEFT, pygame.K_a]: dx = -1
+        elif event.key in [pygame.K_RIGHT, pygame.K_d]: dx = 1
+        
+        if dx != 0 or dy != 0:
+            current_coord = node_to_coord(self.player.position, self.world)
+            if current_coord:
+                cx, cy = current_coord
+                target_node = coord_to_node_at(cx + dx, cy + dy, self.world)
+                self.try_move_player(target_node)
+            return
+
+        # -------------------------------------------------
+        # 3. FERRAMENTAS E DEBUG
+        # -------------------------------------------------
+        self._full_redraw = True  # dica / load mudam o mapa inteiro
+        
+        # + / -: Zoom da câmera (centrado no jogador)
+        if event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.camera.zoom(-1, node_to_coord(self.player.position, self.world))
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.camera.zoom(+1, node_to_coord(self.player.position, self.world))
+
+        # B: BFS (Caminho mais curto APENAS para a saída)
+        elif event.key == pygame.K_b:
+            metodo = self.graph.search
+            if self.graph.weighted and metodo != "astar":
+                metodo = "dijkstra"  # terreno com custo
+            # BFS/Dijkstra: desce a árvore de distâncias da saída (calculada uma vez por mapa)
+            busca = self.graph.path_to if metodo in ("bfs", "dijkstra") else self.graph.shortest_path
+            grande = self.large_map_search()
+            if grande is not None:
+                metodo, busca = grande
+            nome = SEARCH_LABELS.get(metodo, metodo)
+            self.request_hint((f"Dica Ativada ({nome})", "Sem caminho possível."),
+                              busca, self.player.position, self.world.exit_node)
+
+        # V: DFS (Varredura - Visualizar algoritmo)
+       # elif event.key == pygame.K_v:
+       #     path = self.graph.dfs(self.player.position)
+       #     if path:
+       #         self.highlight_path = path
+       #         self.set_message("Visualizando DFS (Varredura)")
+       #     else:
+       #         self.set_message("Erro no DFS")
+        
+        # H: Hint Avançado (Rota Ótima da Máquina: Coletar tudo -> Sair)
+        elif event.key == pygame.K_h:
+            self.request_hint(("Rota Ótima (Coletar tudo -> Sair)", "Não consigo calcular rota completa."),
+                              self.graph.get_collection_path, *self.machine_route_args(from_current_state=True),
+                              *self.collection_search())
+
+        # -------------------------------------------------
+        # 4. SISTEMA (Save / Load)
+        # -------------------------------------------------
+        elif event.key == pygame.K_F5:
+            self.do_save()
+            
+        elif event.key == pygame.K_F9:
+            self.do_load()
+
+    # --- Renderização ---
+    def mark_dirty(self, node):
+        """Marca a casa do nó para ser redesenhada no próximo quadro."""
+        c = node_to_coord(node, self.world)
+        if c:
+            self._dirty_tiles.add(c)
+
+    def set_world(self, world):
+        """Troca o mundo exibido (novo jogo / load) e reinicia os caches."""
+        self.world = world
+        self.graph = world.graph
+        self.camera.set_map(world.width, world.height)
+        self.routes.cancel("dica")     # rotas pedidas para o mundo anterior
+        self.routes.cancel("vitoria")
+        self._fog_texture = None
+        self._fog_scaled = None
+        self._full_redraw = True
+
+    def draw(self):
+        if self.message_timer > 0:
+            self.message_timer -= 1
+
+        # Câmera segue o jogador; se rolar, o quadro inteiro muda
+        pc = node_to_coord(self.player.position, self.world)
+        if pc and self.camera.follow(*pc):
+            self._full_redraw = True
+
+        self.sync_fog()
+
+        # Telas animadas / overlay / mudanças grandes -> quadro completo
+        if self._full_redraw or self.game_over or self.show_debug:
+            self.draw_full()
+        else:
+            with profiler.section("draw.dirty"):
+                self.draw_dirty()
+
+    def draw_full(self):
+        with profiler.section("draw.frame"):
+            self.screen.fill(BG)
+            self.screen.set_clip(VIEW_RECT)
+
+            # 1. Grid
+            with profiler.section("draw.grid"):
+                self.draw_grid()
+                self.draw_fog()
+
+            # 2. Dica
+            with profiler.section("draw.path"):
+                self.draw_path_overlay()
+
+            # 3. Entidades (Baús e Saída)
+            with profiler.section("draw.entities"):
+                self.draw_entities()
+
+            # 4. Jogador (Quadrado)
+            self.draw_player()
+            self.screen.set_clip(None)
+
+            # 6. Sidebar (Menu lateral)
+            with profiler.section("draw.sidebar"):
+                self.draw_sidebar()
+
+            if self.game_over:
+                with profiler.section("draw.end_screen"):
+                    if self.show_comparison:
+                        self.draw_comparison_screen()
+                    else:
+                        self.draw_victory_screen()
+
+            # 7. Overlay de depuração (F3)
+            if self.show_debug:
+                self.draw_debug_overlay()
+
+            if not self.headless:
+                pygame.display.flip()
+
+        self._full_redraw = False
+        self._dirty_tiles.clear()
+
+    def draw_dirty(self):
+        """Redesenha só as casas alteradas e a sidebar (se mudou)."""
+        rects = []
+        cell = self.camera.cell
+        for tx, ty in self._dirty_tiles:
+            if not self.camera.is_visible(tx, ty):
+                continue
+            sx, sy = self.camera.to_screen(tx, ty)
+            r = pygame.Rect(sx, sy, math.ceil(cell), math.ceil(cell)).clip(VIEW_RECT)
+            self.screen.set_clip(r)
+            self.draw_grid()
+            self.draw_fog()
+            self.draw_path_overlay()
+            self.draw_entities(r)
+            self.draw_player()
+            self.screen.set_clip(None)
+            rects.append(r)
+        self._dirty_tiles.clear()
+
+        if self._sidebar_state() != self._sidebar_key:
+            self.draw_sidebar()
+            rects.append(pygame.Rect(VIEW_W - 1, 0, SIDEBAR_W + 1, SCREEN_H))
+
+        if rects and not self.headless:
+            pygame.display.update(rects)
+
+    # ----- Camada estática do mapa -----
+    def _check_render_cache(self):
+        """Descarta caches feitos para outro mundo ou outro zoom."""
+        key = (self.world, self.camera.cell)
+        if self._render_key != key:
+            if self._render_key is None or self._render_key[0] is not self.world:
+                self._overviews.clear()
+            self._render_key = key
+            self._map_chunks.clear()
+            self._path_chunks.clear()
+            self._path_geom_src = None
+            self._scaled_cache.clear()
+
+    def build_map_chunk(self, ccx, ccy):
+        """Pré-renderiza paredes e chão de um bloco CHUNK×CHUNK do mapa."""
+        cell = self.camera.cell
+        grid = self.world.map_grid
+        layer = pygame.Surface((CHUNK * cell, CHUNK * cell))
+        layer.fill(BG)
+        x0, y0 = ccx * CHUNK, ccy * CHUNK
+        for y in range(y0, min(y0 + CHUNK, self.world.height)):
+            row = grid.row_text(y)
+            for x in range(x0, min(x0 + CHUNK, self.world.width)):
+                rect = ((x - x0)*cell, (y - y0)*cell, cell, cell)
+                color = TILE_COLORS.get(row[x], GROUND_COLOR)
+                pygame.draw.rect(layer, color, rect)
+                pygame.draw.rect(layer, GRID_LINE_COLOR, rect, 1)
+        return layer
+
+    def _map_chunk(self, ccx, ccy):
+        chunk = self._map_chunks.get((ccx, ccy))
+        if chunk is None:
+            chunk = self._map_chunks[(ccx, ccy)] = self.build_map_chunk(ccx, ccy)
+            if len(self._map_chunks) > MAX_CHUNKS:
+                self._map_chunks.popitem(last=False)
+        else:
+            self._map_chunks.move_to_end((ccx, ccy))
+        return chunk
+
+    def _visible_chunks(self):
+        x0, y0, x1, y1 = self.camera.visible_tiles()
+        for ccy in range(y0 // CHUNK, (y1 - 1) // CHUNK + 1):
+            for ccx in range(x0 // CHUNK, (x1 - 1) // CHUNK + 1):
+                yield ccx, ccy
+
+    def overview(self, palette_name):
+        """Textura 1 pixel por casa do mundo inteiro (construída uma vez por mundo)."""
+        surf = self._overviews.get(palette_name)
+        if surf is None:
+            palette, table = PALETTES[palette_name]
+            data = self.world.map_grid.tobytes().translate(table)
+            small = pygame.image.frombytes(data, (self.world.width, self.world.height), "P")
+            small.set_palette(palette)
+            surf = pygame.Surface(small.get_size())  # 24 bits: aceita smoothscale
+            surf.blit(small, (0, 0))
+            self._overviews[palette_name] = surf
+        return surf
+
+    def _blit_scaled(self, texture, alpha=False):
+        """Desenha a parte visível de uma textura 1px/casa ampliada para o zoom atual."""
+        cam = self.camera
+        cell = cam.cell
+        x0, y0, x1, y1 = cam.visible_tiles()
+        if x1 <= x0 or y1 <= y0:
+            return
+        size = (max(1, round((x1 - x0) * cell)), max(1, round((y1 - y0) * cell)))
+        if cell < 1:
+            # Redução (mapa inteiro): cara, então fica em cache
+            img = self._scaled_cache.get(id(texture))
+            if img is None or img[0] is not texture:
+                sub = texture.subsurface((x0, y0, x1 - x0, y1 - y0))
+                scaled = (pygame.transform.smoothscale(sub, size) if not alpha
+                          else pygame.transform.scale(sub, size))
+                img = self._scaled_cache[id(texture)] = (texture, scaled)
+            scaled = img[1]
+        else:
+            sub = texture.subsurface((x0, y0, x1 - x0, y1 - y0))
+            scaled = pygame.transform.scale(sub, size)
+        self.screen.blit(scaled, cam.to_screen(x0, y0))
+
+    def draw_grid(self):
+        self._check_render_cache()
+        cam = self.camera
+        if cam.cell < NEAR_ZOOM:
+            # Zoom distante: textura reduzida, custo fixo por quadro
+            self._blit_scaled(self.overview("mapa"))
+            return
+        for ccx, ccy in self._visible_chunks():
+            self.screen.blit(self._map_chunk(ccx, ccy), cam.to_screen(ccx * CHUNK, ccy * CHUNK))
+
+    # ----- Neblina de guerra -----
+    def fog_texture(self):
+        """Neblina 1 pixel por casa: FOG_COLOR nas casas não exploradas, transparente nas demais."""
+        fog = self.player.fog
+        if self._fog_texture is None:
+            surf = pygame.Surface((fog.width, fog.height), pygame.SRCALPHA)
+            surf.fill(FOG_COLOR)
+            w = fog.width
+            i = fog.explored.find(1)
+            while i != -1:
+                surf.set_at((i % w, i // w), (0, 0, 0, 0))
+                i = fog.explored.find(1, i + 1)
+            self._fog_texture = surf
+        return self._fog_texture
+
+    def sync_fog(self):
+        """Aplica na textura as casas reveladas desde o último quadro (só elas)."""
+        fog = self.player.fog
+        if fog is None:
+            return
+        novas = fog.pop_changes()
+        if not novas:
+            return
+        rooms = self.world.room_positions
+        for x, y in novas:
+            if self._fog_texture is not None:
+                self._fog_texture.set_at((x, y), (0, 0, 0, 0))
+            self._dirty_tiles.add((x, y))
+            node = self.world.node_at(x, y)
+            if node in rooms:
+                self._full_redraw = True  # entidade pode passar da casa (rótulo da saída)
+
+    def draw_fog(self):
+        """Escurece as casas não exploradas; a ampliação é refeita só se algo mudou."""
+        fog = self.player.fog
+        if fog is None:
+            return
+        cam = self.camera
+        key = (fog.version, cam.x, cam.y, cam.cell)
+        if self._fog_scaled is None or self._fog_scaled[0] != key:
+            x0, y0, x1, y1 = cam.visible_tiles()
+            if x1 <= x0 or y1 <= y0:
+                return
+            size = (max(1, round((x1 - x0) * cam.cell)), max(1, round((y1 - y0) * cam.cell)))
+            sub = self.fog_texture().subsurface((x0, y0, x1 - x0, y1 - y0))
+            self._fog_scaled = (key, pygame.transform.scale(sub, size), cam.to_screen(x0, y0))
+        self.screen.blit(self._fog_scaled[1], self._fog_scaled[2])
+
+    def is_explored_node(self, name):
+        fog = self.player.fog
+        pos = node_to_coord(name, self.world)
+        return fog is None or pos is None or fog.is_explored(*pos)
+
+    # ----- Dica (caminho destacado) -----
+    def build_path_geometry(self):
+        """
+        Pré-calcula a dica atual por bloco do mapa: casas (com nº de passagens),
+        setas e destino. Feito uma vez por (caminho, zoom).
+        """
+        cell = self.camera.cell
+        span = CHUNK * cell
+        coords = path_coords(self.highlight_path, self.world)
+        geom = {}
+
+        def bucket(ck):
+            return geom.setdefault(ck, ([], [], []))
+
+        visits = {}
+        for c in coords:
+            visits[c] = visits.get(c, 0) + 1
+        for (cx, cy), k in visits.items():
+            bucket((cx // CHUNK, cy // CHUNK))[0].append((cx, cy, k))
+
+        # Setas só nos zooms próximos (nos distantes a dica é 1px por casa)
+        if cell >= NEAR_ZOOM:
+            shape = (9, 5, 5) if cell == CELL else (cell // 2 - 2, 3, 3)
+            for color, points in path_arrows(coords, cell, 0, 0, *shape):
+                xs = [p[0] for p in points]
+                ys = [p[1] for p in points]
+                # Uma seta perto da borda pode tocar dois blocos
+                for ccy in range(min(ys) // span, max(ys) // span + 1):
+                    for ccx in range(min(xs) // span, max(xs) // span + 1):
+                        bucket((ccx, ccy))[1].append((color, points))
+
+        if coords:
+            ex, ey = coords[-1]
+            bucket((ex // CHUNK, ey // CHUNK))[2].append((ex, ey))
+
+        self._path_geom = geom
+        self._path_geom_src = self.highlight_path
+        self._path_chunks.clear()
+        self._path_overview = None
+
+    def build_path_chunk(self, ccx, ccy):
+        """Pré-renderiza a dica de um bloco em uma Surface transparente."""
+        geom = self._path_geom.get((ccx, ccy))
+        if geom is None:
+            return None
+        cell = self.camera.cell
+        span = CHUNK * cell
+        ox, oy = ccx * span, ccy * span
+        surf = pygame.Surface((span, span), pygame.SRCALPHA)
+        tiles, arrows, ends = geom
+
+        # A. FUNDO (Marca o território percorrido)
+        # k passagens pela mesma casa = k camadas de alfa 50 empilhadas
+        for cx, cy, k in tiles:
+            alpha = round(255 * (1 - (1 - 50/255) ** k))
+            rect = (cx*cell - ox, cy*cell - oy, cell, cell)
+            surf.fill((255, 215, 0, alpha), rect)
+            pygame.draw.rect(surf, (255, 215, 0), rect, 1)
+
+        # B. SETAS
+        for color, points in arrows:
+            local = [(px - ox, py - oy) for px, py in points]
+            pygame.draw.polygon(surf, color, local)
+            pygame.draw.polygon(surf, (0, 0, 0), local, 1)
+
+        # C. DESTINO
+        for ex, ey in ends:
+            pygame.draw.circle(surf, (255, 50, 50),
+                               (ex*cell + cell//2 - ox, ey*cell + cell//2 - oy),
+                               max(2, 6 * cell // CELL))
+        return surf
+
+    def build_path_overview(self):
+        """Dica em 1 pixel por casa, para os zooms distantes."""
+        surf = pygame.Surface((self.world.width, self.world.height), pygame.SRCALPHA)
+        for tiles, _, ends in self._path_geom.values():
+            for cx, cy, k in tiles:
+                surf.set_at((cx, cy), (255, 215, 0, min(255, 120 + 40 * k)))
+            for ex, ey in ends:
+                surf.set_at((ex, ey), (255, 50, 50, 255))
+        self._path_overview = surf
+        return surf
+
+    def draw_path_overlay(self):
+        if not self.highlight_path:
+            return
+        self._check_render_cache()
+        # Recalcula só quando a lista da dica muda (nova dica = nova lista)
+        if self._path_geom_src is not self.highlight_path:
+            self.build_path_geometry()
+
+        cam = self.camera
+        if cam.cell < NEAR_ZOOM:
+            self._blit_scaled(self._path_overview or self.build_path_overview(), alpha=True)
+            return
+        for ck in self._visible_chunks():
+            if ck not in self._path_chunks:
+                self._path_chunks[ck] = self.build_path_chunk(*ck)
+            surf = self._path_chunks[ck]
+            if surf is not None:
+                self.screen.blit(surf, cam.to_screen(ck[0] * CHUNK, ck[1] * CHUNK))
+
+    # ----- Entidades e jogador -----
+    def entity_rect(self, name, pos):
+        """Área (na tela) ocupada pela entidade (inclui o rótulo da saída)."""
+        cell = self.camera.cell
+        sx, sy = self.camera.to_screen(*pos)
+        r = pygame.Rect(sx, sy, math.ceil(cell), math.ceil(cell))
+        if name == "Portão" and cell >= CELL:
+            w, h = FONT_SMALL.size("SAÍDA")
+            r.union_ip(pygame.Rect(r.centerx - 15, r.centery - 25, w, h))
+        return r
+
+    def draw_entities(self, area=None):
+        """Desenha baús, saída e entrada visíveis (só as que tocam 'area', se dada)."""
+        cam = self.camera
+        cell = cam.cell
+        view = area or VIEW_RECT
+        for name, pos in self.world.room_positions.items():
+            if not self.entity_rect(name, pos).colliderect(view):
+                continue
+            if not self.is_explored_node(name):
+                continue  # ainda escondida pela neblina
+            sx, sy = cam.to_screen(*pos)
+
+            # Zoom distante: só um marcador colorido
+            if cell < NEAR_ZOOM:
+                if name.startswith("Bau"):
+                    color = CHEST_CLOSED if name in self.world.chest_rooms else CHEST_OPEN
+                elif name == "Portão":
+                    color = EXIT_OPEN if self.player.has_item("Chave") else EXIT_LOCKED
+                else:
+                    color = (100, 100, 100)
+                m = max(2, math.ceil(cell))
+                pygame.draw.rect(self.screen, color, (sx, sy, m, m))
+                continue
+
+            k = cell / CELL  # escala dos desenhos em relação ao zoom padrão
+            cx, cy = sx + cell//2, sy + cell//2
+            
+            # Baús
+            if name.startswith("Bau"): 
+                if name in self.world.chest_rooms:
+                    color = CHEST_CLOSED
+                else:
+                    color = CHEST_OPEN
+                
+                h = round(10 * k)
+                pygame.draw.rect(self.screen, color, (cx-h, cy-h, 2*h, 2*h), border_radius=round(4 * k))
+            
+            # Saída
+            elif name == "Portão":
+                color = EXIT_OPEN if self.player.has_item("Chave") else EXIT_LOCKED
+                pygame.draw.circle(self.screen, color, (cx, cy), round(12 * k), width=max(1, round(3 * k)))
+                if cell >= CELL:
+                    draw_text(self.screen, "SAÍDA", cx-15, cy-25, FONT_SMALL, color=color)
+                
+            # Entrada
+            elif name == "Entrada":
+                pygame.draw.circle(self.screen, (100, 100, 100), (cx, cy), round(8 * k))
+
+    def draw_player(self):
+        pc = node_to_coord(self.player.position, self.world)
+        if pc:
+            cell = self.camera.cell
+            sx, sy = self.camera.to_screen(*pc)
+            m = max(3, math.ceil(cell))
+            rect = (sx, sy, m, m)
+            pygame.draw.rect(self.screen, PLAYER_COLOR, rect)
+            if cell >= NEAR_ZOOM:
+                pygame.draw.rect(self.screen, (255, 255, 255), rect, 2)
+
+    def draw_debug_overlay(self):
+        """Painel com contadores e tempos do profiler (F3)."""
+        lines = profiler.summary_lines(limit=24)
+        if not lines:
+            lines = ["(sem dados ainda)"]
+        st = TEXT_CACHE.stats()
+        lines.append(f"text_cache: {st['size']} itens, {st['hits']} hits, "
+                     f"{st['misses']} misses, {st['evictions']} despejos")
+        h = 22 + 14 * len(lines)
+        overlay = pygame.Surface((GRID_W * CELL, h), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 190))
+        self.screen.blit(overlay, (0, 0))
+        draw_text(self.screen, "PROFILER (F3 fecha | F4 exporta)", 6, 4, FONT_SMALL, (100, 255, 100))
+        y = 20
+        for line in lines:
+            # Valores mudam a cada quadro: fora do cache para não expulsar textos fixos
+            self.screen.blit(FONT_SMALL.render(line, True, (220, 220, 220)), (6, y))
+            y += 14
+
+    def _sidebar_state(self):
+        msg = self.message if self.message_timer > 0 else None
+        return (self.player.position, self.player.step_count, msg, self.routes.pending("dica"))
+
+    def draw_sidebar(self):
+        self._sidebar_key = self._sidebar_state()
+        # Fundo
+        rect = (GRID_W*CELL, 0, SIDEBAR_W, SCREEN_H)
+        pygame.draw.rect(self.screen, SIDEBAR_BG, rect)
+        pygame.draw.line(self.screen, SIDEBAR_BORDER, (GRID_W*CELL, 0), (GRID_W*CELL, SCREEN_H), 2)
+        
+        x = GRID_W*CELL + 20
+        y = 20
+        
+        draw_text(self.screen, "EXPLORADOR 2D", x, y, FONT_TITLE)
+        y += 30
+        draw_text(self.screen, f"Local: {self.world.node_name(self.player.position)}", x, y, FONT_SMALL)
+        y += 20
+        # Exibe os passos do jogador
+        draw_text(self.screen, f"Passos: {self.player.step_count}", x, y, FONT, (255, 255, 0))
+        y += 30
+        
+        # Inventário
+        draw_text(self.screen, "INVENTÁRIO (AVL)", x, y, FONT, (100, 200, 255))
+        y += 20
+        items = []
+        def collect(node):
+            if node:
+                collect(node.left)
+                items.append(node.key)
+                collect(node.right)
+        collect(self.player.inventory.root)
+        
+        if not items:
+            draw_text(self.screen, "- Vazio", x, y, color=(150,150,150))
+            y += 20
+        else:
+            for item in items:
+                col = (255, 215, 0) if item == "Chave" else TEXT_COLOR
+                draw_text(self.screen, f"- {item}", x, y, color=col)
+                y += 20
+        
+        # Menu de Controles
+        y = SCREEN_H - 240
+        draw_text(self.screen, "CONTROLES", x, y, FONT, (200, 200, 100))
+        y += 25
+        controls = [
+            "WSAD / Setas : Mover",
+            "B : Dica (BFS)",
+           # "V : Varredura (DFS)",
+            "H : Rota Ótima (Coletar Tudo)",
+            "F5 : Salvar",
+            "F9 : Carregar",
+            "+ / - : Zoom",
+            "F3 : Profiler"
+        ]
+        for c in controls:
+            draw_text(self.screen, c, x, y, FONT_SMALL, (180, 180, 180))
+            y += 18
+
+        # Mensagens
+        y = SCREEN_H - 80
+        if self.message_timer > 0:
+            draw_text(self.screen, f"> {self.message}", x, y, color=(255, 100, 100))
+        if self.routes.pending("dica"):
+            draw_text(self.screen, "calculando...", x, y + 25, FONT_SMALL, (200, 200, 100))
+
+    def machine_route_args(self, from_current_state=False):
+        """(início, baús, saída) da rota da máquina, copiados no momento do pedido."""
+        if from_current_state:
+            start = self.player.position
+            baus_para_pegar = list(self.world.chest_rooms) 
+        else:
+            start = self.world.start_node 
+            baus_para_pegar = list(self.world.all_chests_backup) 
+        return start, baus_para_pegar, self.world.exit_node
+
+    def large_map_search(self):
+        """
+        (método, busca) para mapas enormes, ou None. Busca em blocos (HPA)
+        a partir de HPA_MIN_CELLS: latência quase constante. Com grafo sob
+        demanda (.lmap gigante) montar os blocos leria o mapa todo: fica o
+        A*, que só toca as casas perto do caminho.
+        """
+        if self.world.lazy_graph:
+            return "astar", self.graph.astar
+        if self.world.width * self.world.height >= HPA_MIN_CELLS:
+            return "hpa", self.world.hierarchical_path
+        return None
+
+    def collection_search(self):
+        """(method, path_fn) de get_collection_path: a mesma escolha da dica B."""
+        grande = self.large_map_search()
+        return grande if grande is not None else (None, None)
+
+    def route_cost(self, rota):
+        """Passos da rota da máquina no mesmo critério de player.step_count."""
+        if not rota:
+            return 0
+        # Rota de N casas = N - 1 passos (a casa de partida não conta)
+        return self.graph.path_cost(rota) if self.graph.weighted else len(rota) - 1
+
+    # --- Rotas em segundo plano ---
+    def request_hint(self, messages, func, *args):
+        """Pede uma dica à thread de rotas; o quadro segue sem esperar."""
+        self._hint_messages = messages
+        self.routes.submit("dica", func, *args)
+        self.set_message("Calculando rota...")
+
+    def collect_routes(self):
+        """Aplica as rotas que ficaram prontas desde o último quadro."""
+        for kind, path, error in self.routes.poll():
+            if kind == "dica":
+                ok_msg, fail_msg = self._hint_messages
+                if path and error is None:
+                    self.highlight_path = path
+                    self._full_redraw = True
+                    self.set_message(ok_msg)
+                else:
+                    self.set_message(fail_msg)
+            elif kind == "vitoria":
+                self.machine_path_cache = path or []
+
+    def draw_comparison_screen(self):
+        """Desenha a tela dividida com dois mini-mapas."""
+        self.screen.fill((10, 10, 15)) 
+        
+        # Título
+        draw_text(self.screen, "ANÁLISE DE DESEMPENHO", SCREEN_W//2 - 100, 30, FONT_TITLE, (255, 255, 255))
+        
+        # Célula do mini-mapa: 20px no mapa 15×15, menor em mapas grandes
+        mini_cell = MINI_BOX / max(self.world.width, self.world.height)
+        if mini_cell >= 1:
+            mini_cell = int(mini_cell)
+        box = math.ceil(max(self.world.width, self.world.height) * mini_cell)
+        margin_x = 50
+        start_y = 100
+        
+        # --- LADO ESQUERDO: JOGADOR ---
+        draw_text(self.screen, "SUA ROTA", margin_x, start_y - 30, FONT, (0, 190, 255))
+        # Decodificado uma única vez (cache dentro do MoveHistory)
+        player_path_list = self.player.history.coords()
+        
+        self.draw_mini_map(margin_x, start_y, mini_cell, player_path_list, (0, 190, 255), is_list=True)
+        # -----------------
+        
+        # Estatísticas Jogador
+        stats_y = start_y + box + 20
+        draw_text(self.screen, f"Passos: {self.player.step_count}", margin_x, stats_y, FONT_SMALL)
+        
+        
+        # --- LADO DIREITO: MÁQUINA ---
+        machine_x = margin_x + box + 100
+        draw_text(self.screen, "ROTA OTIMIZADA (IA)", machine_x, start_y - 30, FONT, (255, 215, 0))
+        
+        machine_path_list = self.machine_path_cache
+        self.draw_mini_map(machine_x, start_y, mini_cell, machine_path_list, (255, 215, 0), is_list=True)
+        
+        # Estatísticas Máquina
+        passos_ia = self.route_cost(machine_path_list)
+        if self.routes.pending("vitoria"):
+            draw_text(self.screen, "Passos Ideais: calculando...", machine_x, stats_y, FONT_SMALL, (255, 215, 0))
+            passos_ia = self.player.step_count  # diferença ainda desconhecida
+        else:
+            draw_text(self.screen, f"Passos Ideais: {passos_ia}", machine_x, stats_y, FONT_SMALL, (255, 215, 0))
+        
+        # Diferença
+        diff = self.player.step_count - passos_ia
+        color_diff = (100, 255, 100) if diff <= 5 else (255, 100, 100)
+        draw_text(self.screen, f"Diferença: {diff} passos", SCREEN_W//2 - 60, stats_y + 40, FONT, color_diff)
+        
+        # Rodapé
+        draw_text(self.screen, "Pressione 'C' para voltar | ESC para sair", SCREEN_W//2 - 120, SCREEN_H - 40, FONT_SMALL, (150, 150, 150))
+
+    def draw_mini_map(self, offset_x, offset_y, cell_size, path_data, base_color, is_list=False):
+        """Mini-mapa com lógica de Cores por Camada ."""
+        
+        # Grid + caminho pré-renderizados uma vez por caminho
+        if is_list: 
+            key = (offset_x, offset_y, cell_size)
+            cached = self._mini_map_cache.get(key)
+            if cached is None or cached[0] is not path_data or cached[1] is not self.world:
+                surf = self.build_mini_map(cell_size, path_data, base_color)
+                cached = self._mini_map_cache[key] = (path_data, self.world, surf)
+            self.screen.blit(cached[2], (offset_x, offset_y))
+            return
+
+        # Sem setas: casas do caminho pintadas por cima do grid
+        self.screen.blit(self.build_mini_map(cell_size, [], base_color), (offset_x, offset_y))
+        for (tile_x, tile_y) in path_data:
+            rect = (offset_x + tile_x*cell_size, offset_y + tile_y*cell_size, cell_size, cell_size)
+            pygame.draw.rect(self.screen, base_color, rect)
+            pygame.draw.rect(self.screen, (255, 255, 255), rect, 1)
+
+    def build_mini_map(self, cell_size, path_data, base_color):
+        """Desenha grid e caminho do mini-mapa em uma Surface própria."""
+        w, h = self.world.width, self.world.height
+        surf = pygame.Surface((math.ceil(w * cell_size), math.ceil(h * cell_size)))
+
+        # 1. Desenha o Grid 
+        if cell_size >= 4:
+            for y in range(h):
+                for x in range(w):
+                    rect = (x*cell_size, y*cell_size, cell_size, cell_size)
+                    char = self.world.map_grid.get(x, y)
+                    
+                    if char == "#": color = (30, 30, 40)
+                    elif char == "E": color = (80, 40, 40)
+                    elif char == "P": color = (40, 40, 80)
+                    else: color = (15, 15, 20)
+                    
+                    pygame.draw.rect(surf, color, rect)
+                    pygame.draw.rect(surf, (25, 25, 30), rect, 1)
+        else:
+            # Mapa grande: textura 1px/casa reduzida
+            surf.blit(pygame.transform.smoothscale(self.overview("mini"), surf.get_size()), (0, 0))
+
+        # 2. Desenha o Caminho
+        coords = path_coords(path_data, self.world)
+        if len(coords) > 1:
+            if cell_size >= 6:
+                for color, points in path_arrows(coords, cell_size, 0, 0,
+                                                 cell_size // 2 - 2, 3, 3):
+                    pygame.draw.polygon(surf, color, points)
+            else:
+                # Células pequenas demais para setas: linha contínua
+                half = cell_size / 2
+                pts = [(x*cell_size + half, y*cell_size + half) for x, y in coords]
+                pygame.draw.lines(surf, base_color, False, pts)
+
+            # Ponto Final 
+            last = coords[-1]
+            pygame.draw.circle(surf, (255, 50, 50),
+                               (int(last[0]*cell_size + cell_size//2),
+                                int(last[1]*cell_size + cell_size//2)), 3)
+        return surf
+
+    def draw_victory_screen(self):
+
+
+        self.victory_timer += 1
+        
+        # 1. Fundo Escurecido
+        overlay = pygame.Surface((SCREEN_W, SCREEN_H), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 220)) 
+        self.screen.blit(overlay, (0,0))
+        
+        center_x = SCREEN_W // 2
+        
+        # 2. Título
+        cols = [(255,215,0), (255,100,100), (100,255,100)]
+        c = cols[(self.victory_timer // 10) % 3]
+        
+        txt = TEXT_CACHE.render(FONT_VICTORY, "VITÓRIA!", c)
+        self.screen.blit(txt, txt.get_rect(center=(center_x, SCREEN_H//2 - 110)))
+        
+        sub = TEXT_CACHE.render(FONT, "Você escapou do labirinto!", (255, 255, 255))
+        self.screen.blit(sub, sub.get_rect(center=(center_x, SCREEN_H//2 - 60)))
+
+        # 3. Estatísticas do Jogador (Contagem de Itens)
+        player_items_count = 0
+        def count_inv(node):
+            nonlocal player_items_count
+            if node:
+                player_items_count += 1
+                count_inv(node.left)
+                count_inv(node.right)
+        count_inv(self.player.inventory.root)
+        
+        # Total de baús possíveis (Máquina sempre pega tudo)
+        total_items_possible = len(self.world.all_chests_backup)
+        
+        # 4. Cálculos da Máquina
+        # (calculada em segundo plano ao vencer; até lá mostra "calculando...")
+        calculando = self.routes.pending("vitoria")
+        rota_maquina = self.machine_path_cache
+        passos_maquina = self.route_cost(rota_maquina)
+        
+        # 5. Avaliação Inteligente
+        if calculando:
+            avaliacao = "calculando..."
+            cor_av = (200, 200, 100)
+        elif player_items_count < total_items_possible:
+            avaliacao = "Exploração Incompleta!"
+            cor_av = (255, 165, 0) # Laranja
+        else:
+            # Se pegou tudo, compara os passos
+            diff = self.player.step_count - passos_maquina
+            if diff <= 5:
+                avaliacao = "PERFEITO! (100% + Rota Ótima)"
+                cor_av = (100, 255, 100)
+            elif diff < 20:
+                avaliacao = "Muito bom! (100% Coletado)"
+                cor_av = (255, 255, 100)
+            else:
+                avaliacao = "Eficiência Baixa..."
+                cor_av = (255, 100, 100)
+
+        # 6. Renderização das Estatísticas
+        stats_y = SCREEN_H // 2 
+        
+        # --- BLOCO 1: JOGADOR ---
+        draw_text(self.screen, "--- SEU DESEMPENHO ---", center_x - 90, stats_y, FONT_SMALL, (0, 200, 255))
+        draw_text(self.screen, f"Passos: {self.player.step_count}", center_x - 80, stats_y + 20, FONT, (200, 255, 255))
+        
+        # Cor condicional para itens do jogador
+        col_item = (100, 255, 100) if player_items_count == total_items_possible else (255, 100, 100)
+        draw_text(self.screen, f"Itens: {player_items_count} / {total_items_possible}", center_x - 80, stats_y + 45, FONT, col_item)
+        
+        # --- BLOCO 2: MÁQUINA (IA) ---
+        stats_y += 85
+        draw_text(self.screen, "--- DESEMPENHO IDEAL (IA) ---", center_x - 90, stats_y, FONT_SMALL, (255, 215, 0))
+        passos_txt = "calculando..." if calculando else passos_maquina
+        draw_text(self.screen, f"Passos: {passos_txt}", center_x - 80, stats_y + 20, FONT, (255, 255, 200))
+        draw_text(self.screen, f"Itens: {total_items_possible} / {total_items_possible} (100%)", center_x - 80, stats_y + 45, FONT, (255, 215, 0))
+        
+        # --- BLOCO 3: CONCLUSÃO ---
+        stats_y += 80
+        draw_text(self.screen, f"Resultado: {avaliacao}", center_x - 80, stats_y, FONT, cor_av)
+        
+        # 7. Rodapé (Teclas)
+        info2 = TEXT_CACHE.render(FONT_SMALL, "[ TECLA 'C' ] COMPARAR ROTAS VISUALMENTE", (0, 255, 255))
+        self.screen.blit(info2, info2.get_rect(center=(center_x, SCREEN_H - 70)))
+        
+        info = TEXT_CACHE.render(FONT_SMALL, "Pressione ESC para sair", (150, 150, 150))
+        self.screen.blit(info, info.get_rect(center=(center_x, SCREEN_H - 40)))
+
+        # 8. Efeito de Confete
+        import random
+        random.seed(self.victory_timer // 5)
+        for _ in range(25): 
+            sx = random.randint(0, SCREEN_W)
+            sy = random.randint(0, SCREEN_H)
+            pygame.draw.circle(self.screen, (255, 255, 200), (sx, sy), 2)
+   
+    def step(self, events):
+        """Processa os eventos de um quadro e desenha. Retorna False para sair."""
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT: running = False
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                self.handle_click(event.pos[0], event.pos[1])
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE: running = False
+                else: self.handle_keys(event)
+        
+        self.collect_routes()
+        self.draw()
+        return running
+
+    def run(self, replay=None, max_frames=None):
+        """
+        Loop principal. Com 'replay' (InputReplay) os eventos vêm do roteiro
+        em vez do teclado; 'max_frames' limita a execução (testes/benchmark).
+        """
+        running = True
+        frame = 0
+        while running:
+            if replay is not None:
+                events = replay.events_for(frame)
+                if replay.finished(frame):
+                    running = False
+            else:
+                events = pygame.event.get()
+            running = self.step(events) and running
+
+            frame += 1
+            if max_frames is not None and frame >= max_frames:
+                break
+            if not self.headless:
+                self.clock.tick(FPS)
+
+        if replay is None and max_frames is None:
+            pygame.quit()
+            sys.exit()
+        return frame
+
+# -------------------------------------------------------------------
+# Mundo aberto (open_world.ChunkedWorld)
+# -------------------------------------------------------------------
+class OpenWorldGame:
+    """
+    Modo mundo aberto: mapa sem borda em blocos gerados quando o jogador
+    ou a câmera chegam perto (ChunkedWorld.visit / visit_area). A vista é
+    desenhada direto das casas visíveis e refeita só quando muda; neblina,
+    mini-mapas e comparação de rotas ficam de fora (varrem o mapa inteiro).
+    """
+
+    ZOOM_LEVELS = (40, 20, 10)
+
+    def __init__(self, world=None, headless=False, seed=0):
+        self.headless = headless
+        if headless:
+            pygame.font.init()
+            self.screen = pygame.Surface((SCREEN_W, SCREEN_H))
+        else:
+            pygame.init()
+            self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H))
+            pygame.display.set_caption("Explorador de Território 2D - Mundo Aberto")
+        self.clock = pygame.time.Clock()
+
+        self.world = world if world is not None else ChunkedWorld(seed, terrain=True)
+        self.graph = self.world.graph
+        self.player = Player("Explorador", self.world.start_node, self.world.coord_of,
+                             False, step_cost=self.graph.edge_weight)
+        self.world.visit(*self.player.position)
+
+        self.zoom_index = 0
+        self.highlight_path = []
+        self.message = "Ache a CHAVE e depois o PORTÃO!"
+        self.message_timer = 180
+        self.event_log = []
+        self.game_over = False
+        self._view_key = None       # (origem, zoom, baús abertos, dica) da vista desenhada
+        self._view = pygame.Surface((VIEW_W, VIEW_H))
+
+    # mesmo loop do Game (replay / max_frames)
+    run = Game.run
+    set_message = Game.set_message
+
+    # --- Câmera ---
+    @property
+    def cell(self):
+        return self.ZOOM_LEVELS[self.zoom_index]
+
+    def view_area(self):
+        """Casas visíveis [x0, x1) × [y0, y1), com o jogador no centro."""
+        cell = self.cell
+        w, h = -(-VIEW_W // cell), -(-VIEW_H // cell)
+        px, py = self.player.position
+        x0, y0 = px - w // 2, py - h // 2
+        return x0, y0, x0 + w, y0 + h
+
+    # --- Movimento ---
+    def try_move_player(self, target):
+        current = self.player.position
+        if target in self.graph.get_neighbors(current):
+            self.player.move(target)
+            self.world.visit(*target)  # gera os blocos em volta antes de chegar neles
+            self.highlight_path = []
+            venceu, msg = self.world.check_event(self.player)
+            if msg:
+                self.set_message(msg)
+            if venceu:
+                self.game_over = True
+                self.set_message("VITÓRIA!")
+        else:
+            self.set_message("Parede ou caminho bloqueado!")
+
+    def request_hint(self):
+        """B: caminho (A*) até o baú da Chave ou, com ela, até o Portão."""
+        if self.player.has_item("Chave"):
+            alvo, nome = self.world.exit_node, "Portão"
+        else:
+            bau = self.world.chest_in(*self.world.key_chunk)
+            alvo, nome = bau[0], "Chave"
+        self.highlight_path = self.graph.shortest_path(self.player.position, alvo, "astar")
+        if self.highlight_path:
+            self.set_message(f"Dica: caminho até {nome} ({len(self.highlight_path) - 1} casas)")
+        else:
+            self.set_message("Sem caminho possível.")
+
+    # --- Input ---
+    def handle_keys(self, event):
+        if self.game_over:
+            return
+        dx, dy = 0, 0
+        if event.key in [pygame.K_UP, pygame.K_w]: dy = -1
+        elif event.key in [pygame.K_DOWN, pygame.K_s]: dy = 1
+        elif event.key in [pygame.K_LEFT, pygame.K_a]: dx = -1
+        elif event.key in [pygame.K_RIGHT, pygame.K_d]: dx = 1
+
+        if dx != 0 or dy != 0:
+            x, y = self.player.position
+            self.try_move_player((x + dx, y + dy))
+        elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+            self.zoom_index = max(0, self.zoom_index - 1)
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom_index = min(len(self.ZOOM_LEVELS) - 1, self.zoom_index + 1)
+        elif event.key == pygame.K_b:
+            self.request_hint()
+        elif event.key in (pygame.K_F5, pygame.K_F9):
+            self.set_message("Salvar/carregar não disponível no mundo aberto.")
+
+    def step(self, events):
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT: running = False
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE: running = False
+                else: self.handle_keys(event)
+        self.draw()
+        return running
+
+    # --- Renderização ---
+    def draw(self):
+        area = self.view_area()
+        self.world.visit_area(*area)  # blocos que a câmera mostra
+        key = (area, self.cell, len(self.world.opened), len(self.highlight_path))
+        if key != self._view_key:
+            self._view_key = key
+            self.draw_view(area)
+        self.screen.blit(self._view, (0, 0))
+        self.draw_player(area)
+        self.draw_sidebar()
+        if self.game_over:
+            txt = TEXT_CACHE.render(FONT_VICTORY, "VITÓRIA!", (255, 215, 0))
+            self.screen.blit(txt, txt.get_rect(center=(VIEW_W // 2, VIEW_H // 2)))
+        if self.message_timer > 0:
+            self.message_timer -= 1
+        if not self.headless:
+            pygame.display.flip()
+
+    def draw_view(self, area):
+        x0, y0, x1, y1 = area
+        cell = self.cell
+        view = self._view
+        view.fill(GROUND_COLOR)
+        cell_of = self.world.cell
+        for y in range(y0, y1):
+            sy = (y - y0) * cell
+            for x in range(x0, x1):
+                cor = TILE_COLORS.get(cell_of(x, y))
+                if cor:
+                    view.fill(cor, ((x - x0) * cell, sy, cell, cell))
+
+        if self.highlight_path:
+            marca = pygame.Surface((cell, cell), pygame.SRCALPHA)
+            marca.fill(PATH_HIGHLIGHT)
+            for x, y in self.highlight_path:
+                if x0 <= x < x1 and y0 <= y < y1:
+                    view.blit(marca, ((x - x0) * cell, (y - y0) * cell))
+
+        # Salas visíveis: baús fechados dos blocos na tela e o Portão
+        c = self.world.chunk_size
+        salas = []
+        for cy in range(y0 // c, (y1 - 1) // c + 1):
+            for cx in range(x0 // c, (x1 - 1) // c + 1):
+                bau = self.world.chest_in(cx, cy)
+                if bau and bau[0] not in self.world.opened:
+                    salas.append((bau[0], CHEST_CLOSED))
+        aberto = EXIT_OPEN if self.player.has_item("Chave") else EXIT_LOCKED
+        salas.append((self.world.exit_node, aberto))
+        for (x, y), cor in salas:
+            if x0 <= x < x1 and y0 <= y < y1:
+                pygame.draw.rect(view, cor, ((x - x0) * cell + 2, (y - y0) * cell + 2, cell - 4, cell - 4))
+
+    def draw_player(self, area):
+        x0, y0 = area[0], area[1]
+        px, py = self.player.position
+        cell = self.cell
+        rect = ((px - x0) * cell, (py - y0) * cell, cell, cell)
+        pygame.draw.rect(self.screen, PLAYER_COLOR, rect)
+        if cell >= NEAR_ZOOM:
+            pygame.draw.rect(self.screen, (255, 255, 255), rect, 2)
+
+    def draw_sidebar(self):
+        rect = (VIEW_W, 0, SIDEBAR_W, SCREEN_H)
+        pygame.draw.rect(self.screen, SIDEBAR_BG, rect)
+        pygame.draw.line(self.screen, SIDEBAR_BORDER, (VIEW_W, 0), (VIEW_W, SCREEN_H), 2)
+
+        x = VIEW_W + 20
+        y = 20
+        draw_text(self.screen, "MUNDO ABERTO", x, y, FONT_TITLE)
+        y += 30
+        draw_text(self.screen, f"Local: {self.world.node_name(self.player.position)}", x, y, FONT_SMALL)
+        y += 20
+        draw_text(self.screen, f"Passos: {self.player.step_count}", x, y, FONT, (255, 255, 0))
+        y += 25
+        cx, cy = self.world.chunk_of(*self.player.position)
+        draw_text(self.screen, f"Bloco: ({cx}, {cy})", x, y, FONT_SMALL)
+        y += 18
+        draw_text(self.screen, f"Blocos em memória: {len(self.world.loaded_chunks())} "
+                               f"(gerados {self.world.generated})", x, y, FONT_SMALL)
+        y += 30
+
+        draw_text(self.screen, "INVENTÁRIO (AVL)", x, y, FONT, (100, 200, 255))
+        y += 20
+        items = []
+        def collect(node):
+            if node:
+                collect(node.left)
+                items.append(node.key)
+                collect(node.right)
+        collect(self.player.inventory.root)
+        if not items:
+            draw_text(self.screen, "- Vazio", x, y, color=(150, 150, 150))
+        for item in items[:12]:
+            col = (255, 215, 0) if item == "Chave" else TEXT_COLOR
+            draw_text(self.screen, f"- {item}", x, y, color=col)
+            y += 20
+
+        y = SCREEN_H - 170
+        draw_text(self.screen, "CONTROLES", x, y, FONT, (200, 200, 100))
+        y += 25
+        for c in ("WSAD / Setas : Mover", "B : Dica (A*)", "+ / - : Zoom", "ESC : Sair"):
+            draw_text(self.screen, c, x, y, FONT_SMALL, (180, 180, 180))
+            y += 18
+
+        if self.message_timer > 0:
+            draw_text(self.screen, f"> {self.message}", x, SCREEN_H - 60, color=(255, 100, 100))
+
+
+if __name__ == "__main__":
+    # python Interface.py [mapa.txt | mapa.lmap] -> joga uma fase pronta
+    # python Interface.py --aberto [semente]    -> mundo aberto (sem borda)
+    if len(sys.argv) > 1 and sys.argv[1] == "--aberto":
+        OpenWorldGame(seed=int(sys.argv[2]) if len(sys.argv) > 2 else 0).run()
+    elif len(sys.argv) > 1:
+        Game(world=World.from_file(sys.argv[1], verbose=False)).run()
+    else:
+        Game().run()
@@ -0,0 +1,540 @@
+# ===========================================
+# benchmark.py — Medições de desempenho
+# ===========================================
+# Uso:
+#   python benchmark.py render [tamanhos...]   -> tempos de quadro (headless)
+#   python benchmark.py startup [repetições]   -> início do processo até o 1º quadro
+#   python benchmark.py paths [tamanhos...]    -> BFS x A* x BFS bidirecional
+#   python benchmark.py edits [tamanhos...]    -> montagem e edição do grafo
+#   python benchmark.py dijkstra [lado]        -> Dijkstra / A* com pesos (lado² nós)
+#   python benchmark.py hpa [tamanhos...]      -> busca hierárquica x A* no World
+#   python benchmark.py jps [tamanhos...]      -> Jump Point Search x BFS (poucas paredes)
+#   python benchmark.py openworld [blocos]     -> caminhada longa no mundo aberto (memória)
+#   python benchmark.py grid [tamanhos...]     -> memória do map_grid (listas x Grid) e geração
+#   python benchmark.py cache [tamanhos...]    -> abrir fase: montar grafo x cache em disco
+#
+# Os benchmarks de renderização usam o driver de vídeo "dummy" do SDL e
+# Game(headless=True), então rodam em máquinas de CI sem display.
+# ===========================================
+
+import os
+import random
+import subprocess
+import sys
+import time
+from statistics import mean
+
+
+# ===============================
+# Auxiliares
+# ===============================
+def percentile(values, p):
+    """Percentil p (0-100) pelo método do posto mais próximo."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[k]
+
+
+def report(title, samples):
+    """Imprime p50/p95/p99 (ms) de cada série de tempos (segundos)."""
+    print(title)
+    for name, values in samples.items():
+        if not values:
+            continue
+        print(f"  {name:<24} n={len(values):<5} "
+              f"p50={percentile(values, 50) * 1000:7.3f} ms  "
+              f"p95={percentile(values, 95) * 1000:7.3f} ms  "
+              f"p99={percentile(values, 99) * 1000:7.3f} ms")
+
+
+def _timed(func, bucket):
+    def wrapper(*args, **kwargs):
+        t0 = time.perf_counter()
+        result = func(*args, **kwargs)
+        bucket.append(time.perf_counter() - t0)
+        return result
+    return wrapper
+
+
+# ===============================
+# Renderização (Interface.Game)
+# ===============================
+RENDER_METHODS = ("draw", "draw_sidebar", "draw_victory_screen", "draw_comparison_screen")
+
+
+def bench_render(size, seed=1, end_frames=120):
+    """
+    Joga uma partida roteirizada (dica H, zoom, rota completa, tela de vitória
+    e de comparação) em modo headless e devolve os tempos por método.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from Interface import Game
+    from replay import InputReplay
+    from world import World
+
+    world = World(seed=seed, verbose=False, width=size, height=size)
+    game = Game(world=world, headless=True)
+
+    samples = {name: [] for name in RENDER_METHODS}
+    for name in RENDER_METHODS:
+        # Atributo de instância tem prioridade: chamadas internas também são medidas
+        setattr(game, name, _timed(getattr(game, name), samples[name]))
+
+    rota = world.graph.get_collection_path(world.start_node, list(world.chest_rooms), world.exit_node)
+    replay = (InputReplay.from_script("h espera:30 - espera:10 + espera:10")
+              .route(rota, world)
+              .wait(end_frames).key("c").wait(end_frames))
+
+    game.run(replay=replay)
+    return samples
+
+
+def main_render(sizes):
+    for size in sizes:
+        samples = bench_render(size)
+        report(f"[RENDER] mapa {size}x{size}", samples)
+
+
+# ===============================
+# Inicialização (processo novo até o 1º quadro)
+# ===============================
+# Roda num processo filho para medir também o import de pygame/Interface.
+# O filho imprime os instantes (perf_counter) de cada etapa; o zero é o
+# instante anterior ao subprocess.Popen no processo pai.
+STARTUP_SCRIPT = """
+import os, sys, time
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+marks = [("python", time.perf_counter())]
+import Interface
+marks.append(("import Interface", time.perf_counter()))
+game = Interface.Game()
+marks.append(("Game()", time.perf_counter()))
+game.run(max_frames=1)
+marks.append(("1o quadro", time.perf_counter()))
+for name, t in marks:
+    print(f"{name}\t{t!r}")
+"""
+
+STARTUP_STAGES = ("python", "import Interface", "Game()", "1o quadro")
+
+
+def bench_startup(runs=5):
+    """Tempo acumulado (segundos) desde o início do processo até cada etapa."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    samples = {name: [] for name in STARTUP_STAGES}
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=here,
+                             capture_output=True, text=True, check=True).stdout
+        # perf_counter usa o mesmo relógio monotônico nos dois processos (Linux)
+        for line in out.splitlines():
+            name, _, t = line.partition("\t")
+            if name in samples:
+                samples[name].append(float(t) - t0)
+    return samples
+
+
+def main_startup(runs):
+    report(f"[STARTUP] {runs} execuções (acumulado desde o início do processo)",
+           bench_startup(runs))
+
+
+# ===============================
+# Buscas de caminho (pathfinding.py)
+# ===============================
+def open_grid(size, rng, wall_chance=0.1):
+    """Mapa aberto: poucas paredes soltas."""
+    return [["#" if rng.random() < wall_chance else "." for _ in range(size)]
+            for _ in range(size)]
+
+
+def maze_grid(size, rng):
+    """Labirinto perfeito (DFS iterativa nas casas ímpares): corredores de 1 casa."""
+    grid = [["#"] * size for _ in range(size)]
+    grid[1][1] = "."
+    pilha = [(1, 1)]
+    while pilha:
+        x, y = pilha[-1]
+        opcoes = [(x + dx, y + dy, dx, dy) for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                  if 0 < x + dx < size - 1 and 0 < y + dy < size - 1 and grid[y + dy][x + dx] == "#"]
+        if not opcoes:
+            pilha.pop()
+            continue
+        nx, ny, dx, dy = rng.choice(opcoes)
+        grid[y + dy // 2][x + dx // 2] = "."
+        grid[ny][nx] = "."
+        pilha.append((nx, ny))
+    return grid
+
+
+def grid_graph(grid):
+    """Graph com nós (x, y) e 4 vizinhos por casa livre."""
+    from graph import Graph
+
+    graph = Graph(verbose=False)
+    graph.locate = lambda node: node
+    h, w = len(grid), len(grid[0])
+    livres = [(x, y) for y in range(h) for x in range(w) if grid[y][x] != "#"]
+    arestas = [((x, y), (nx, ny)) for x, y in livres
+               for nx, ny in ((x + 1, y), (x, y + 1))
+               if nx < w and ny < h and grid[ny][nx] != "#"]
+    graph.add_edges_bulk(arestas, vertices=livres)
+    return graph
+
+
+def bench_paths(size, queries=200, seed=1):
+    """Tempo por consulta e nós expandidos de cada busca, em mapa aberto e em labirinto."""
+    from pathfinding import SEARCHES, manhattan
+
+    rng = random.Random(seed)
+    resultados = {}
+    for kind, grid in (("aberto", open_grid(size, rng)), ("labirinto", maze_grid(size, rng))):
+        graph = grid_graph(grid)
+        # Pares dentro da maior região conectada (toda consulta tem resposta)
+        origem = max(graph.adj, key=lambda n: len(graph.adj[n]))
+        regiao, fila = {origem}, [origem]
+        while fila:
+            for viz in graph.adj[fila.pop()]:
+                if viz not in regiao:
+                    regiao.add(viz)
+                    fila.append(viz)
+        regiao = sorted(regiao)
+        pares = [(rng.choice(regiao), rng.choice(regiao)) for _ in range(queries)]
+
+        tempos, expandidos = {}, {}
+        for nome, busca in SEARCHES.items():
+            tempos[nome], expandidos[nome] = [], []
+            for a, b in pares:
+                t0 = time.perf_counter()
+                caminho, n = busca(a, b, graph.adj.__getitem__, manhattan(graph.locate, b))
+                tempos[nome].append(time.perf_counter() - t0)
+                expandidos[nome].append(n)
+        resultados[kind] = (tempos, expandidos)
+    return resultados
+
+
+def bench_jps(size, queries=200, seed=1, densities=(0.05, 0.1, 0.2)):
+    """BFS x A* x JPS em mapas abertos com pouca parede (onde a simetria pesa)."""
+    from pathfinding import astar_path, bfs_path, jump_point_path, manhattan
+
+    rng = random.Random(seed)
+    resultados = {}
+    for densidade in densities:
+        grid = open_grid(size, rng, densidade)
+        graph = grid_graph(grid)
+
+        def walkable(x, y):
+            return 0 <= x < size and 0 <= y < size and grid[y][x] != "#"
+
+        livres = list(graph.adj)
+        tempos = {"bfs": [], "astar": [], "jps": []}
+        expandidos = {nome: [] for nome in tempos}
+        for _ in range(queries):
+            a, b = rng.choice(livres), rng.choice(livres)
+            for nome in tempos:
+                t0 = time.perf_counter()
+                if nome == "jps":
+                    caminho, n = jump_point_path(a, b, walkable)
+                elif nome == "astar":
+                    caminho, n = astar_path(a, b, graph.adj.__getitem__, manhattan(graph.locate, b))
+                else:
+                    caminho, n = bfs_path(a, b, graph.adj.__getitem__)
+                tempos[nome].append(time.perf_counter() - t0)
+                expandidos[nome].append(n)
+                if nome == "bfs":
+                    esperado = len(caminho)
+                elif len(caminho) != esperado:
+                    raise AssertionError(f"{nome}: caminho {len(caminho)} != BFS {esperado} ({a} -> {b})")
+        resultados[densidade] = (tempos, expandidos)
+    return resultados
+
+
+def main_jps(sizes):
+    for size in sizes:
+        for densidade, (tempos, expandidos) in bench_jps(size).items():
+            report(f"[JPS] mapa {size}x{size}, {densidade:.0%} paredes (tempo por consulta)", tempos)
+            for nome, valores in expandidos.items():
+                print(f"  {nome:<24} expandidos: média {mean(valores):9.1f}  máx {max(valores)}")
+
+
+def main_paths(sizes):
+    for size in sizes:
+        for kind, (tempos, expandidos) in bench_paths(size).items():
+            report(f"[PATHS] mapa {kind} {size}x{size} (tempo por consulta)", tempos)
+            for nome, valores in expandidos.items():
+                print(f"  {nome:<24} expandidos: média {mean(valores):9.1f}  máx {max(valores)}")
+
+
+# ===============================
+# Edição do grafo (portas, corredores que desabam, paredes destrutíveis)
+# ===============================
+def bench_edits(size, ops=2000, seed=1):
+    """Montagem (aresta a aresta x em lote) e vazão de edições num grid aberto."""
+    from graph import Graph
+
+    rng = random.Random(seed)
+    livres = [(x, y) for y in range(size) for x in range(size)]
+    arestas = [((x, y), (x + dx, y + dy)) for x, y in livres
+               for dx, dy in ((1, 0), (0, 1)) if x + dx < size and y + dy < size]
+    tempos = {}
+
+    t0 = time.perf_counter()
+    g = Graph(verbose=False)
+    for a, b in arestas:
+        g.add_edge(a, b)
+    tempos["montagem add_edge"] = [time.perf_counter() - t0]
+
+    g = None  # libera o grafo anterior antes de medir
+    t0 = time.perf_counter()
+    g = Graph(verbose=False)
+    g.add_edges_bulk(arestas, vertices=livres)
+    tempos["montagem em lote"] = [time.perf_counter() - t0]
+
+    # Porta: fecha e reabre uma aresta
+    tempos["porta (remove+add aresta)"] = amostras = []
+    for a, b in (rng.choice(arestas) for _ in range(ops)):
+        t0 = time.perf_counter()
+        g.remove_edge(a, b)
+        g.add_edge(a, b)
+        amostras.append(time.perf_counter() - t0)
+
+    # Parede destrutível: some a casa e volta com os mesmos vizinhos
+    tempos["casa (remove+add vértice)"] = amostras = []
+    for v in (rng.choice(livres) for _ in range(ops)):
+        t0 = time.perf_counter()
+        vizinhos = list(g.adj[v])
+        g.remove_vertex(v)
+        g.add_edges_bulk((v, w) for w in vizinhos)
+        amostras.append(time.perf_counter() - t0)
+    return tempos
+
+
+def main_edits(sizes):
+    for size in sizes:
+        tempos = bench_edits(size)
+        report(f"[EDITS] grid aberto {size}x{size}", tempos)
+        for nome, valores in tempos.items():
+            if len(valores) > 1:
+                print(f"  {nome:<24} {len(valores) / sum(valores):12.0f} edições/s")
+
+
+# ===============================
+# Caminho de menor custo (terreno com pesos)
+# ===============================
+def bench_dijkstra(size=1000, queries=5, seed=1):
+    """Dijkstra x A* ponderado num grid aberto size×size com custos 1-4 por casa."""
+    from graph import Graph
+    from pathfinding import dijkstra_path, manhattan
+
+    rng = random.Random(seed)
+    custo = [[rng.choice((1, 1, 1, 1, 2, 3, 4)) for _ in range(size)] for _ in range(size)]
+    arestas = []
+    for y in range(size):
+        for x in range(size):
+            if x + 1 < size:
+                arestas.append(((x, y), (x + 1, y), max(custo[y][x], custo[y][x + 1])))
+            if y + 1 < size:
+                arestas.append(((x, y), (x, y + 1), max(custo[y][x], custo[y + 1][x])))
+    t0 = time.perf_counter()
+    graph = Graph(verbose=False)
+    graph.add_edges_bulk(arestas)
+    montagem = time.perf_counter() - t0
+    del arestas
+
+    tempos, expandidos = {"dijkstra": [], "astar": []}, {"dijkstra": [], "astar": []}
+    # Consultas de canto a canto (pior caso: atravessam o mapa inteiro)
+    pares = [((0, rng.randrange(size)), (size - 1, rng.randrange(size))) for _ in range(queries)]
+    for a, b in pares:
+        for nome, h in (("dijkstra", None), ("astar", manhattan(lambda n: n, b))):
+            t0 = time.perf_counter()
+            _, n = dijkstra_path(a, b, graph.adj.__getitem__, h)
+            tempos[nome].append(time.perf_counter() - t0)
+            expandidos[nome].append(n)
+    return montagem, len(graph.adj), tempos, expandidos
+
+
+def main_dijkstra(size):
+    montagem, nos, tempos, expandidos = bench_dijkstra(size)
+    report(f"[DIJKSTRA] grid {size}x{size} ({nos} nós, montagem {montagem:.2f} s)", tempos)
+    for nome, valores in expandidos.items():
+        print(f"  {nome:<24} expandidos: média {mean(valores):11.1f}")
+
+
+# ===============================
+# Busca hierárquica (hpa.ClusterMap)
+# ===============================
+def bench_hpa(size, queries=100, edits=50, seed=1):
+    """Consultas HPA x A* num World com terreno, mais reconstrução incremental."""
+    from world import World
+
+    world = World(seed=seed, verbose=False, width=size, height=size, terrain=True)
+    graph = world.graph
+    t0 = time.perf_counter()
+    world.hierarchy()
+    montagem = time.perf_counter() - t0
+
+    rng = random.Random(seed)
+    livres = [(x, y) for y in range(world.height) for x in range(world.width)
+              if world.map_grid[y][x] != "#"]
+    tempos = {"astar": [], "hpa": [], "rebuild_cluster": []}
+    razoes = []
+    for _ in range(queries):
+        a, b = (world.node_at(*rng.choice(livres)) for _ in range(2))
+        t0 = time.perf_counter()
+        otimo = graph.astar(a, b)
+        tempos["astar"].append(time.perf_counter() - t0)
+        t0 = time.perf_counter()
+        caminho = world.hierarchical_path(a, b)
+        tempos["hpa"].append(time.perf_counter() - t0)
+        if otimo and len(otimo) > 1:
+            razoes.append(graph.path_cost(caminho) / graph.path_cost(otimo))
+
+    # Paredes abertas / fechadas em corredores: só o bloco da casa é refeito
+    corredores = [c for c in livres if c not in world._room_at]
+    for _ in range(edits):
+        x, y = rng.choice(corredores)
+        t0 = time.perf_counter()
+        world.set_cell(x, y, rng.choice("#.,"))
+        tempos["rebuild_cluster"].append(time.perf_counter() - t0)
+    return montagem, world.hierarchy().abstract_size(), tempos, razoes
+
+
+def main_hpa(sizes):
+    for size in sizes:
+        montagem, (nos, arestas), tempos, razoes = bench_hpa(size)
+        report(f"[HPA] World {size}x{size} (abstrato: {nos} nós, {arestas} arestas, "
+               f"montagem {montagem:.2f} s)", tempos)
+        if razoes:
+            print(f"  custo HPA / ótimo: média {mean(razoes):.3f}  pior {max(razoes):.3f}")
+
+
+# ===============================
+# Mapa compacto (grid.Grid)
+# ===============================
+def _allocated(factory):
+    """(objeto, bytes alocados para criá-lo) medidos com tracemalloc."""
+    import tracemalloc
+
+    tracemalloc.start()
+    obj = factory()
+    usado = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, usado
+
+
+def bench_grid(size, seed=1):
+    """Bytes do mapa como lista de listas x Grid, e tempo de World(size×size)."""
+    from world import World
+
+    t0 = time.perf_counter()
+    world = World(seed=seed, verbose=False, width=size, height=size)
+    geracao = time.perf_counter() - t0
+    texto = [world.map_grid.row_text(y) for y in range(size)]
+    _, listas = _allocated(lambda: [list(row) for row in texto])
+    _, compacto = _allocated(lambda: world.map_grid.copy())
+    return geracao, listas, compacto
+
+
+def main_grid(sizes):
+    print("[GRID] memória do map_grid (tracemalloc)")
+    for size in sizes:
+        geracao, listas, compacto = bench_grid(size)
+        print(f"  {size:>5}x{size:<5} listas {listas / 1024:9.0f} KB  Grid {compacto / 1024:7.0f} KB  "
+              f"({listas / max(compacto, 1):4.1f}x menor)  World() {geracao:6.2f} s")
+
+
+# ===============================
+# Cache de grafos (graph_cache.py)
+# ===============================
+def bench_cache(size, runs=3, seed=1):
+    """World.from_file sem cache, 1ª abertura (monta e grava) e aberturas seguintes."""
+    import tempfile
+    import graph_cache
+    from map_io import save_map
+    from world import World
+
+    tempos = {"sem cache": [], "1ª (grava)": [], "com cache": []}
+    with tempfile.TemporaryDirectory() as pasta:
+        graph_cache.CACHE_DIR = os.path.join(pasta, "cache")
+        caminho = os.path.join(pasta, "fase.txt")
+        save_map(World(seed=seed, verbose=False, width=size, height=size).map_grid, caminho)
+        for nome, cache in (("sem cache", False), ("1ª (grava)", True), ("com cache", True)):
+            for _ in range(runs if nome != "1ª (grava)" else 1):
+                t0 = time.perf_counter()
+                World.from_file(caminho, seed=seed, verbose=False, cache=cache).room_distances()
+                tempos[nome].append(time.perf_counter() - t0)
+    return tempos
+
+
+def main_cache(sizes):
+    for size in sizes:
+        report(f"[CACHE] fase {size}x{size}: World.from_file + room_distances()", bench_cache(size))
+
+
+# ===============================
+# Mundo aberto (open_world.ChunkedWorld)
+# ===============================
+def bench_openworld(chunks=100, seed=1):
+    """Anda 'chunks' blocos em linha reta pelas estradas e mede memória e tempo."""
+    import tracemalloc
+    from open_world import ChunkedWorld
+
+    world = ChunkedWorld(seed=seed)
+    meio = world.chunk_size // 2
+    tempos = {"trecho (1 bloco)": []}
+    memoria = []
+    tracemalloc.start()
+    pos = (meio, meio)
+    for k in range(1, chunks + 1):
+        alvo = (meio + k * world.chunk_size, meio + (k // 2) * world.chunk_size)
+        t0 = time.perf_counter()
+        caminho = world.graph.shortest_path(pos, alvo)
+        tempos["trecho (1 bloco)"].append(time.perf_counter() - t0)
+        if not caminho:
+            raise AssertionError(f"sem caminho de {pos} até {alvo}")
+        pos = alvo
+        world.visit(*pos)
+        memoria.append(tracemalloc.get_traced_memory()[0])
+    tracemalloc.stop()
+    return world, tempos, memoria
+
+
+def main_openworld(chunks):
+    world, tempos, memoria = bench_openworld(chunks)
+    report(f"[OPENWORLD] {chunks} blocos percorridos (bloco {world.chunk_size}x{world.chunk_size}, "
+           f"máx {world.max_chunks} em memória)", tempos)
+    metade = memoria[len(memoria) // 2]
+    print(f"  blocos em memória: {len(world.loaded_chunks())}  gerados: {world.generated}  "
+          f"descartados: {world.evicted}")
+    print(f"  memória: metade do caminho {metade / 1024:.0f} KB  fim {memoria[-1] / 1024:.0f} KB  "
+          f"pico {max(memoria) / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    comando = sys.argv[1] if len(sys.argv) > 1 else "render"
+    args = [int(a) for a in sys.argv[2:]]
+
+    if comando == "render":
+        main_render(args or [15, 50, 200])
+    elif comando == "startup":
+        main_startup(args[0] if args else 5)
+    elif comando == "paths":
+        main_paths(args or [50, 200])
+    elif comando == "edits":
+        main_edits(args or [200, 500])
+    elif comando == "dijkstra":
+        main_dijkstra(args[0] if args else 1000)
+    elif comando == "jps":
+        main_jps(args or [100, 300])
+    elif comando == "cache":
+        main_cache(args or [200, 500])
+    elif comando == "grid":
+        main_grid(args or [200, 1000])
+    elif comando == "openworld":
+        main_openworld(args[0] if args else 200)
+    elif comando == "hpa":
+        main_hpa(args or [100, 300])
+    else:
+        print(f"Comando desconhecido: {comando}")
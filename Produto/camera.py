@@ -0,0 +1,101 @@
+# ===========================================
+# camera.py — Câmera com rolagem e zoom
+# ===========================================
+# Converte coordenadas do grid <-> tela e diz quais casas estão dentro da
+# área visível (viewport). Só lógica: o desenho fica em Interface.py.
+# A posição (x, y) é o canto superior esquerdo da visão, em pixels do
+# mundo no zoom atual.
+# ===========================================
+
+import math
+
+# Tamanhos de célula (pixels por casa) do zoom mais próximo ao mais distante
+ZOOM_LEVELS = (40, 20, 10, 5, 2, 1)
+
+
+class Camera:
+    """Janela de visualização que segue o jogador sobre um mapa W×H."""
+
+    def __init__(self, view_w, view_h, zoom_levels=ZOOM_LEVELS):
+        self.view_w = view_w
+        self.view_h = view_h
+        self.base_levels = tuple(zoom_levels)
+        self.levels = list(zoom_levels)
+        self.zoom_index = 0
+        self.map_w = 0
+        self.map_h = 0
+        self.x = 0
+        self.y = 0
+
+    # ===============================
+    # Mapa / zoom
+    # ===============================
+    def set_map(self, map_w, map_h):
+        """Define o tamanho do mapa (em casas) e recalcula o zoom "mapa inteiro"."""
+        self.map_w, self.map_h = map_w, map_h
+        fit = min(self.view_w / map_w, self.view_h / map_h)
+        # Níveis mais distantes que "mapa inteiro" não fazem sentido
+        self.levels = [c for c in self.base_levels if c > fit] or [self.base_levels[0]]
+        if fit < self.levels[-1]:
+            self.levels.append(fit)  # último nível mostra o mapa inteiro
+        self.zoom_index = min(self.zoom_index, len(self.levels) - 1)
+        self.x = self.y = 0
+
+    @property
+    def cell(self):
+        return self.levels[self.zoom_index]
+
+    def zoom(self, step, focus=None):
+        """Muda o nível de zoom (+1 afasta, -1 aproxima). Retorna True se mudou."""
+        novo = max(0, min(len(self.levels) - 1, self.zoom_index + step))
+        if novo == self.zoom_index:
+            return False
+        if focus is None:
+            focus = ((self.x + self.view_w / 2) / self.cell,
+                     (self.y + self.view_h / 2) / self.cell)
+        self.zoom_index = novo
+        self.center_on(focus[0], focus[1])
+        return True
+
+    # ===============================
+    # Posição
+    # ===============================
+    def center_on(self, tx, ty):
+        """Centraliza na casa (tx, ty), sem sair dos limites do mapa."""
+        cell = self.cell
+        x = (tx + 0.5) * cell - self.view_w / 2
+        y = (ty + 0.5) * cell - self.view_h / 2
+        self.x = int(max(0, min(x, self.map_w * cell - self.view_w)))
+        self.y = int(max(0, min(y, self.map_h * cell - self.view_h)))
+
+    def follow(self, tx, ty):
+        """Segue o jogador. Retorna True se a câmera se moveu."""
+        antes = (self.x, self.y)
+        self.center_on(tx, ty)
+        return (self.x, self.y) != antes
+
+    # ===============================
+    # Conversões / recorte
+    # ===============================
+    def to_screen(self, tx, ty):
+        """Canto superior esquerdo da casa (tx, ty) na tela."""
+        cell = self.cell
+        return int(tx * cell - self.x), int(ty * cell - self.y)
+
+    def to_tile(self, sx, sy):
+        """Casa do grid sob o ponto (sx, sy) da tela."""
+        cell = self.cell
+        return int((sx + self.x) // cell), int((sy + self.y) // cell)
+
+    def visible_tiles(self):
+        """Intervalo (x0, y0, x1, y1) de casas visíveis, com x1/y1 exclusivos."""
+        cell = self.cell
+        x0 = max(0, int(self.x // cell))
+        y0 = max(0, int(self.y // cell))
+        x1 = min(self.map_w, int(math.ceil((self.x + self.view_w) / cell)))
+        y1 = min(self.map_h, int(math.ceil((self.y + self.view_h) / cell)))
+        return x0, y0, x1, y1
+
+    def is_visible(self, tx, ty):
+        x0, y0, x1, y1 = self.visible_tiles()
+        return x0 <= tx < x1 and y0 <= ty < y1
@@ -0,0 +1,120 @@
+# ===========================================
+# fog.py — Neblina de guerra (casas já exploradas)
+# ===========================================
+# Um byte por casa (bytearray W×H, 1 = explorada). A cada passo só as
+# casas dentro do raio de visão são testadas, e as já exploradas são
+# puladas antes do teste de linha de visão, então o custo por passo não
+# depende do tamanho do mapa.
+#
+# Persistência: o bitmap vai comprimido (zlib + base64) numa linha
+# "neblina=LxA:dados" do save.
+# ===========================================
+
+import base64
+import binascii
+import zlib
+
+from grid import Grid, WALL
+
+VISION_RADIUS = 4
+
+
+def _line_between(dx, dy):
+    """Casas (Bresenham) entre a origem e (dx, dy), sem as duas pontas."""
+    cells = []
+    x = y = 0
+    sx = 1 if dx > 0 else -1
+    sy = 1 if dy > 0 else -1
+    adx, ady = abs(dx), abs(dy)
+    err = adx - ady
+    while True:
+        e2 = 2 * err
+        if e2 > -ady:
+            err -= ady
+            x += sx
+        if e2 < adx:
+            err += adx
+            y += sy
+        if (x, y) == (dx, dy):
+            return cells
+        cells.append((x, y))
+
+
+class FogOfWar:
+    """Mapa de casas exploradas com visão limitada por paredes."""
+
+    def __init__(self, grid, radius=VISION_RADIUS):
+        self.grid = grid if isinstance(grid, Grid) else Grid.from_rows(grid)
+        self.height = self.grid.height
+        self.width = self.grid.width
+        self.radius = radius
+        self.explored = bytearray(self.width * self.height)
+        self.version = 0      # muda a cada casa nova (invalida caches de desenho)
+        self._changes = []    # casas reveladas desde o último pop_changes()
+
+        # Deslocamentos dentro do raio + casas do meio da linha de visão
+        r2 = radius * radius + radius  # círculo "cheio" (inclui as quinas suaves)
+        self._rays = [(dx, dy, _line_between(dx, dy))
+                      for dy in range(-radius, radius + 1)
+                      for dx in range(-radius, radius + 1)
+                      if dx * dx + dy * dy <= r2]
+
+    # ===============================
+    # Consulta
+    # ===============================
+    def is_explored(self, x, y):
+        return self.explored[y * self.width + x] == 1
+
+    def explored_count(self):
+        return self.explored.count(1)
+
+    # ===============================
+    # Visão
+    # ===============================
+    def reveal(self, x, y):
+        """Marca as casas visíveis a partir de (x, y). Retorna as casas novas."""
+        cells, explored = self.grid.data, self.explored
+        w, h = self.width, self.height
+        novas = []
+        for dx, dy, between in self._rays:
+            tx, ty = x + dx, y + dy
+            if not (0 <= tx < w and 0 <= ty < h) or explored[ty * w + tx]:
+                continue
+            # Visível se nenhuma parede estiver no meio do caminho
+            for bx, by in between:
+                if cells[(y + by) * w + x + bx] == WALL:
+                    break
+            else:
+                explored[ty * w + tx] = 1
+                novas.append((tx, ty))
+        if novas:
+            self.version += 1
+            self._changes.extend(novas)
+        return novas
+
+    def pop_changes(self):
+        """Casas reveladas desde a última chamada (para atualizar o desenho)."""
+        changes, self._changes = self._changes, []
+        return changes
+
+    # ===============================
+    # Persistência
+    # ===============================
+    def to_text(self):
+        data = base64.b64encode(zlib.compress(bytes(self.explored), 9)).decode("ascii")
+        return f"{self.width}x{self.height}:{data}"
+
+    def load_text(self, text):
+        """Restaura o bitmap salvo por to_text(). Retorna False se não servir para este mapa."""
+        try:
+            dims, data = text.split(":", 1)
+            w, h = (int(v) for v in dims.split("x"))
+            raw = zlib.decompress(base64.b64decode(data))
+        except (ValueError, binascii.Error, zlib.error):
+            return False
+        if (w, h) != (self.width, self.height) or len(raw) != len(self.explored):
+            return False
+        self.explored[:] = raw
+        self.version += 1
+        self._changes = []
+        return True
@@ -1,173 +1,557 @@
-# ===========================================
-# graph.py — Implementação completa de Grafo
-# ===========================================
-# Usado como MAPA no jogo Explorador de Território 2D.
-# Cada vértice é uma sala; cada aresta é um caminho entre salas.
-# ===========================================
-
-from collections import deque
-
-class Graph:
-    """Classe que representa um grafo não ponderado e não direcionado."""
-    
-    def __init__(self):
-        self.adj = {}  # { vértice: [vizinhos] }
-
-    # ===============================
-    # Inserção de vértice
-    # ===============================
-    def add_vertex(self, v):
-        if v not in self.adj:
-            self.adj[v] = []
-            print(f"[GRAFO] Sala '{v}' adicionada ao mapa.")
-        else:
-            print(f"[GRAFO] Sala '{v}' já existe.")
-
-    # ===============================
-    # Inserção de aresta
-    # ===============================
-    def add_edge(self, v1, v2):
-        if v1 not in self.adj:
-            self.add_vertex(v1)
-        if v2 not in self.adj:
-            self.add_vertex(v2)
-
-        if v2 not in self.adj[v1]:
-            self.adj[v1].append(v2)
-        if v1 not in self.adj[v2]:
-            self.adj[v2].append(v1)
-        
-        print(f"[GRAFO] Conectadas salas '{v1}' <-> '{v2}'")
-
-    # ===============================
-    # Remoção de vértice
-    # ===============================
-    def remove_vertex(self, v):
-        if v in self.adj:
-            for vizinhos in self.adj.values():
-                if v in vizinhos:
-                    vizinhos.remove(v)
-            del self.adj[v]
-            print(f"[GRAFO] Sala '{v}' removida do mapa.")
-        else:
-            print(f"[GRAFO] Sala '{v}' não encontrada.")
-
-    # ===============================
-    # Remoção de aresta
-    # ===============================
-    def remove_edge(self, v1, v2):
-        if v1 in self.adj and v2 in self.adj[v1]:
-            self.adj[v1].remove(v2)
-        if v2 in self.adj and v1 in self.adj[v2]:
-            self.adj[v2].remove(v1)
-        print(f"[GRAFO] Caminho removido entre '{v1}' e '{v2}'.")
-
-    # ===============================
-    # Consulta de vizinhos
-    # ===============================
-    def get_neighbors(self, v):
-        return self.adj.get(v, [])
-
-    # ===============================
-    # Exibição do mapa
-    # ===============================
-    def show(self):
-        print("\n[GRAFO] Mapa atual do labirinto:")
-        for v, vizinhos in self.adj.items():
-            print(f"  {v} -> {vizinhos}")
-        print()
-
-    # ===============================
-    # BFS — Busca em Largura
-    # ===============================
-    def bfs(self, start, goal):
-        """
-        Retorna o caminho mais curto entre 'start' e 'goal'.
-        Se não houver caminho, retorna [].
-        """
-        if start not in self.adj or goal not in self.adj:
-            print("[BFS] Um dos vértices não existe no mapa.")
-            return []
-
-        visitados = set()
-        fila = deque([(start, [start])])  # (nó_atual, caminho_até_agora)
-
-        while fila:
-            atual, caminho = fila.popleft()
-
-            if atual == goal:
-                print(f"[BFS] Caminho encontrado: {caminho}")
-                return caminho
-
-            visitados.add(atual)
-            for vizinho in self.adj[atual]:
-                if vizinho not in visitados:
-                    fila.append((vizinho, caminho + [vizinho]))
-
-        print("[BFS] Nenhum caminho encontrado.")
-        return []
-
-    # ===============================
-    # DFS — Busca em Profundidade
-    # ===============================
-    def dfs(self, start, visitados=None):
-        """
-        Percorre o grafo a partir de 'start' usando DFS.
-        Retorna a ordem dos vértices visitados.
-        """
-        if visitados is None:
-            visitados = set()
-
-        if start not in self.adj:
-            print("[DFS] Vértice inicial inexistente.")
-            return []
-
-        visitados.add(start)
-        ordem = [start]
-
-        for vizinho in self.adj[start]:
-            if vizinho not in visitados:
-                ordem.extend(self.dfs(vizinho, visitados))
-
-        return ordem
-
-    def get_collection_path(self, start_node, items_nodes, exit_node):
-            """
-            Calcula a rota aproximada para pegar todos os itens e depois sair.
-            Usa lógica 'Vizinho Mais Próximo': Onde estou -> Item mais perto -> Próximo -> Saída.
-            """
-            full_path = []
-            current_pos = start_node
-            to_collect = list(items_nodes) 
-            
-            while to_collect:
-                closest_item = None
-                shortest_dist = float('inf')
-                path_segment = []
-
-                for item in to_collect:
-                    path = self.bfs(current_pos, item)
-                    if path and len(path) < shortest_dist:
-                        shortest_dist = len(path)
-                        closest_item = item
-                        path_segment = path
-
-                if closest_item:
-                    if full_path:
-                        full_path.extend(path_segment[1:])
-                    else:
-                        full_path.extend(path_segment)
-                    
-                    current_pos = closest_item
-                    to_collect.remove(closest_item)
-                else:
-                    break
-            
-            path_exit = self.bfs(current_pos, exit_node)
-            if path_exit:
-                if full_path:
-                    full_path.extend(path_exit[1:])
-                else:
-                    full_path.extend(path_exit)
-                    
-            return full_path
+# ===========================================
+# graph.py — Implementação completa de Grafo
+# ===========================================
+# Usado como MAPA no jogo Explorador de Território 2D.
+# Cada vértice é uma sala; cada aresta é um caminho entre salas.
+# Adjacência em dicionário (ordem de inserção preservada): teste de
+# aresta, inserção e remoção em O(1) e remoção de vértice em O(grau).
+# Arestas têm peso (custo do terreno); com algum peso != 1 o grafo passa
+# a ser "ponderado" e as buscas usam Dijkstra / A* com pesos.
+# ===========================================
+
+from collections import deque
+from heapq import heappush, heappop
+import profiler
+from pathfinding import SEARCHES, manhattan
+
+class Graph:
+    """Classe que representa um grafo não direcionado (pesos opcionais)."""
+    
+    def __init__(self, verbose=True):
+        self.adj = {}  # { vértice: {vizinho: peso} }
+        self.weighted = False   # True se alguma aresta tiver peso != 1
+        self.verbose = verbose  # False = sem logs (simulação / geração em massa)
+        self.locate = None      # nó -> (x, y); habilita a heurística Manhattan do A*
+        self.search = "bfs"     # busca usada por shortest_path / get_collection_path
+        self.label = str        # nó -> nome nos logs (World usa node_name: ids viram "Nx_y")
+        self.grid_search = None # (start, goal) -> (caminho, expandidos) no grid; World liga a JPS
+        # Caches de caminhos (descartados em qualquer edição de aresta/vértice)
+        self._dist_trees = {}   # destino -> {nó: distância até o destino}
+        self._path_cache = {}   # chave -> [último caminho, índice do progresso do jogador]
+
+    # ===============================
+    # Inserção de vértice
+    # ===============================
+    def add_vertex(self, v):
+        if v not in self.adj:
+            self.adj[v] = {}
+            if self.verbose:
+                print(f"[GRAFO] Sala '{self.label(v)}' adicionada ao mapa.")
+        else:
+            if self.verbose:
+                print(f"[GRAFO] Sala '{self.label(v)}' já existe.")
+
+    # ===============================
+    # Inserção de aresta
+    # ===============================
+    def add_edge(self, v1, v2, weight=1):
+        if v1 not in self.adj:
+            self.add_vertex(v1)
+        if v2 not in self.adj:
+            self.add_vertex(v2)
+
+        self.adj[v1][v2] = weight
+        self.adj[v2][v1] = weight
+        if weight != 1:
+            self.weighted = True
+        self._invalidate_paths()
+        
+        if self.verbose:
+            print(f"[GRAFO] Conectadas salas '{self.label(v1)}' <-> '{self.label(v2)}'")
+
+    def add_edges_bulk(self, edges, vertices=()):
+        """
+        Insere muitas arestas de uma vez (montagem do mapa): sem log por
+        aresta e uma única invalidação dos caches. Cada aresta é (v1, v2)
+        ou (v1, v2, peso). 'vertices' são criados antes, na ordem dada
+        (inclui casas sem nenhuma aresta).
+        """
+        adj = self.adj
+        for v in vertices:
+            if v not in adj:
+                adj[v] = {}
+        n = 0
+        pesado = False
+        for aresta in edges:
+            v1, v2 = aresta[0], aresta[1]
+            peso = aresta[2] if len(aresta) > 2 else 1
+            viz1 = adj.get(v1)
+            if viz1 is None:
+                viz1 = adj[v1] = {}
+            viz2 = adj.get(v2)
+            if viz2 is None:
+                viz2 = adj[v2] = {}
+            viz1[v2] = peso
+            viz2[v1] = peso
+            pesado = pesado or peso != 1
+            n += 1
+        if pesado:
+            self.weighted = True
+        self._invalidate_paths()
+        if self.verbose:
+            print(f"[GRAFO] {n} caminhos adicionados em lote ({len(adj)} salas no mapa).")
+
+    # ===============================
+    # Remoção de vértice
+    # ===============================
+    def remove_vertex(self, v):
+        if v in self.adj:
+            # Só os vizinhos de v apontam para ele: O(grau)
+            for vizinho in self.adj.pop(v):
+                if vizinho != v:
+                    del self.adj[vizinho][v]
+            self._invalidate_paths()
+            if self.verbose:
+                print(f"[GRAFO] Sala '{self.label(v)}' removida do mapa.")
+        else:
+            if self.verbose:
+                print(f"[GRAFO] Sala '{self.label(v)}' não encontrada.")
+
+    # ===============================
+    # Remoção de aresta
+    # ===============================
+    def remove_edge(self, v1, v2):
+        if v1 in self.adj:
+            self.adj[v1].pop(v2, None)
+        if v2 in self.adj:
+            self.adj[v2].pop(v1, None)
+        self._invalidate_paths()
+        if self.verbose:
+            print(f"[GRAFO] Caminho removido entre '{self.label(v1)}' e '{self.label(v2)}'.")
+
+    # ===============================
+    # Consulta de vizinhos
+    # ===============================
+    def get_neighbors(self, v):
+        return list(self.adj.get(v, ()))
+
+    def edge_weight(self, v1, v2):
+        """Peso da aresta v1-v2 (None se não existir)."""
+        return self.adj.get(v1, {}).get(v2)
+
+    def path_cost(self, path):
+        """Soma dos pesos das arestas do caminho (= nº de passos sem pesos)."""
+        adj = self.adj
+        return sum(adj[a][b] for a, b in zip(path, path[1:]))
+
+    # ===============================
+    # Exibição do mapa
+    # ===============================
+    def labels(self, nodes):
+        """Nomes de exibição de uma lista de nós."""
+        return [self.label(n) for n in nodes]
+
+    def show(self):
+        print("\n[GRAFO] Mapa atual do labirinto:")
+        for v, vizinhos in self.adj.items():
+            print(f"  {self.label(v)} -> {self.labels(vizinhos)}")
+        print()
+
+    # ===============================
+    # BFS — Busca em Largura
+    # ===============================
+    def bfs(self, start, goal):
+        """
+        Retorna o caminho mais curto entre 'start' e 'goal'.
+        Se não houver caminho, retorna [].
+        """
+        if start not in self.adj or goal not in self.adj:
+            if self.verbose:
+                print("[BFS] Um dos vértices não existe no mapa.")
+            return []
+
+        # Marca o pai ao enfileirar: cada vértice entra na fila uma única vez
+        pais = {start: None}
+        fila = deque([start])
+
+        while fila:
+            atual = fila.popleft()
+
+            if atual == goal:
+                if profiler.ENABLED:
+                    # expandidos = descobertos - ainda na fila
+                    profiler.observe("graph.bfs.expanded", len(pais) - len(fila) - 1)
+                caminho = []
+                while atual is not None:
+                    caminho.append(atual)
+                    atual = pais[atual]
+                caminho.reverse()
+                if self.verbose:
+                    print(f"[BFS] Caminho encontrado: {self.labels(caminho)}")
+                return caminho
+
+            for vizinho in self.adj[atual]:
+                if vizinho not in pais:
+                    pais[vizinho] = atual
+                    fila.append(vizinho)
+
+        if profiler.ENABLED:
+            profiler.observe("graph.bfs.expanded", len(pais))
+        if self.verbose:
+            print("[BFS] Nenhum caminho encontrado.")
+        return []
+
+    # ===============================
+    # A* e BFS bidirecional
+    # ===============================
+    def astar(self, start, goal, heuristic=None):
+        """
+        Caminho mais curto por A*. Sem heurística, usa Manhattan pelas
+        coordenadas dos nós (self.locate); sem coordenadas, vira uma BFS.
+        """
+        if heuristic is None and self.locate is not None:
+            heuristic = manhattan(self.locate, goal)  # admissível: peso mínimo é 1
+        if self.weighted:
+            return self._search("dijkstra", start, goal, heuristic)
+        return self._search("astar", start, goal, heuristic)
+
+    def dijkstra(self, start, goal):
+        """Caminho de menor custo (soma dos pesos) entre 'start' e 'goal'."""
+        return self._search("dijkstra", start, goal)
+
+    def bidirectional_bfs(self, start, goal):
+        """Caminho mais curto buscando a partir dos dois extremos ao mesmo tempo."""
+        return self._search("bidir", start, goal)
+
+    def shortest_path(self, start, goal, method=None):
+        """
+        Caminho mais curto pela busca escolhida ("bfs", "astar", "bidir",
+        "jps"; padrão: self.search). Usa a árvore de distâncias do destino se já
+        existir, ou o sufixo do último caminho para o mesmo destino se
+        'start' estiver nele (sufixo de caminho mínimo também é mínimo).
+        """
+        if goal in self._dist_trees:
+            return self.path_to(start, goal)
+
+        method = method or self.search
+        if self.weighted and method not in ("astar", "dijkstra"):
+            method = "dijkstra"  # BFS ignoraria o custo do terreno
+        key = ("caminho", goal, method)
+        caminho = self._cached_suffix(key, start)
+        if caminho is not None:
+            return caminho
+
+        if method == "bfs":
+            caminho = self.bfs(start, goal)
+        elif method == "astar":
+            caminho = self.astar(start, goal)
+        else:
+            caminho = self._search(method, start, goal)
+        self._remember(key, caminho)
+        return caminho
+
+    def _search(self, method, start, goal, heuristic=None):
+        if method == "jps" and self.grid_search is None:
+            method = "astar"  # sem grid: A* expande o mesmo conjunto ótimo
+        tag = method.upper()
+        if start not in self.adj or goal not in self.adj:
+            if self.verbose:
+                print(f"[{tag}] Um dos vértices não existe no mapa.")
+            return []
+
+        if method == "jps":
+            caminho, expandidos = self.grid_search(start, goal)
+        else:
+            caminho, expandidos = SEARCHES[method](start, goal, self.adj.__getitem__, heuristic)
+        if profiler.ENABLED:
+            profiler.observe(f"graph.{method}.expanded", expandidos)
+        if self.verbose:
+            if caminho:
+                print(f"[{tag}] Caminho encontrado: {self.labels(caminho)}")
+            else:
+                print(f"[{tag}] Nenhum caminho encontrado.")
+        return caminho
+
+    # ===============================
+    # Cache de caminhos
+    # ===============================
+    def distances_to(self, goal):
+        """
+        Distância (custo) de cada vértice até 'goal', memorizada: uma BFS a
+        partir dele, ou um Dijkstra completo se o grafo for ponderado.
+        """
+        dist = self._dist_trees.get(goal)
+        if dist is None:
+            profiler.count("graph.dist_tree.builds")
+            dist = {goal: 0}
+            if self.weighted:
+                heap = [(0, 0, goal)]
+                ordem = 1
+                while heap:
+                    d, _, atual = heappop(heap)
+                    if d > dist[atual]:
+                        continue
+                    for vizinho, peso in self.adj[atual].items():
+                        nd = d + peso
+                        if nd < dist.get(vizinho, nd + 1):
+                            dist[vizinho] = nd
+                            heappush(heap, (nd, ordem, vizinho))
+                            ordem += 1
+            else:
+                fila = deque([goal])
+                while fila:
+                    atual = fila.popleft()
+                    d = dist[atual] + 1
+                    for vizinho in self.adj[atual]:
+                        if vizinho not in dist:
+                            dist[vizinho] = d
+                            fila.append(vizinho)
+            self._dist_trees[goal] = dist
+        return dist
+
+    def path_to(self, start, goal):
+        """
+        Caminho mais curto descendo a árvore de distâncias de 'goal': depois
+        da primeira chamada, custa O(comprimento do caminho × grau).
+        """
+        if start not in self.adj or goal not in self.adj:
+            if self.verbose:
+                print("[BFS] Um dos vértices não existe no mapa.")
+            return []
+
+        dist = self.distances_to(goal)
+        d = dist.get(start)
+        if d is None:
+            if self.verbose:
+                print("[BFS] Nenhum caminho encontrado.")
+            return []
+
+        caminho = [start]
+        atual = start
+        while d > 0:
+            # Próximo passo: vizinho cuja distância + peso da aresta = a minha
+            for vizinho, peso in self.adj[atual].items():
+                if dist.get(vizinho) == d - peso:
+                    atual = vizinho
+                    d -= peso
+                    break
+            caminho.append(atual)
+        if self.verbose:
+            print(f"[BFS] Caminho encontrado: {self.labels(caminho)}")
+        return caminho
+
+    def _cached_suffix(self, key, start):
+        """
+        Parte do último caminho guardado em 'key' que começa em 'start' (ou
+        None). Rotas de coleta passam de novo por casas já visitadas (volta
+        de um baú sem saída), então 'start' é procurado só do progresso do
+        jogador em diante: a 1ª ocorrência antiga levaria de volta a baús
+        já abertos. Quem volta para trás do progresso recalcula.
+        """
+        entry = self._path_cache.get(key)
+        if entry is None:
+            return None
+        caminho, progresso = entry
+        if caminho[progresso] == start:
+            i = progresso
+        elif progresso + 1 < len(caminho) and caminho[progresso + 1] == start:
+            i = progresso + 1  # caso comum: andou uma casa seguindo a rota
+        else:
+            try:
+                i = caminho.index(start, progresso)
+            except ValueError:
+                return None
+        entry[1] = i
+        profiler.count("graph.path_cache.hits")
+        return caminho[i:]
+
+    def _remember(self, key, caminho):
+        if caminho:
+            self._path_cache[key] = [list(caminho), 0]  # cópia: quem chamou pode alterar a lista
+
+    def _invalidate_paths(self):
+        """O mapa mudou: árvores de distância e caminhos guardados deixam de valer."""
+        if self._dist_trees or self._path_cache:
+            self._dist_trees.clear()
+            self._path_cache.clear()
+
+    # ===============================
+    # DFS — Busca em Profundidade
+    # ===============================
+    def iter_dfs(self, start, visitados=None):
+        """
+        Gera os vértices em pré-ordem de DFS a partir de 'start', com uma
+        pilha de iteradores no lugar da recursão (corredores longos não
+        estouram o limite de recursão). 'visitados' é atualizado no lugar.
+        """
+        if visitados is None:
+            visitados = set()
+        if start not in self.adj or start in visitados:
+            return
+
+        visitados.add(start)
+        yield start
+        pilha = [iter(self.adj[start])]
+        while pilha:
+            for vizinho in pilha[-1]:
+                if vizinho not in visitados:
+                    visitados.add(vizinho)
+                    yield vizinho
+                    pilha.append(iter(self.adj[vizinho]))
+                    break
+            else:
+                pilha.pop()  # todos os vizinhos já visitados: volta um nível
+
+    def dfs(self, start, visitados=None):
+        """
+        Percorre o grafo a partir de 'start' usando DFS.
+        Retorna a ordem dos vértices visitados.
+        """
+        if start not in self.adj:
+            if self.verbose:
+                print("[DFS] Vértice inicial inexistente.")
+            return []
+        return list(self.iter_dfs(start, visitados))
+
+    # ===============================
+    # Análise estrutural
+    # ===============================
+    def connected_components(self):
+        """Lista de componentes conexos (cada um em ordem de DFS)."""
+        visitados = set()
+        return [list(self.iter_dfs(v, visitados)) for v in self.adj if v not in visitados]
+
+    def bridges(self):
+        """Arestas cuja remoção desconecta o grafo (corredores sem alternativa)."""
+        return self.bridges_and_articulation_points()[0]
+
+    def articulation_points(self):
+        """Vértices cuja remoção desconecta o grafo (gargalos)."""
+        return self.bridges_and_articulation_points()[1]
+
+    def bridges_and_articulation_points(self):
+        """
+        Pontes e pontos de articulação numa única DFS iterativa (Tarjan):
+        low[v] = menor tempo de descoberta alcançável a partir da subárvore
+        de v usando no máximo uma aresta de retorno. O(V + E).
+        """
+        disc, low = {}, {}
+        pontes, articulacoes = [], set()
+        tempo = 0
+        for raiz in self.adj:
+            if raiz in disc:
+                continue
+            disc[raiz] = low[raiz] = tempo
+            tempo += 1
+            filhos_raiz = 0
+            pilha = [(raiz, None, iter(self.adj[raiz]))]
+            while pilha:
+                v, pai, vizinhos = pilha[-1]
+                for w in vizinhos:
+                    if w not in disc:
+                        disc[w] = low[w] = tempo
+                        tempo += 1
+                        if v == raiz:
+                            filhos_raiz += 1
+                        pilha.append((w, v, iter(self.adj[w])))
+                        break
+                    if w != pai and disc[w] < low[v]:
+                        low[v] = disc[w]  # aresta de retorno
+                else:
+                    # v terminou: propaga low para o pai e testa a aresta pai-v
+                    pilha.pop()
+                    if pai is not None:
+                        if low[v] < low[pai]:
+                            low[pai] = low[v]
+                        if low[v] > disc[pai]:
+                            pontes.append((pai, v))
+                        if pai != raiz and low[v] >= disc[pai]:
+                            articulacoes.add(pai)
+            if filhos_raiz > 1:
+                articulacoes.add(raiz)
+        return pontes, articulacoes
+
+    def _nearest_by_bfs(self, start, items):
+        """
+        (item, caminho) do item mais perto de 'start' numa BFS só, nível a
+        nível. Empate: o primeiro de 'items', como na busca item a item; a
+        árvore de pais é a mesma de bfs(), então o caminho também.
+        """
+        if start not in self.adj:
+            return None, []
+        ordem = {item: i for i, item in enumerate(items)}
+        pais = {start: None}
+        nivel = [start]
+        adj = self.adj
+        while nivel:
+            achados = [n for n in nivel if n in ordem]
+            if achados:
+                atual = min(achados, key=ordem.get)
+                item, caminho = atual, []
+                while atual is not None:
+                    caminho.append(atual)
+                    atual = pais[atual]
+                caminho.reverse()
+                return item, caminho
+            proximo = []
+            for atual in nivel:
+                for vizinho in adj[atual]:
+                    if vizinho not in pais:
+                        pais[vizinho] = atual
+                        proximo.append(vizinho)
+            nivel = proximo
+        return None, []
+
+    def get_collection_path(self, start_node, items_nodes, exit_node, method=None, path_fn=None):
+            """
+            Calcula a rota aproximada para pegar todos os itens e depois sair.
+            Usa lógica 'Vizinho Mais Próximo': Onde estou -> Item mais perto -> Próximo -> Saída.
+            'method' escolhe a busca de cada trecho (padrão: self.search);
+            'path_fn(início, fim)', se dada, faz os trechos no lugar de
+            shortest_path (ex.: World.hierarchical_path em mapas enormes).
+            """
+            # Sem pesos e com BFS: uma busca por trecho acha o item mais perto
+            # (em vez de uma BFS até cada item restante)
+            uma_bfs = path_fn is None and not self.weighted and (method or self.search) == "bfs"
+            if path_fn is None:
+                path_fn = lambda a, b: self.shortest_path(a, b, method)
+            with profiler.section("graph.get_collection_path"):
+                # Jogador seguindo a rota anterior: o resto dela ainda coleta tudo
+                key = ("coleta", exit_node, method or self.search)
+                resto = self._cached_suffix(key, start_node)
+                if resto is not None and set(items_nodes) <= set(resto) and resto[-1] == exit_node:
+                    return resto
+
+                full_path = []
+                current_pos = start_node
+                to_collect = list(items_nodes) 
+            
+                while to_collect:
+                    closest_item = None
+                    shortest_dist = float('inf')
+                    path_segment = []
+
+                    if uma_bfs:
+                        closest_item, path_segment = self._nearest_by_bfs(current_pos, to_collect)
+                    else:
+                        for item in to_collect:
+                            path = path_fn(current_pos, item)
+                            if not path:
+                                continue
+                            # Com pesos, "mais perto" é o menor custo, não o menor nº de casas
+                            dist = self.path_cost(path) if self.weighted else len(path)
+                            if dist < shortest_dist:
+                                shortest_dist = dist
+                                closest_item = item
+                                path_segment = path
+
+                    if closest_item is not None:
+                        if full_path:
+                            full_path.extend(path_segment[1:])
+                        else:
+                            full_path.extend(path_segment)
+                    
+                        current_pos = closest_item
+                        to_collect.remove(closest_item)
+                    else:
+                        break
+            
+                path_exit = path_fn(current_pos, exit_node)
+                if path_exit:
+                    if full_path:
+                        full_path.extend(path_exit[1:])
+                    else:
+                        full_path.extend(path_exit)
+                    
+                self._remember(key, full_path)
+                return full_path
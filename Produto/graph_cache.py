@@ -0,0 +1,77 @@
+# ===========================================
+# graph_cache.py — Cache em disco dos grafos já montados
+# ===========================================
+# Para mapas fixos (arquivos de fase) ou já gerados antes, montar o grafo
+# repete sempre o mesmo trabalho: ids das casas, busca das salas e
+# inserção de arestas. Aqui o resultado (adjacência, posições das salas e
+# tabela de distâncias entre salas) vai para um arquivo pickle cujo nome
+# junta dois hashes:
+#
+#   - do mapa (bytes do grid + dimensões): outro mapa, outro arquivo;
+#   - do código que monta o grafo (world.py, graph.py, grid.py e este
+#     arquivo): qualquer mudança nele invalida todos os caches sozinha.
+#
+# Os arquivos ficam em CACHE_DIR (a variável LABIRINTO_CACHE muda a
+# pasta). São pickles: a pasta deve ser só do jogo.
+# ===========================================
+
+import hashlib
+import os
+import pickle
+
+import profiler
+
+CACHE_DIR = os.environ.get("LABIRINTO_CACHE", os.path.join("data", "graph_cache"))
+_SOURCES = ("world.py", "graph.py", "grid.py", "graph_cache.py")
+
+
+def _code_version():
+    """Hash curto do código que define o grafo montado."""
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha1()
+    for nome in _SOURCES:
+        with open(os.path.join(pasta, nome), "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:12]
+
+
+CODE_VERSION = _code_version()
+
+
+def map_key(grid):
+    """Hash do mapa: dimensões + bytes do grid."""
+    h = hashlib.sha1(f"{grid.width}x{grid.height}:".encode())
+    h.update(grid.view())
+    return h.hexdigest()[:20]
+
+
+def _path(key):
+    return os.path.join(CACHE_DIR, f"{key}-{CODE_VERSION}.pickle")
+
+
+def load(key):
+    """Dados guardados para o mapa 'key' com o código atual (ou None)."""
+    try:
+        with open(_path(key), "rb") as f:
+            data = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if profiler.ENABLED:
+        profiler.count("graph_cache.hits")
+    return data
+
+
+def store(key, data):
+    """Grava os dados do mapa e apaga versões do mesmo mapa feitas por código antigo."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    destino = _path(key)
+    temporario = destino + ".tmp"
+    with open(temporario, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporario, destino)  # quem lê nunca vê um arquivo pela metade
+    for nome in os.listdir(CACHE_DIR):
+        if nome.startswith(f"{key}-") and os.path.join(CACHE_DIR, nome) != destino:
+            try:
+                os.remove(os.path.join(CACHE_DIR, nome))
+            except OSError:
+                pass
@@ -0,0 +1,148 @@
+# ===========================================
+# grid.py — Mapa compacto (1 byte por casa)
+# ===========================================
+# World.map_grid era uma lista de listas de strings de 1 caractere: cada
+# casa custa um ponteiro de 8 bytes, mais o cabeçalho de cada lista. Grid
+# guarda o mapa inteiro num único bytearray (código ASCII de cada casa,
+# linha a linha) e mantém a mesma leitura grid[y][x] -> "#", "."...
+# 'data' também pode ser um mmap de um arquivo .lmap (map_io.py).
+#
+# Laços quentes devem evitar grid[y][x] (cria um GridRow por linha lida)
+# e usar get(x, y), row_text(y) ou direto o bytearray 'data' com índice
+# y * width + x. view() / numpy() expõem os mesmos bytes sem cópia.
+# ===========================================
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+WALL = ord("#")
+
+
+class GridRow:
+    """Linha de um Grid: leitura e escrita por índice, sem copiar dados."""
+
+    __slots__ = ("_data", "_start", "_width")
+
+    def __init__(self, data, start, width):
+        self._data = data
+        self._start = start
+        self._width = width
+
+    def _index(self, x):
+        if x < 0:
+            x += self._width
+        if not 0 <= x < self._width:
+            raise IndexError("coluna fora do mapa")
+        return self._start + x
+
+    def __getitem__(self, x):
+        if isinstance(x, slice):
+            return self.text()[x]
+        return chr(self._data[self._index(x)])
+
+    def __setitem__(self, x, char):
+        self._data[self._index(x)] = ord(char)
+
+    def __len__(self):
+        return self._width
+
+    def __iter__(self):
+        return iter(self.text())
+
+    def text(self):
+        return self._data[self._start:self._start + self._width].decode("latin-1")
+
+
+class Grid:
+    """Mapa W×H de caracteres ASCII num bytearray, indexado como grid[y][x]."""
+
+    __slots__ = ("width", "height", "data")
+
+    def __init__(self, width, height, fill=".", data=None):
+        self.width = width
+        self.height = height
+        if data is None:
+            data = bytearray(fill.encode("latin-1") * (width * height))
+        elif len(data) != width * height:
+            raise ValueError(f"Grid {width}x{height} precisa de {width * height} bytes, veio {len(data)}.")
+        self.data = data
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Grid a partir de linhas (strings ou listas de caracteres)."""
+        rows = ["".join(row) for row in rows]
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise ValueError("Todas as linhas do mapa precisam ter o mesmo tamanho.")
+        return cls(width, len(rows), data=bytearray("".join(rows).encode("latin-1")))
+
+    # ===============================
+    # Acesso estilo lista de listas
+    # ===============================
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("linha fora do mapa")
+        return GridRow(self.data, y * self.width, self.width)
+
+    def __iter__(self):
+        for y in range(self.height):
+            yield GridRow(self.data, y * self.width, self.width)
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return (self.width, self.height, self.data) == (other.width, other.height, other.data)
+        return NotImplemented
+
+    # ===============================
+    # Acesso rápido
+    # ===============================
+    def get(self, x, y):
+        return chr(self.data[y * self.width + x])
+
+    def set(self, x, y, char):
+        self.data[y * self.width + x] = ord(char)
+
+    def is_wall(self, x, y):
+        return self.data[y * self.width + x] == WALL
+
+    def row_text(self, y):
+        """Linha y como str (uma cópia pequena; indexar str é o acesso mais rápido)."""
+        start = y * self.width
+        return self.data[start:start + self.width].decode("latin-1")
+
+    def find_all(self, char):
+        """(x, y) de todas as casas com 'char', em ordem de linha (busca em C)."""
+        alvo, data, w = char.encode("latin-1"), self.data, self.width
+        achados = []
+        i = data.find(alvo)
+        while i != -1:
+            achados.append((i % w, i // w))
+            i = data.find(alvo, i + 1)
+        return achados
+
+    # ===============================
+    # Visões sem cópia
+    # ===============================
+    def view(self):
+        """memoryview dos bytes (linha a linha); escrever nela altera o Grid."""
+        return memoryview(self.data)
+
+    def numpy(self):
+        """Array uint8 (altura, largura) que compartilha a memória do Grid."""
+        if not HAS_NUMPY:
+            raise ImportError("numpy não está instalado.")
+        return np.frombuffer(self.data, dtype=np.uint8).reshape(self.height, self.width)
+
+    def tobytes(self):
+        return bytes(self.data)
+
+    def copy(self):
+        return Grid(self.width, self.height, data=bytearray(self.data))
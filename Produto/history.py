@@ -0,0 +1,94 @@
+# ===========================================
+# history.py — Histórico compacto de movimentos
+# ===========================================
+# Cada passo do jogador é guardado como um código de direção de 2 bits
+# (4 passos por byte, em um array('B')). Só a posição inicial e os
+# "saltos" (movimentos que não são de 1 casa, ex.: carregar jogo) guardam
+# coordenadas completas. A decodificação para (x, y) é preguiçosa e feita
+# uma única vez até o próximo movimento.
+# ===========================================
+
+from array import array
+
+# Código de 2 bits -> deslocamento (dx, dy)
+DIRECOES = ((1, 0), (-1, 0), (0, 1), (0, -1))
+_CODIGOS = {d: i for i, d in enumerate(DIRECOES)}
+
+
+class MoveHistory:
+    """Histórico de posições do jogador codificado por direção."""
+
+    def __init__(self, start_position, locate=None):
+        self._locate = locate          # função nó -> (x, y) ou None
+        self._codes = array('B')       # 4 códigos de 2 bits por byte
+        self._steps = 0                # quantidade de passos registrados
+        self._jumps = {}               # índice do passo -> coordenada absoluta
+        self._start = self._resolve(start_position)
+        self._last = self._start
+        self._decoded = None           # cache da decodificação
+
+    def _resolve(self, node):
+        if isinstance(node, tuple):
+            return node
+        return self._locate(node) if self._locate else None
+
+    # ===============================
+    # Inserção
+    # ===============================
+    def append(self, node):
+        """Registra um passo até o nó (ou coordenada) informado."""
+        coord = self._resolve(node)
+        code = None
+        if coord is not None and self._last is not None:
+            code = _CODIGOS.get((coord[0] - self._last[0], coord[1] - self._last[1]))
+        if code is None:
+            # Movimento não adjacente ou posição desconhecida
+            self._jumps[self._steps] = coord
+            code = 0
+
+        shift = (self._steps & 3) * 2
+        if shift == 0:
+            self._codes.append(code)
+        else:
+            self._codes[-1] |= code << shift
+
+        self._steps += 1
+        self._last = coord
+        self._decoded = None
+
+    # ===============================
+    # Consulta
+    # ===============================
+    def coords(self):
+        """Retorna a lista de (x, y) percorridos (decodificada uma única vez)."""
+        if self._decoded is not None:
+            return self._decoded
+
+        result = []
+        pos = self._start
+        if pos is not None:
+            result.append(pos)
+
+        codes = self._codes
+        jumps = self._jumps
+        for i in range(self._steps):
+            if i in jumps:
+                pos = jumps[i]
+            elif pos is not None:
+                dx, dy = DIRECOES[(codes[i >> 2] >> ((i & 3) * 2)) & 3]
+                pos = (pos[0] + dx, pos[1] + dy)
+            if pos is not None:
+                result.append(pos)
+
+        self._decoded = result
+        return result
+
+    def __iter__(self):
+        return iter(self.coords())
+
+    def __len__(self):
+        return self._steps + 1
+
+    def nbytes(self):
+        """Memória aproximada usada pelos códigos de direção."""
+        return self._codes.buffer_info()[1] * self._codes.itemsize
@@ -0,0 +1,261 @@
+# ===========================================
+# hpa.py — Busca hierárquica (estilo HPA*) para mapas enormes
+# ===========================================
+# O grid é dividido em blocos (clusters) S×S. Em cada borda entre dois
+# blocos vizinhos, cada trecho contínuo de casas livres dos dois lados
+# vira uma "entrada" (uma no meio, ou duas nas pontas se o trecho for
+# longo). O grafo abstrato liga:
+#   - as duas casas de cada entrada (aresta entre blocos);
+#   - as entradas de um mesmo bloco, com o custo do caminho que fica
+#     dentro do bloco (Dijkstra local, pré-calculado).
+#
+# Consulta: início e fim entram temporariamente no grafo abstrato, o A*
+# roda nele (poucos nós) e cada trecho é refinado com uma busca local
+# dentro de um único bloco. Quando uma casa muda, só o bloco dela e os
+# vizinhos são refeitos (rebuild_cluster).
+# ===========================================
+
+from heapq import heappush, heappop
+
+from graph import Graph
+from pathfinding import dijkstra_path, manhattan
+from world import TERRAIN_COSTS
+
+CLUSTER_SIZE = 16
+LONG_ENTRANCE = 6  # trechos a partir deste tamanho ganham duas entradas
+
+
+class ClusterMap:
+    """Abstração em blocos do grid de um World (nós = casas (x, y))."""
+
+    def __init__(self, world, cluster_size=CLUSTER_SIZE):
+        self.world = world
+        self.size = cluster_size
+        self.cols = -(-world.width // cluster_size)
+        self.rows = -(-world.height // cluster_size)
+        self.graph = Graph(verbose=False)
+        self.graph.locate = lambda node: node
+        self.graph.weighted = True  # custos internos: A* ponderado sempre
+        self._borders = {}    # (bloco, bloco vizinho) -> [(casa, casa vizinha)]
+        self._entrances = {}  # bloco -> casas que são entradas
+        self._local = {}      # bloco -> adjacência local (refino das consultas)
+        self.build()
+
+    # ===============================
+    # Grid
+    # ===============================
+    def cluster_of(self, x, y):
+        return x // self.size, y // self.size
+
+    def _bounds(self, cluster):
+        cx, cy = cluster
+        x0, y0 = cx * self.size, cy * self.size
+        return x0, y0, min(x0 + self.size, self.world.width), min(y0 + self.size, self.world.height)
+
+    def _cost(self, x, y):
+        """Custo do terreno da casa (None = parede)."""
+        return TERRAIN_COSTS.get(self.world.map_grid.get(x, y))
+
+    def _cluster_adjacency(self, cluster):
+        """Adjacência local do bloco, guardada para os próximos refinos."""
+        adj = self._local.get(cluster)
+        if adj is None:
+            adj = self._local[cluster] = self._local_adjacency(self._bounds(cluster))
+        return adj
+
+    def _local_adjacency(self, bounds):
+        """{casa: {vizinho: peso}} restrito a um retângulo (peso = maior custo, como no World)."""
+        x0, y0, x1, y1 = bounds
+        grid = self.world.map_grid
+        custos = {}
+        for y in range(y0, y1):
+            row = grid.row_text(y)
+            for x in range(x0, x1):
+                c = TERRAIN_COSTS.get(row[x])
+                if c is not None:
+                    custos[(x, y)] = c
+        adj = {}
+        for (x, y), c in custos.items():
+            viz = adj[(x, y)] = {}
+            for n in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                nc = custos.get(n)
+                if nc is not None:
+                    viz[n] = max(c, nc)
+        return adj
+
+    # ===============================
+    # Construção
+    # ===============================
+    def build(self):
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                if cx + 1 < self.cols:
+                    self._find_border((cx, cy), (cx + 1, cy))
+                if cy + 1 < self.rows:
+                    self._find_border((cx, cy), (cx, cy + 1))
+        for cy in range(self.rows):
+            for cx in range(self.cols):
+                self._link_cluster((cx, cy))
+        for pares in self._borders.values():
+            self._link_border(pares)
+
+    def _neighbor_clusters(self, cluster):
+        cx, cy = cluster
+        for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+            if 0 <= nx < self.cols and 0 <= ny < self.rows:
+                yield nx, ny
+
+    def _find_border(self, a, b):
+        """Entradas da borda entre os blocos vizinhos a e b (a à esquerda/acima de b)."""
+        ax0, ay0, ax1, ay1 = self._bounds(a)
+        if b[0] > a[0]:  # borda vertical: coluna ax1-1 | ax1
+            lados = [((ax1 - 1, y), (ax1, y)) for y in range(ay0, ay1)]
+        else:            # borda horizontal: linha ay1-1 / ay1
+            lados = [((x, ay1 - 1), (x, ay1)) for x in range(ax0, ax1)]
+
+        pares, trecho = [], []
+        for p, q in lados + [(None, None)]:  # sentinela fecha o último trecho
+            if p is not None and self._cost(*p) is not None and self._cost(*q) is not None:
+                trecho.append((p, q))
+                continue
+            if trecho:
+                if len(trecho) >= LONG_ENTRANCE:
+                    pares += [trecho[0], trecho[-1]]
+                else:
+                    pares.append(trecho[len(trecho) // 2])
+                trecho = []
+        self._borders[(a, b)] = pares
+
+        for p, q in pares:
+            self._entrances.setdefault(a, set()).add(p)
+            self._entrances.setdefault(b, set()).add(q)
+
+    def _link_cluster(self, cluster):
+        """Custos entre todas as entradas do bloco, por caminhos internos a ele."""
+        entradas = self._entrances.get(cluster, ())
+        vizinhos = self._cluster_adjacency(cluster).__getitem__
+        arestas = []
+        for e in entradas:
+            dist = self._distances(e, vizinhos)
+            arestas += [(e, f, dist[f]) for f in entradas if f != e and f in dist]
+        self.graph.add_edges_bulk(arestas, vertices=entradas)
+
+    def _link_border(self, pares):
+        for p, q in pares:
+            self.graph.add_edges_bulk([(p, q, max(self._cost(*p), self._cost(*q)))])
+
+    @staticmethod
+    def _distances(origem, vizinhos):
+        """Dijkstra completo a partir de 'origem' (dentro de um bloco)."""
+        dist = {origem: 0}
+        heap = [(0, origem)]
+        while heap:
+            d, atual = heappop(heap)
+            if d > dist[atual]:
+                continue
+            for viz, peso in vizinhos(atual).items():
+                nd = d + peso
+                if nd < dist.get(viz, nd + 1):
+                    dist[viz] = nd
+                    heappush(heap, (nd, viz))
+        return dist
+
+    # ===============================
+    # Atualização incremental
+    # ===============================
+    def rebuild_cluster(self, cluster):
+        """Refaz as entradas do bloco e dos vizinhos depois de uma mudança no grid."""
+        afetados = [cluster] + list(self._neighbor_clusters(cluster))
+
+        # 1. Remove as entradas antigas dos blocos afetados (e suas arestas)
+        self._local.pop(cluster, None)
+        for k in afetados:
+            for node in self._entrances.pop(k, ()):
+                if node in self.graph.adj:
+                    self.graph.remove_vertex(node)
+
+        # 2. Recalcula as bordas do bloco alterado; as demais bordas dos
+        #    vizinhos não mudaram, mas devolvem suas entradas aos blocos
+        bordas = set()
+        for k in afetados:
+            for n in self._neighbor_clusters(k):
+                bordas.add((min(k, n), max(k, n)))
+        for a, b in bordas:
+            if cluster in (a, b):
+                self._find_border(a, b)
+            else:
+                for p, q in self._borders.get((a, b), ()):
+                    self._entrances.setdefault(a, set()).add(p)
+                    self._entrances.setdefault(b, set()).add(q)
+
+        # 3. Custos internos dos blocos afetados + arestas entre blocos
+        for k in afetados:
+            self._link_cluster(k)
+        for borda in bordas:
+            self._link_border(self._borders.get(borda, ()))
+
+    def update_cell(self, x, y):
+        """Avisa que a casa (x, y) mudou (parede aberta, terreno novo...)."""
+        self.rebuild_cluster(self.cluster_of(x, y))
+
+    # ===============================
+    # Consulta
+    # ===============================
+    def find_path(self, start, goal):
+        """Caminho de casas (x, y) de start até goal ([] se não houver)."""
+        if self._cost(*start) is None or self._cost(*goal) is None:
+            return []
+        if start == goal:
+            return [start]
+
+        graph = self.graph
+        temporarios = [c for c in (start, goal) if c not in graph.adj]
+        try:
+            for c in temporarios:
+                self._attach(c)
+            abstrato = graph.astar(start, goal, manhattan(graph.locate, goal))
+        finally:
+            for c in temporarios:
+                graph.remove_vertex(c)
+
+        # Mesmo bloco: o caminho interno pode ser melhor que o abstrato
+        local = []
+        if self.cluster_of(*start) == self.cluster_of(*goal):
+            local = self._local_path(start, goal)
+        if not abstrato:
+            return local
+        caminho = self._refine(abstrato)
+        if local and self._path_cost(local) <= self._path_cost(caminho):
+            return local
+        return caminho
+
+    def _attach(self, cell):
+        """Liga uma casa qualquer às entradas do seu bloco (custos internos)."""
+        cluster = self.cluster_of(*cell)
+        dist = self._distances(cell, self._cluster_adjacency(cluster).__getitem__)
+        self.graph.add_edges_bulk(((cell, e, dist[e]) for e in self._entrances.get(cluster, ())
+                                   if e in dist), vertices=(cell,))
+
+    def _local_path(self, a, b):
+        vizinhos = self._cluster_adjacency(self.cluster_of(*a)).__getitem__
+        caminho, _ = dijkstra_path(a, b, vizinhos, manhattan(lambda n: n, b))
+        return caminho
+
+    def _refine(self, abstrato):
+        """Troca cada aresta abstrata pelo caminho real (busca dentro de um bloco)."""
+        caminho = [abstrato[0]]
+        for a, b in zip(abstrato, abstrato[1:]):
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+                caminho.append(b)  # casas vizinhas (aresta entre blocos)
+            else:
+                caminho.extend(self._local_path(a, b)[1:])
+        return caminho
+
+    def _path_cost(self, caminho):
+        cost = self._cost
+        return sum(max(cost(*a), cost(*b)) for a, b in zip(caminho, caminho[1:]))
+
+    def abstract_size(self):
+        """(nós, arestas) do grafo abstrato."""
+        adj = self.graph.adj
+        return len(adj), sum(len(v) for v in adj.values()) // 2
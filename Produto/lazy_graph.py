@@ -0,0 +1,73 @@
+# ===========================================
+# lazy_graph.py — Grafos de grid com vizinhos calculados sob demanda
+# ===========================================
+# Para mapas enormes (arquivos .lmap de milhares de casas de lado, mundo
+# aberto) montar o dicionário de adjacência inteiro custaria gigabytes.
+# LazyAdjacency imita o {nó: {vizinho: peso}} do Graph, mas calcula os
+# vizinhos de um nó na hora, lendo o grid: só as partes do mapa que as
+# buscas tocam são lidas (e, num arquivo mapeado, trazidas do disco).
+#
+# O peso segue World._build_graph: custo do terreno mais caro das duas
+# casas. 'bounds' (x0, y0, x1, y1) opcional limita as buscas.
+# ===========================================
+
+from graph import Graph
+from world import TERRAIN_COSTS
+
+
+class LazyAdjacency:
+    """
+    Adjacência derivada do grid. locate(nó) -> (x, y), node_at(x, y) ->
+    nó ou None, terrain_at(x, y) -> caractere da casa (dentro do mapa).
+    """
+
+    def __init__(self, locate, node_at, terrain_at, size=None):
+        self.locate = locate
+        self.node_at = node_at
+        self.terrain_at = terrain_at
+        self.size = size      # (largura, altura) ou None para mapa sem borda
+        self.bounds = None
+
+    def _inside(self, x, y):
+        if self.size is not None and not (0 <= x < self.size[0] and 0 <= y < self.size[1]):
+            return False
+        b = self.bounds
+        return b is None or (b[0] <= x < b[2] and b[1] <= y < b[3])
+
+    def __contains__(self, node):
+        pos = self.locate(node)
+        return pos is not None and self._inside(*pos) and self.terrain_at(*pos) in TERRAIN_COSTS
+
+    def __getitem__(self, node):
+        x, y = self.locate(node)
+        terrain_at, node_at = self.terrain_at, self.node_at
+        custo = TERRAIN_COSTS[terrain_at(x, y)]
+        vizinhos = {}
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if self._inside(nx, ny):
+                c = TERRAIN_COSTS.get(terrain_at(nx, ny))
+                if c is not None:
+                    vizinhos[node_at(nx, ny)] = max(custo, c)
+        return vizinhos
+
+    def get(self, node, default=None):
+        return self[node] if node in self else default
+
+
+class GridGraph(Graph):
+    """
+    Graph somente leitura sobre um grid: as buscas do Graph (bfs, astar,
+    dijkstra, path_to...) funcionam sem montar a adjacência inteira.
+    Percorrer todos os nós (show, componentes, gargalos) não é suportado.
+    """
+
+    def __init__(self, adjacency, weighted=True, verbose=False):
+        super().__init__(verbose=verbose)
+        self.adj = adjacency
+        self.weighted = weighted
+        self.locate = adjacency.locate
+
+    def _read_only(self, *args, **kwargs):
+        raise ValueError("Grafo derivado do grid: altere o mapa (set_cell), não as arestas.")
+
+    add_vertex = add_edge = add_edges_bulk = remove_vertex = remove_edge = _read_only
@@ -0,0 +1,182 @@
+# ===========================================
+# map_io.py — Importar / exportar mapas
+# ===========================================
+# Dois formatos, escolhidos pela extensão do arquivo:
+#
+#   texto (.txt, .map) — fases feitas à mão: uma linha por fileira do
+#       grid, com os mesmos caracteres do World ("#", ".", "P", "E", "B",
+#       ",", "=", "~"). Linhas em branco e linhas começando com ";" são
+#       comentários.
+#
+#   binário (.lmap) — mapas grandes: os W×H bytes do grid (linha a linha),
+#       o índice das salas e um rodapé de 12 bytes: b"LMP2" + largura +
+#       altura. O índice (casas da Entrada, do Portão e de cada baú, mais
+#       "tem terreno") é escrito ao salvar; ao abrir, World usa o índice e
+#       não varre o mapa. Com os bytes do grid no deslocamento 0, o arquivo
+#       vira Grid.data por mmap: o sistema só lê do disco as páginas que a
+#       câmera e as buscas tocarem (um mapa 4000×4000 abre na hora).
+#       Arquivos antigos (rodapé b"LMAP", sem índice) ainda abrem, mas as
+#       salas saem de uma varredura do arquivo inteiro.
+#
+#   Inteiros do formato binário: uint32 little-endian.
+#
+# World.from_file(caminho) monta um World a partir de qualquer formato.
+# ===========================================
+
+import mmap
+import os
+import struct
+
+from grid import Grid
+from world import TERRAIN_CHANCES, TERRAIN_COSTS
+
+BINARY_EXT = ".lmap"
+_TRAILER = struct.Struct("<4sII")        # assinatura, largura, altura
+_INDEX = struct.Struct("<IIIB")          # Entrada, Portão, nº de baús, tem terreno
+_MAGIC = b"LMP2"
+_MAGIC_V1 = b"LMAP"                      # versão sem índice
+VALID_CELLS = set(TERRAIN_COSTS) | {"#"}
+ROOM_CELLS = ("P", "E", "B")
+
+
+# ===============================
+# Validação
+# ===============================
+def _check_rooms(rooms):
+    for char, nome in (("P", "Entrada"), ("E", "Portão")):
+        if len(rooms[char]) != 1:
+            raise ValueError(f"O mapa precisa de exatamente uma casa '{char}' ({nome}); achei {len(rooms[char])}.")
+    if not rooms["B"]:
+        raise ValueError("O mapa precisa de pelo menos um baú 'B' (um deles guarda a Chave).")
+
+
+def validate(grid, check_cells=True):
+    """
+    Levanta ValueError se o mapa não tiver exatamente uma Entrada (P), um
+    Portão (E) e ao menos um baú (B). Lê o mapa inteiro.
+    """
+    _check_rooms({char: grid.find_all(char) for char in ROOM_CELLS})
+    if check_cells:
+        invalidos = set(grid.tobytes().decode("latin-1")) - VALID_CELLS
+        if invalidos:
+            raise ValueError(f"Caracteres inválidos no mapa: {''.join(sorted(invalidos))!r}")
+    return grid
+
+
+# ===============================
+# Texto
+# ===============================
+def parse_text(text):
+    linhas = [linha.rstrip("\r\n") for linha in text.splitlines()]
+    linhas = [linha for linha in linhas if linha.strip() and not linha.startswith(";")]
+    if not linhas:
+        raise ValueError("Mapa vazio.")
+    return validate(Grid.from_rows(linhas))
+
+
+def format_text(grid):
+    return "\n".join(grid.row_text(y) for y in range(grid.height)) + "\n"
+
+
+# ===============================
+# Índice das salas
+# ===============================
+# {"rooms": {"P": [(x, y)], "E": [(x, y)], "B": [(x, y), ...]}, "terrain": bool},
+# baús em ordem de linha (a mesma de Grid.find_all). World(index=...) o usa
+# no lugar de varrer o mapa atrás das salas e do terreno.
+def build_index(grid):
+    """Índice de um mapa já validado (lê o mapa inteiro)."""
+    return {
+        "rooms": {char: grid.find_all(char) for char in ROOM_CELLS},
+        "terrain": any(grid.data.find(c.encode()) != -1 for c, _ in TERRAIN_CHANCES),
+    }
+
+
+def _check_index(grid, index, path):
+    """Confere as casas apontadas pelo índice (só as páginas delas são lidas)."""
+    _check_rooms(index["rooms"])
+    for char, casas in index["rooms"].items():
+        for x, y in casas:
+            if not (0 <= y < grid.height) or grid.get(x, y) != char:
+                raise ValueError(f"{path}: índice aponta '{char}' em ({x}, {y}), que não é '{char}'.")
+    return index
+
+
+# ===============================
+# Binário (mmap)
+# ===============================
+def save_binary(grid, path):
+    validate(grid)
+    index = build_index(grid)
+    salas = index["rooms"]
+    w = grid.width
+    entrada, portao = (y * w + x for x, y in (salas["P"][0], salas["E"][0]))
+    baus = [y * w + x for x, y in salas["B"]]
+    with open(path, "wb") as f:
+        f.write(grid.view())
+        f.write(struct.pack(f"<{len(baus)}I", *baus))
+        f.write(_INDEX.pack(entrada, portao, len(baus), index["terrain"]))
+        f.write(_TRAILER.pack(_MAGIC, grid.width, grid.height))
+
+
+def load_binary(path, writable=False):
+    """
+    (Grid, índice). O 'data' do Grid é um mmap do arquivo: só o rodapé, o
+    índice e as casas das salas são lidos agora. Arquivos sem índice
+    (versão antiga) são varridos inteiros atrás das salas (índice None).
+    Com writable=False as edições (set_cell) ficam só na memória
+    (ACCESS_COPY); com True, vão para o arquivo.
+    """
+    with open(path, "r+b" if writable else "rb") as f:
+        tamanho = os.fstat(f.fileno()).st_size
+        if tamanho < _TRAILER.size:
+            raise ValueError(f"{path}: arquivo curto demais para um mapa binário.")
+        f.seek(tamanho - _TRAILER.size)
+        magic, width, height = _TRAILER.unpack(f.read(_TRAILER.size))
+        casas = width * height
+        raw = None
+        if magic == _MAGIC and tamanho >= casas + _INDEX.size + _TRAILER.size:
+            f.seek(tamanho - _TRAILER.size - _INDEX.size)
+            entrada, portao, n_baus, terreno = _INDEX.unpack(f.read(_INDEX.size))
+            if casas + 4 * n_baus + _INDEX.size + _TRAILER.size == tamanho:
+                f.seek(casas)
+                raw = struct.unpack(f"<{n_baus}I", f.read(4 * n_baus))
+        elif magic == _MAGIC_V1 and casas + _TRAILER.size == tamanho:
+            raw = ()
+        if raw is None:
+            raise ValueError(f"{path}: não é um mapa {BINARY_EXT} válido.")
+        acesso = mmap.ACCESS_WRITE if writable else mmap.ACCESS_COPY
+        data = mmap.mmap(f.fileno(), casas, access=acesso)
+    grid = Grid(width, height, data=data)
+    if magic == _MAGIC_V1:
+        # Sem índice: acha as salas lendo o arquivo todo (checar cada casa, não)
+        return validate(grid, check_cells=False), None
+    coord = lambda i: (i % width, i // width)
+    index = {
+        "rooms": {"P": [coord(entrada)], "E": [coord(portao)], "B": [coord(i) for i in raw]},
+        "terrain": bool(terreno),
+    }
+    return grid, _check_index(grid, index, path)
+
+
+# ===============================
+# Entrada única
+# ===============================
+def load_level(path):
+    """(Grid, índice ou None) de um arquivo de mapa em qualquer formato."""
+    if path.endswith(BINARY_EXT):
+        return load_binary(path)
+    with open(path, encoding="utf-8") as f:
+        return parse_text(f.read()), None
+
+
+def load_map(path):
+    return load_level(path)[0]
+
+
+def save_map(grid, path):
+    if path.endswith(BINARY_EXT):
+        save_binary(grid, path)
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(format_text(grid))
@@ -0,0 +1,292 @@
+# ===========================================
+# open_world.py — Mundo aberto em blocos gerados sob demanda
+# ===========================================
+# O mapa não tem borda: é dividido em blocos (chunks) C×C gerados só
+# quando alguém (jogador, câmera, busca) encosta neles. Cada bloco sai de
+# um Random semeado por (seed, cx, cy), então o mesmo bloco é sempre o
+# mesmo, em qualquer ordem de visita.
+#
+# Memória limitada: só os MAX_CHUNKS blocos usados mais recentemente
+# ficam em memória (LRU). Um bloco descartado é gerado de novo ao voltar;
+# casas editadas (set_cell) ficam num dicionário pequeno por bloco e são
+# reaplicadas depois da geração.
+#
+# Conectividade: a linha e a coluna do meio de cada bloco nunca têm
+# parede, formando estradas que ligam todos os blocos entre si.
+#
+# Salas (mesmas regras de World): a Entrada fica no cruzamento do bloco
+# (0, 0), o Portão no cruzamento de um bloco a EXIT_DISTANCE blocos dali e
+# a Chave num baú do bloco oposto. Os demais blocos têm um baú com chance
+# CHEST_CHANCE, sempre numa estrada. A posição e o conteúdo de cada baú
+# saem de (seed, cx, cy), sem gerar o bloco; só os baús abertos são
+# guardados.
+#
+# ChunkGraph é um GridGraph (lazy_graph.py): vizinhos calculados na hora
+# a partir do grid, atravessando bordas de bloco, então as buscas do
+# Graph (bfs, astar, dijkstra...) funcionam sem montar o grafo inteiro,
+# cada uma presa a uma janela de blocos em volta de início e destino.
+# ===========================================
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from lazy_graph import GridGraph, LazyAdjacency
+from world import EDITABLE_CELLS, ITEM_POOL, TERRAIN_CHANCES, TERRAIN_COSTS
+import profiler
+import random
+
+CHUNK_SIZE = 32
+MAX_CHUNKS = 64      # blocos mantidos em memória
+WALL_CHANCE = 0.25   # mesma densidade de World
+SEARCH_MARGIN = 2    # blocos além do retângulo start/goal que as buscas podem usar
+CHEST_CHANCE = 0.35  # chance de um bloco ter baú
+EXIT_DISTANCE = 3    # blocos entre a Entrada e o Portão (e entre a Entrada e a Chave)
+
+
+class ChunkedWorld:
+    """Mapa infinito em blocos determinísticos com cache LRU."""
+
+    def __init__(self, seed=0, chunk_size=CHUNK_SIZE, max_chunks=MAX_CHUNKS, terrain=False):
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.terrain = terrain
+        self._chunks = OrderedDict()  # (cx, cy) -> linhas do bloco (listas de caracteres)
+        self._edits = {}              # (cx, cy) -> {(lx, ly): caractere}
+        self.generated = 0            # blocos gerados (inclui regerações)
+        self.evicted = 0
+        self.opened = set()           # casas dos baús já abertos
+        self._place_rooms()
+        self.graph = ChunkGraph(self)
+
+    # ===============================
+    # Blocos
+    # ===============================
+    def chunk_of(self, x, y):
+        return x // self.chunk_size, y // self.chunk_size
+
+    def chunk(self, cx, cy):
+        """Linhas do bloco (cx, cy), gerando-o se não estiver em memória."""
+        key = (cx, cy)
+        rows = self._chunks.get(key)
+        if rows is not None:
+            self._chunks.move_to_end(key)
+            return rows
+        rows = self._generate(cx, cy)
+        self._chunks[key] = rows
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+            self.evicted += 1
+            if profiler.ENABLED:
+                profiler.count("open_world.evictions")
+        return rows
+
+    def _generate(self, cx, cy):
+        """Gera o bloco só a partir de (seed, cx, cy) e reaplica as edições."""
+        with profiler.section("open_world.generate_chunk"):
+            size = self.chunk_size
+            meio = size // 2
+            rng = random.Random(f"{self.seed}:{cx}:{cy}")
+            rows = []
+            for ly in range(size):
+                row = []
+                for lx in range(size):
+                    if lx == meio or ly == meio:
+                        row.append(".")  # estradas entre blocos
+                    elif rng.random() < WALL_CHANCE:
+                        row.append("#")
+                    else:
+                        row.append(self._terrain(rng))
+                rows.append(row)
+            for (lx, ly), char in self._edits.get((cx, cy), {}).items():
+                rows[ly][lx] = char
+        self.generated += 1
+        return rows
+
+    def _terrain(self, rng):
+        if not self.terrain:
+            return "."
+        r = rng.random()
+        for char, chance in TERRAIN_CHANCES:
+            if r < chance:
+                return char
+            r -= chance
+        return "."
+
+    def loaded_chunks(self):
+        return list(self._chunks)
+
+    def visit(self, x, y, radius=1):
+        """Garante em memória os blocos em volta de (x, y) (chamado ao andar)."""
+        cx, cy = self.chunk_of(x, y)
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                self.chunk(cx + dx, cy + dy)
+        self.chunk(cx, cy)  # o bloco atual fica como o mais recente
+
+    def visit_area(self, x0, y0, x1, y1):
+        """Garante em memória os blocos que cobrem as casas [x0, x1) × [y0, y1) (câmera)."""
+        c = self.chunk_size
+        for cy in range(y0 // c, (y1 - 1) // c + 1):
+            for cx in range(x0 // c, (x1 - 1) // c + 1):
+                self.chunk(cx, cy)
+
+    # ===============================
+    # Salas: Entrada, Portão e baús
+    # ===============================
+    def _place_rooms(self):
+        c, meio = self.chunk_size, self.chunk_size // 2
+        rng = random.Random(f"{self.seed}:salas")
+        d = EXIT_DISTANCE
+        borda = [(dx, dy) for dy in range(-d, d + 1) for dx in range(-d, d + 1)
+                 if max(abs(dx), abs(dy)) == d]
+        ex, ey = rng.choice(borda)
+        self.exit_chunk = (ex, ey)
+        self.key_chunk = (-ex, -ey)   # Chave do lado oposto ao Portão
+        self.start_node = (meio, meio)
+        self.exit_node = (ex * c + meio, ey * c + meio)
+
+    def chest_in(self, cx, cy):
+        """Baú do bloco (cx, cy): ((x, y), conteúdo), ou None se não houver."""
+        if (cx, cy) in ((0, 0), self.exit_chunk):
+            return None
+        rng = random.Random(f"{self.seed}:{cx}:{cy}:bau")
+        chave = (cx, cy) == self.key_chunk
+        if rng.random() >= CHEST_CHANCE and not chave:
+            return None
+        c, meio = self.chunk_size, self.chunk_size // 2
+        lx = rng.choice([i for i in range(c) if i != meio])  # fora do cruzamento
+        local = (lx, meio) if rng.random() < 0.5 else (meio, lx)
+        conteudo = "Chave" if chave else rng.choice(ITEM_POOL)
+        return (cx * c + local[0], cy * c + local[1]), conteudo
+
+    def chest_at(self, x, y):
+        """Conteúdo do baú fechado em (x, y), ou None."""
+        bau = self.chest_in(*self.chunk_of(x, y))
+        if bau is None or bau[0] != (x, y) or bau[0] in self.opened:
+            return None
+        return bau[1]
+
+    def is_room(self, x, y):
+        bau = self.chest_in(*self.chunk_of(x, y))
+        return (x, y) in (self.start_node, self.exit_node) or (bau is not None and bau[0] == (x, y))
+
+    def check_event(self, player):
+        """Mesmas regras de World.check_event: baús dão itens, o Portão pede a Chave."""
+        pos = player.position
+        conteudo = self.chest_at(*pos)
+        if conteudo is not None:
+            self.opened.add(pos)
+            if conteudo == "Chave":
+                player.open_chest("Chave", "Abre o portão final")
+                return False, "Você encontrou a CHAVE!"
+            player.open_chest(conteudo, "Item encontrado.")
+            return False, f"Você encontrou: {conteudo}"
+
+        if pos == self.exit_node:
+            if player.has_item("Chave"):
+                return True, "🏆 Você usou a chave e escapou!"
+            return False, "Você precisa da CHAVE para abrir o portão."
+
+        return False, None
+
+    # ===============================
+    # Casas
+    # ===============================
+    def cell(self, x, y):
+        size = self.chunk_size
+        return self.chunk(x // size, y // size)[y % size][x % size]
+
+    def is_walkable(self, x, y):
+        return self.cell(x, y) != "#"
+
+    def set_cell(self, x, y, char):
+        """Troca uma casa; a edição sobrevive ao descarte do bloco."""
+        if self.is_room(x, y):
+            raise ValueError(f"A casa ({x}, {y}) é uma sala e não pode ser alterada.")
+        if char not in EDITABLE_CELLS:
+            raise ValueError(f"Tipo de casa inválido para set_cell: {char!r} "
+                             f"(use um de {''.join(sorted(EDITABLE_CELLS))!r}).")
+        size = self.chunk_size
+        key, local = (x // size, y // size), (x % size, y % size)
+        self._edits.setdefault(key, {})[local] = char
+        self.chunk(*key)[local[1]][local[0]] = char
+        self.graph._invalidate_paths()
+        if TERRAIN_COSTS.get(char, 1) != 1:
+            self.graph.weighted = True  # buscas passam a considerar o custo
+
+    # ===============================
+    # Conversão nó <-> coordenada (mesma interface de World)
+    # ===============================
+    def coord_of(self, node):
+        return node
+
+    def node_at(self, x, y):
+        return (x, y) if self.is_walkable(x, y) else None
+
+    def node_name(self, node):
+        """Nome de exibição: "Entrada", "Portão", "Bau_cx_cy" ou "Nx_y"."""
+        x, y = node
+        if node == self.start_node:
+            return "Entrada"
+        if node == self.exit_node:
+            return "Portão"
+        cx, cy = self.chunk_of(x, y)
+        bau = self.chest_in(cx, cy)
+        if bau is not None and bau[0] == node:
+            return f"Bau_{cx}_{cy}"
+        return f"N{x}_{y}"
+
+
+class ChunkGraph(GridGraph):
+    """
+    Graph sobre um ChunkedWorld: vizinhos resolvidos entre blocos, sob
+    demanda. Toda busca entre dois pontos fica numa janela (_bounded); o
+    que percorreria o mapa inteiro (árvores de distância, DFS) é recusado.
+    """
+
+    def __init__(self, world, verbose=False):
+        adjacency = LazyAdjacency(world.coord_of, lambda x, y: (x, y), world.cell)
+        super().__init__(adjacency, weighted=world.terrain, verbose=verbose)
+        self.world = world
+        self._window = None  # janela dos caminhos guardados no cache do Graph
+
+    @contextmanager
+    def _bounded(self, start, goal):
+        """
+        Limita as buscas aos blocos do retângulo start/goal mais
+        SEARCH_MARGIN blocos de folga (a busca não se perde no infinito).
+        A janela anda de bloco em bloco: enquanto start e goal ficam nos
+        mesmos blocos ela não muda e os caminhos guardados continuam valendo.
+        """
+        c = self.world.chunk_size
+        (sx, sy), (gx, gy) = start, goal
+        janela = ((min(sx, gx) // c - SEARCH_MARGIN) * c, (min(sy, gy) // c - SEARCH_MARGIN) * c,
+                  (max(sx, gx) // c + SEARCH_MARGIN + 1) * c, (max(sy, gy) // c + SEARCH_MARGIN + 1) * c)
+        if janela != self._window:
+            self._invalidate_paths()  # caminhos guardados valiam para outra janela
+            self._window = janela
+        anterior = self.adj.bounds
+        self.adj.bounds = janela
+        try:
+            yield
+        finally:
+            self.adj.bounds = anterior
+
+    def shortest_path(self, start, goal, method=None):
+        with self._bounded(start, goal):
+            return super().shortest_path(start, goal, method or "astar")
+
+    def bfs(self, start, goal):
+        with self._bounded(start, goal):
+            return super().bfs(start, goal)
+
+    def _search(self, method, start, goal, heuristic=None):
+        # astar, dijkstra e bidirectional_bfs passam por aqui
+        with self._bounded(start, goal):
+            return super()._search(method, start, goal, heuristic)
+
+    def _unbounded(self, *args, **kwargs):
+        raise ValueError("Mundo aberto não tem borda: use buscas entre dois pontos (shortest_path, astar...).")
+
+    distances_to = path_to = iter_dfs = dfs = _unbounded
@@ -0,0 +1,96 @@
+# ===========================================
+# parallel.py — Execução paralela (todos os núcleos)
+# ===========================================
+# Distribui geração de mundos + simulação (ou avaliação da dica H) entre
+# processos com ProcessPoolExecutor. Cada tarefa recebe uma seed
+# determinística (seed_base + índice), então o resultado de uma seed é o
+# mesmo em execução serial ou paralela. Os resultados voltam em blocos
+# (chunks) assim que ficam prontos, sem esperar o lote inteiro.
+# ===========================================
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from simulation import simulate_game, evaluate_hint, summarize
+
+# Tarefas disponíveis (precisam ser funções de módulo para o pickle)
+TASKS = ("simular", "dica")
+
+
+def seed_for(base_seed, index):
+    """Seed determinística da tarefa 'index'."""
+    return base_seed + index
+
+
+def _run_chunk(task, seeds, policy, max_steps):
+    """Executado no processo filho: roda um bloco de seeds."""
+    if task == "simular":
+        return [simulate_game(policy, s, max_steps) for s in seeds]
+    if task == "dica":
+        return [evaluate_hint(s) for s in seeds]
+    raise ValueError(f"Tarefa desconhecida: {task}")
+
+
+def run_parallel(n_tasks, task="simular", policy="rota", base_seed=0,
+                 chunk_size=256, workers=None, max_steps=10000):
+    """
+    Gera (índice_do_chunk, resultados) à medida que cada bloco termina.
+    Mantém no máximo 2 blocos por processo em voo para limitar a memória.
+    """
+    if task not in TASKS:
+        raise ValueError(f"Tarefa desconhecida: {task}")
+    workers = workers or os.cpu_count() or 1
+
+    chunks = []
+    for inicio in range(0, n_tasks, chunk_size):
+        fim = min(inicio + chunk_size, n_tasks)
+        chunks.append([seed_for(base_seed, i) for i in range(inicio, fim)])
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pendentes = {}
+        proximo = 0
+        while proximo < len(chunks) or pendentes:
+            while proximo < len(chunks) and len(pendentes) < workers * 2:
+                fut = pool.submit(_run_chunk, task, chunks[proximo], policy, max_steps)
+                pendentes[fut] = proximo
+                proximo += 1
+
+            prontos, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+            for fut in prontos:
+                yield pendentes.pop(fut), fut.result()
+
+
+def run_parallel_batch(n_tasks, task="simular", policy="rota", base_seed=0,
+                       chunk_size=256, workers=None, max_steps=10000):
+    """Versão agregada de run_parallel: junta todos os blocos e resume."""
+    inicio = time.perf_counter()
+    resultados = []
+    for _, bloco in run_parallel(n_tasks, task, policy, base_seed,
+                                 chunk_size, workers, max_steps):
+        resultados.extend(bloco)
+    elapsed = time.perf_counter() - inicio
+
+    if task == "simular":
+        return summarize(resultados, elapsed)
+
+    n = len(resultados)
+    ratios = [r["ratio"] for r in resultados]
+    return {
+        "maps": n,
+        "ratio_mean": sum(ratios) / n if n else 0.0,
+        "ratio_max": max(ratios) if n else 0.0,
+        "optimal_hits": sum(1 for r in ratios if r <= 1.0),
+        "maps_per_second": n / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+if __name__ == "__main__":
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    tarefa = sys.argv[2] if len(sys.argv) > 2 else "dica"
+    stats = run_parallel_batch(n, tarefa)
+    print(f"[PARALELO] {tarefa} ({os.cpu_count()} núcleos):")
+    for chave, valor in stats.items():
+        print(f"  {chave}: {valor}")
@@ -0,0 +1,295 @@
+# ===========================================
+# pathfinding.py — Buscas de caminho genéricas
+# ===========================================
+# As funções recebem só uma função de vizinhos, então servem tanto para o
+# Graph (graph.get_neighbors) quanto direto sobre o grid do mapa
+# (World._is_solvable) sem montar grafo.
+#
+# Todas devolvem (caminho, expandidos): caminho = lista de nós de start
+# até goal ([] se não houver) e expandidos = nós retirados da fronteira,
+# usado no profiler e no benchmark.
+#
+#   "bfs"    -> busca em largura comum
+#   "astar"  -> A* com heurística (Manhattan pelas coordenadas do nó)
+#   "bidir"  -> BFS bidirecional (grafo não direcionado)
+#   "dijkstra" -> custo mínimo com pesos; neighbors(n) -> {vizinho: peso}
+#                 (com heurística admissível, o mesmo código é o A* ponderado)
+#
+# jump_point_path (Jump Point Search, 4 direções) fica fora de SEARCHES:
+# ela precisa do grid (walkable(x, y)) e não de uma função de vizinhos.
+# ===========================================
+
+from collections import deque
+from heapq import heappush, heappop
+
+
+def _rebuild(pais, node):
+    caminho = []
+    while node is not None:
+        caminho.append(node)
+        node = pais[node]
+    caminho.reverse()
+    return caminho
+
+
+# ===============================
+# Heurísticas
+# ===============================
+def manhattan(locate, goal):
+    """Heurística h(n) = |dx| + |dy| até 'goal'; locate converte nó -> (x, y)."""
+    gx, gy = locate(goal)
+
+    def h(node):
+        x, y = locate(node)
+        return abs(x - gx) + abs(y - gy)
+    return h
+
+
+def zero_heuristic(node):
+    return 0
+
+
+# ===============================
+# Buscas
+# ===============================
+def bfs_path(start, goal, neighbors, heuristic=None):
+    """BFS com ponteiros para o pai (heuristic é ignorada)."""
+    pais = {start: None}
+    fila = deque([start])
+    expandidos = 0
+    while fila:
+        atual = fila.popleft()
+        expandidos += 1
+        if atual == goal:
+            return _rebuild(pais, atual), expandidos
+        for viz in neighbors(atual):
+            if viz not in pais:
+                pais[viz] = atual
+                fila.append(viz)
+    return [], expandidos
+
+
+def astar_path(start, goal, neighbors, heuristic=None):
+    """
+    A* com custo 1 por aresta. Sem decrease-key: entradas velhas do heap
+    são puladas ao sair. Empates em f preferem o nó mais perto do alvo.
+    """
+    h = heuristic or zero_heuristic
+    pais = {start: None}
+    custo = {start: 0}
+    fechados = set()
+    heap = [(h(start), 0, 0, start)]
+    ordem = 1  # desempate final (nós nem sempre são comparáveis)
+    expandidos = 0
+    while heap:
+        _, _, _, atual = heappop(heap)
+        if atual in fechados:
+            continue
+        fechados.add(atual)
+        expandidos += 1
+        if atual == goal:
+            return _rebuild(pais, atual), expandidos
+        g = custo[atual] + 1
+        for viz in neighbors(atual):
+            if viz in fechados or g >= custo.get(viz, g + 1):
+                continue
+            custo[viz] = g
+            pais[viz] = atual
+            hv = h(viz)
+            heappush(heap, (g + hv, hv, ordem, viz))
+            ordem += 1
+    return [], expandidos
+
+
+def bidirectional_bfs_path(start, goal, neighbors, heuristic=None):
+    """
+    BFS pelos dois lados, sempre expandindo a camada da fronteira menor.
+    Ao fim da camada em que os lados se encontram, fica o encontro com
+    menor distância total (o primeiro encontro nem sempre é o melhor).
+    """
+    if start == goal:
+        return [start], 1
+    pais_a, pais_b = {start: None}, {goal: None}
+    dist_a, dist_b = {start: 0}, {goal: 0}
+    fronteira_a, fronteira_b = [start], [goal]
+    expandidos = 0
+
+    while fronteira_a and fronteira_b:
+        # Expande o lado com menos nós na fronteira
+        trocado = len(fronteira_a) > len(fronteira_b)
+        if trocado:
+            fronteira_a, fronteira_b = fronteira_b, fronteira_a
+            pais_a, pais_b = pais_b, pais_a
+            dist_a, dist_b = dist_b, dist_a
+
+        melhor, encontro = None, None
+        proxima = []
+        for atual in fronteira_a:
+            expandidos += 1
+            d = dist_a[atual] + 1
+            for viz in neighbors(atual):
+                if viz not in pais_a:
+                    pais_a[viz] = atual
+                    dist_a[viz] = d
+                    proxima.append(viz)
+                if viz in dist_b:
+                    total = dist_a[atual] + 1 + dist_b[viz]
+                    if melhor is None or total < melhor:
+                        melhor, encontro = total, (atual, viz)
+        fronteira_a = proxima
+
+        if trocado:  # desfaz a troca: "a" volta a ser o lado do start
+            fronteira_a, fronteira_b = fronteira_b, fronteira_a
+            pais_a, pais_b = pais_b, pais_a
+            dist_a, dist_b = dist_b, dist_a
+
+        if encontro is not None:
+            lado, outro = encontro
+            if trocado:  # a aresta foi achada pelo lado do goal
+                lado, outro = outro, lado
+            # start ... lado  +  outro ... goal
+            caminho = _rebuild(pais_a, lado)
+            node = outro
+            while node is not None:
+                caminho.append(node)
+                node = pais_b[node]
+            return caminho, expandidos
+
+    return [], expandidos
+
+
+def dijkstra_path(start, goal, neighbors, heuristic=None):
+    """
+    Dijkstra com heap e sem decrease-key: cada melhora empilha uma entrada
+    nova (f, ordem, g, nó) e, ao sair do heap, entradas com g maior que a
+    melhor distância conhecida são puladas. Não precisa de conjunto de
+    fechados nem de índice no heap. Com heurística consistente vira A*.
+    """
+    h = heuristic
+    dist = {start: 0}
+    pais = {start: None}
+    heap = [(h(start) if h else 0, 0, 0, start)]
+    push, pop, get = heappush, heappop, dist.get  # nomes locais: laço quente
+    ordem = 1
+    expandidos = 0
+    while heap:
+        _, _, g, atual = pop(heap)
+        if g > dist[atual]:
+            continue  # entrada velha: o nó já saiu com custo menor
+        expandidos += 1
+        if atual == goal:
+            return _rebuild(pais, atual), expandidos
+        for viz, peso in neighbors(atual).items():
+            ng = g + peso
+            antigo = get(viz)
+            if antigo is None or ng < antigo:
+                dist[viz] = ng
+                pais[viz] = atual
+                push(heap, (ng + h(viz) if h else ng, ordem, ng, viz))
+                ordem += 1
+    return [], expandidos
+
+
+# ===============================
+# Jump Point Search (grid 4-conectado, custo uniforme)
+# ===============================
+def _jump(x, y, dx, dy, goal, walkable):
+    """
+    Anda de (x, y) na direção (dx, dy) até achar um ponto de salto: o
+    alvo, uma casa com vizinho forçado (aberto ao lado de uma parede que
+    acabou de ficar para trás) ou, andando na vertical, uma casa de onde
+    uma sondagem horizontal acha um ponto de salto. None = bateu na parede.
+    Devolve também quantas casas foram percorridas.
+    """
+    passos = 0
+    while True:
+        x += dx
+        y += dy
+        passos += 1
+        if not walkable(x, y):
+            return None, passos
+        if (x, y) == goal:
+            return (x, y), passos
+        if dx:
+            if (walkable(x, y - 1) and not walkable(x - dx, y - 1)) or \
+               (walkable(x, y + 1) and not walkable(x - dx, y + 1)):
+                return (x, y), passos
+        else:
+            if (walkable(x - 1, y) and not walkable(x - 1, y - dy)) or \
+               (walkable(x + 1, y) and not walkable(x + 1, y - dy)):
+                return (x, y), passos
+            for sx in (1, -1):
+                ponto, n = _jump(x, y, sx, 0, goal, walkable)
+                passos += n
+                if ponto is not None:
+                    return (x, y), passos
+
+
+def jump_point_path(start, goal, walkable):
+    """
+    JPS 4-conectada: A* que só empilha pontos de salto. Em áreas abertas
+    pula as casas equivalentes que BFS / A* expandiriam uma a uma. Nós são
+    (x, y); walkable(x, y) diz se a casa é livre (fora do mapa = False).
+    Devolve (caminho casa a casa, expandidos) — expandidos conta os pontos
+    de salto retirados do heap.
+    """
+    if not walkable(*start) or not walkable(*goal):
+        return [], 0
+    gx, gy = goal
+    pais = {start: None}
+    dist = {start: 0}
+    heap = [(abs(start[0] - gx) + abs(start[1] - gy), 0, 0, 0, start)]
+    ordem = 1
+    expandidos = 0
+    while heap:
+        _, _, _, g, atual = heappop(heap)
+        if g > dist[atual]:
+            continue
+        expandidos += 1
+        if atual == goal:
+            return _interpolate(_rebuild(pais, atual)), expandidos
+
+        # Direções podadas: só "para a frente" e para os lados (4-conectado)
+        x, y = atual
+        pai = pais[atual]
+        if pai is None:
+            direcoes = ((1, 0), (-1, 0), (0, 1), (0, -1))
+        else:
+            dx = (x > pai[0]) - (x < pai[0])
+            dy = (y > pai[1]) - (y < pai[1])
+            direcoes = ((dx, 0), (0, 1), (0, -1)) if dx else ((0, dy), (1, 0), (-1, 0))
+
+        for dx, dy in direcoes:
+            ponto, _ = _jump(x, y, dx, dy, goal, walkable)
+            if ponto is None:
+                continue
+            ng = g + abs(ponto[0] - x) + abs(ponto[1] - y)
+            antigo = dist.get(ponto)
+            if antigo is None or ng < antigo:
+                dist[ponto] = ng
+                pais[ponto] = atual
+                hv = abs(ponto[0] - gx) + abs(ponto[1] - gy)
+                heappush(heap, (ng + hv, hv, ordem, ng, ponto))  # empate em f: mais perto do alvo
+                ordem += 1
+    return [], expandidos
+
+
+def _interpolate(pontos):
+    """Preenche as casas entre pontos de salto consecutivos (sempre em linha reta)."""
+    caminho = pontos[:1]
+    for (ax, ay), (bx, by) in zip(pontos, pontos[1:]):
+        dx = (bx > ax) - (bx < ax)
+        dy = (by > ay) - (by < ay)
+        while (ax, ay) != (bx, by):
+            ax += dx
+            ay += dy
+            caminho.append((ax, ay))
+    return caminho
+
+
+SEARCHES = {
+    "bfs": bfs_path,
+    "astar": astar_path,
+    "bidir": bidirectional_bfs_path,
+    "dijkstra": dijkstra_path,
+}
@@ -0,0 +1,162 @@
+# ===========================================
+# profiler.py — Instrumentação opcional dos pontos críticos
+# ===========================================
+# Contadores e histogramas (tempo ou valor) para geração do mundo, grafo,
+# BFS, rota de coleta, AVL e renderização. Desligado por padrão: os pontos
+# instrumentados testam profiler.ENABLED antes de qualquer trabalho, e
+# section() devolve um contexto vazio compartilhado, então o custo com o
+# profiler desligado é só um teste de booleano.
+#
+# Exportação: export_json / export_csv. Overlay no jogo: tecla F3.
+# ===========================================
+
+import csv
+import json
+import os
+import time
+from bisect import bisect_left
+
+ENABLED = False
+
+# Limites dos baldes (segundos) para tempos e (unidades) para valores
+TIME_BUCKETS = (1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 1e-1)
+VALUE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384)
+
+_counters = {}
+_histograms = {}
+
+
+class Histogram:
+    """Histograma com baldes fixos + contagem, soma, mínimo e máximo."""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)  # último balde = acima do limite
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self):
+        return {
+            "count": self.count, "total": self.total, "mean": self.mean(),
+            "min": self.min, "max": self.max,
+            "bounds": list(self.bounds), "buckets": list(self.buckets),
+        }
+
+
+# ===============================
+# Controle
+# ===============================
+def enable(flag=True):
+    global ENABLED
+    ENABLED = flag
+
+
+def reset():
+    _counters.clear()
+    _histograms.clear()
+
+
+# ===============================
+# Registro
+# ===============================
+def count(name, n=1):
+    """Soma n ao contador 'name'."""
+    if ENABLED:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def observe(name, value, bounds=VALUE_BUCKETS):
+    """Registra um valor (ex.: tentativas, nós expandidos) no histograma 'name'."""
+    if ENABLED:
+        hist = _histograms.get(name)
+        if hist is None:
+            hist = _histograms[name] = Histogram(bounds)
+        hist.add(value)
+
+
+class _Timer:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        observe(self.name, time.perf_counter() - self.t0, TIME_BUCKETS)
+        return False
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullTimer()
+
+
+def section(name):
+    """Contexto que mede o tempo do bloco (nada é feito se desligado)."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+# ===============================
+# Consulta / exportação
+# ===============================
+def snapshot():
+    return {
+        "counters": dict(_counters),
+        "histograms": {k: h.to_dict() for k, h in _histograms.items()},
+    }
+
+
+def summary_lines(limit=20):
+    """Linhas curtas para o overlay de depuração."""
+    lines = []
+    for name, h in sorted(_histograms.items()):
+        if h.bounds is TIME_BUCKETS:
+            lines.append(f"{name}: {h.mean() * 1000:.3f} ms (máx {h.max * 1000:.2f}, n={h.count})")
+        else:
+            lines.append(f"{name}: média {h.mean():.1f} (máx {h.max}, n={h.count})")
+    for name, v in sorted(_counters.items()):
+        lines.append(f"{name}: {v}")
+    return lines[:limit]
+
+
+def export_json(path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot(), f, indent=2, ensure_ascii=False)
+
+
+def export_csv(path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["name", "kind", "count", "total", "mean", "min", "max"])
+        for name, v in sorted(_counters.items()):
+            w.writerow([name, "counter", v, v, "", "", ""])
+        for name, h in sorted(_histograms.items()):
+            kind = "time" if h.bounds is TIME_BUCKETS else "value"
+            w.writerow([name, kind, h.count, h.total, h.mean(), h.min, h.max])
@@ -0,0 +1,84 @@
+# ===========================================
+# replay.py — Roteiro de entrada (teclas) para rodar o jogo sem jogador
+# ===========================================
+# Um InputReplay é uma lista de (quadro, evento). Game.run(replay=...)
+# consome os eventos do quadro atual em vez de ler o teclado, então a
+# mesma partida pode ser reproduzida em CI ou em benchmark.
+#
+# Formato texto (from_script): tokens separados por espaço
+#   w a s d      -> mover          h b c      -> teclas do jogo
+#   + -          -> zoom           f5 f9 f3   -> teclas de função
+#   espera:N     -> N quadros sem eventos
+# ===========================================
+
+import pygame
+
+KEYS = {
+    "w": pygame.K_w, "a": pygame.K_a, "s": pygame.K_s, "d": pygame.K_d,
+    "h": pygame.K_h, "b": pygame.K_b, "c": pygame.K_c,
+    "+": pygame.K_EQUALS, "-": pygame.K_MINUS,
+    "f3": pygame.K_F3, "f4": pygame.K_F4, "f5": pygame.K_F5, "f9": pygame.K_F9,
+    "esc": pygame.K_ESCAPE,
+}
+
+# Deslocamento (dx, dy) -> tecla de movimento
+MOVE_KEYS = {(0, -1): "w", (0, 1): "s", (-1, 0): "a", (1, 0): "d"}
+
+
+class InputReplay:
+    """Eventos agendados por número de quadro."""
+
+    def __init__(self, frames_per_key=1):
+        self.frames_per_key = frames_per_key  # quadros entre duas teclas
+        self._events = {}                     # quadro -> [eventos]
+        self._next_frame = 0
+        self.last_frame = -1
+
+    # ===============================
+    # Construção
+    # ===============================
+    def key(self, name):
+        """Agenda uma tecla no próximo quadro livre."""
+        ev = pygame.event.Event(pygame.KEYDOWN, key=KEYS[name])
+        self._events.setdefault(self._next_frame, []).append(ev)
+        self.last_frame = self._next_frame
+        self._next_frame += self.frames_per_key
+        return self
+
+    def wait(self, frames):
+        """Agenda N quadros sem eventos."""
+        self._next_frame += frames
+        self.last_frame = self._next_frame - 1
+        return self
+
+    def route(self, route, world):
+        """Agenda as teclas de movimento que percorrem a rota (lista de nós)."""
+        coords = [world.coord_of(n) for n in route]
+        for a, b in zip(coords, coords[1:]):
+            self.key(MOVE_KEYS[(b[0] - a[0], b[1] - a[1])])
+        return self
+
+    @classmethod
+    def from_script(cls, text, frames_per_key=1):
+        replay = cls(frames_per_key)
+        for token in text.split():
+            token = token.lower()
+            if token.startswith("espera:"):
+                replay.wait(int(token.split(":")[1]))
+            else:
+                replay.key(token)
+        return replay
+
+    @classmethod
+    def from_route(cls, route, world, frames_per_key=1):
+        """Converte uma rota (lista de nós) nas teclas de movimento equivalentes."""
+        return cls(frames_per_key).route(route, world)
+
+    # ===============================
+    # Consumo (Game.run)
+    # ===============================
+    def events_for(self, frame):
+        return self._events.get(frame, [])
+
+    def finished(self, frame):
+        return frame >= self.last_frame
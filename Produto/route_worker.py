@@ -0,0 +1,90 @@
+# ===========================================
+# route_worker.py — Cálculo de rotas fora do loop do jogo
+# ===========================================
+# As dicas (B / H) e a rota ideal da tela de vitória podem levar vários
+# quadros em mapas grandes. O Game envia o cálculo para uma thread de
+# trabalho e, a cada quadro, recolhe com poll() o que já terminou.
+#
+# Cada pedido tem um "tipo" (ex.: "dica", "vitoria"). Um pedido novo do
+# mesmo tipo, ou cancel(tipo), invalida o anterior: se ele ainda não
+# começou é descartado da fila, e se já estava rodando o resultado é
+# ignorado quando chegar.
+# ===========================================
+
+import queue
+import threading
+
+
+class RouteWorker:
+    """Thread única que executa cálculos de rota em ordem de chegada."""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = {}   # tipo -> número do pedido mais recente
+        self._pending = set()   # tipos com pedido em andamento
+        self._thread = None
+
+    # ===============================
+    # Ciclo de vida
+    # ===============================
+    def start(self):
+        """Inicia a thread de trabalho (idempotente)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="RouteWorker", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while True:
+            kind, gen, func, args = self._jobs.get()
+            if not self._is_current(kind, gen):
+                continue  # cancelado antes de começar
+            try:
+                result, error = func(*args), None
+            except Exception as exc:  # o erro é entregue ao Game, não derruba a thread
+                result, error = None, exc
+            self._results.put((kind, gen, result, error))
+
+    def _is_current(self, kind, gen):
+        with self._lock:
+            return self._generation.get(kind) == gen
+
+    # ===============================
+    # Pedidos
+    # ===============================
+    def submit(self, kind, func, *args):
+        """Agenda func(*args); substitui qualquer pedido anterior do mesmo tipo."""
+        with self._lock:
+            gen = self._generation.get(kind, 0) + 1
+            self._generation[kind] = gen
+            self._pending.add(kind)
+        self.start()
+        self._jobs.put((kind, gen, func, args))
+        return gen
+
+    def cancel(self, kind):
+        """Descarta o pedido em andamento do tipo (se houver)."""
+        with self._lock:
+            if kind in self._pending:
+                self._generation[kind] += 1
+                self._pending.discard(kind)
+
+    def pending(self, kind):
+        with self._lock:
+            return kind in self._pending
+
+    def poll(self):
+        """Resultados prontos e ainda válidos: lista de (tipo, resultado, erro)."""
+        done = []
+        while True:
+            try:
+                kind, gen, result, error = self._results.get_nowait()
+            except queue.Empty:
+                return done
+            with self._lock:
+                if self._generation.get(kind) != gen:
+                    continue  # substituído ou cancelado enquanto rodava
+                self._pending.discard(kind)
+            done.append((kind, result, error))
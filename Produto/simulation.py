@@ -0,0 +1,217 @@
+# ===========================================
+# simulation.py — Simulação headless com jogadores-robô
+# ===========================================
+# Roda World + Player + check_event sem interface gráfica, sem input()
+# e sem time.sleep, com políticas de jogo plugáveis:
+#   - "aleatorio": passeio aleatório entre vizinhos
+#   - "guloso":    BFS até o baú fechado mais próximo, depois a saída
+#   - "rota":      segue a rota de get_collection_path (dica H)
+# Serve para testar a lógica do jogo em carga (milhares de partidas).
+# ===========================================
+
+import random
+import time
+from collections import deque
+from itertools import permutations
+
+from world import World
+from player import Player
+
+
+# ===============================
+# Políticas (robôs)
+# ===============================
+class RandomWalkBot:
+    """Escolhe um vizinho qualquer a cada passo."""
+
+    def start(self, world, player, rng):
+        pass
+
+    def next_move(self, world, player, rng):
+        vizinhos = world.graph.get_neighbors(player.position)
+        return rng.choice(vizinhos) if vizinhos else None
+
+
+class GreedyBot:
+    """Vai sempre ao baú fechado mais próximo (BFS); sem baús, vai à saída."""
+
+    def start(self, world, player, rng):
+        self.plan = deque()
+
+    def next_move(self, world, player, rng):
+        if not self.plan:
+            self.plan = deque(self._plan_from(world, player.position))
+            if not self.plan:
+                return None
+        return self.plan.popleft()
+
+    def _plan_from(self, world, origem):
+        # Uma BFS multi-alvo: para no primeiro baú fechado alcançado
+        alvos = set(world.chest_rooms) or {world.exit_node}
+        adj = world.graph.adj
+        pais = {origem: None}
+        fila = deque([origem])
+        while fila:
+            atual = fila.popleft()
+            if atual in alvos and atual != origem:
+                caminho = []
+                while atual != origem:
+                    caminho.append(atual)
+                    atual = pais[atual]
+                caminho.reverse()
+                return caminho
+            for vizinho in adj[atual]:
+                if vizinho not in pais:
+                    pais[vizinho] = atual
+                    fila.append(vizinho)
+        return []
+
+
+class RouteBot:
+    """Segue a rota completa de get_collection_path calculada no início."""
+
+    def start(self, world, player, rng):
+        rota = world.graph.get_collection_path(
+            player.position, list(world.chest_rooms), world.exit_node)
+        self.plan = deque(rota[1:])
+
+    def next_move(self, world, player, rng):
+        return self.plan.popleft() if self.plan else None
+
+
+POLICIES = {
+    "aleatorio": RandomWalkBot,
+    "guloso": GreedyBot,
+    "rota": RouteBot,
+}
+
+
+# ===============================
+# Uma partida
+# ===============================
+def simulate_game(policy="rota", seed=None, max_steps=10000, world=None):
+    """
+    Joga uma partida completa sem renderização.
+    Retorna um dicionário com passos, vitória, baús abertos e tempos.
+    """
+    bot = POLICIES[policy]() if isinstance(policy, str) else policy
+    rng = random.Random(seed)
+
+    t0 = time.perf_counter()
+    if world is None:
+        world = World(seed=seed, verbose=False)
+    t1 = time.perf_counter()
+
+    player = Player("Robô", world.start_node, world.coord_of, verbose=False)
+    bot.start(world, player, rng)
+
+    venceu = False
+    while player.step_count < max_steps:
+        destino = bot.next_move(world, player, rng)
+        if destino is None or destino not in world.graph.get_neighbors(player.position):
+            break
+        player.move(destino)
+        venceu, _ = world.check_event(player)
+        if venceu:
+            break
+    t2 = time.perf_counter()
+
+    return {
+        "seed": seed,
+        "steps": player.step_count,
+        "completed": venceu,
+        "chests_opened": len(world.all_chests_backup) - len(world.chest_rooms),
+        "chests_total": len(world.all_chests_backup),
+        "world_time": t1 - t0,
+        "play_time": t2 - t1,
+    }
+
+
+# ===============================
+# Qualidade da dica (rota H)
+# ===============================
+def evaluate_hint(seed, world=None):
+    """
+    Compara a rota de get_collection_path (vizinho mais próximo) com a rota
+    ótima exata (todas as ordens de baús, distâncias BFS entre salas).
+    """
+    if world is None:
+        world = World(seed=seed, verbose=False)
+    graph = world.graph
+    baus = list(world.chest_rooms)
+    inicio, saida = world.start_node, world.exit_node
+
+    t0 = time.perf_counter()
+    rota = graph.get_collection_path(inicio, baus, saida)
+    t1 = time.perf_counter()
+
+    # Distâncias entre salas (uma busca por sala, memorizada no World)
+    dist = world.room_distances()
+    otimo = float("inf")
+    for ordem in permutations(baus):
+        total, atual = 0, inicio
+        for bau in ordem:
+            total += dist[atual].get(bau, float("inf"))
+            atual = bau
+        total += dist[atual].get(saida, float("inf"))
+        otimo = min(otimo, total)
+
+    passos_dica = len(rota) - 1 if rota else 0
+    return {
+        "seed": seed,
+        "hint_steps": passos_dica,
+        "optimal_steps": otimo,
+        "ratio": passos_dica / otimo if otimo else 1.0,
+        "hint_time": t1 - t0,
+    }
+
+
+# ===============================
+# Lote de partidas
+# ===============================
+def summarize(results, elapsed=None):
+    """Agrega uma lista de resultados de simulate_game."""
+    n = len(results)
+    if n == 0:
+        return {"games": 0}
+
+    steps = [r["steps"] for r in results]
+    completos = sum(1 for r in results if r["completed"])
+    total_time = sum(r["world_time"] + r["play_time"] for r in results)
+    if elapsed is None:
+        elapsed = total_time
+
+    return {
+        "games": n,
+        "completed": completos,
+        "completion_rate": completos / n,
+        "steps_mean": sum(steps) / n,
+        "steps_min": min(steps),
+        "steps_max": max(steps),
+        "world_time_mean": sum(r["world_time"] for r in results) / n,
+        "play_time_mean": sum(r["play_time"] for r in results) / n,
+        "time_per_game": total_time / n,
+        "games_per_second": n / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+def run_batch(n_games, policy="rota", seed=0, max_steps=10000):
+    """Roda n_games partidas (seeds seed, seed+1, ...) e devolve as estatísticas."""
+    inicio = time.perf_counter()
+    results = [simulate_game(policy, seed + i, max_steps) for i in range(n_games)]
+    return summarize(results, time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+    import sys
+
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    politicas = sys.argv[2:] or list(POLICIES)
+    for nome in politicas:
+        stats = run_batch(n, nome)
+        print(f"[SIM] {nome:<10} "
+              f"jogos={stats['games']} "
+              f"vitórias={stats['completion_rate']:.1%} "
+              f"passos(média)={stats['steps_mean']:.1f} "
+              f"tempo/jogo={stats['time_per_game'] * 1000:.2f} ms "
+              f"jogos/s={stats['games_per_second']:.0f}")
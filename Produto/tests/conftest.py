@@ -0,0 +1,11 @@
+# ===========================================
+# conftest.py — Testes rodam com os módulos de Produto/ no caminho
+# ===========================================
+# Os módulos do jogo importam uns aos outros pelo nome ("from graph import
+# Graph"), como ao rodar main.py de dentro de Produto/.
+# ===========================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,59 @@
+# ===========================================
+# test_graph.py — Rota de coleta e cache de sufixos do Graph
+# ===========================================
+
+from graph import Graph
+from world import World
+
+
+def _rota_nova(graph, start, baus, saida):
+    """Rota calculada do zero, sem usar nem estragar o cache do grafo."""
+    salvo = {k: [list(c), p] for k, (c, p) in graph._path_cache.items()}
+    graph._path_cache.clear()
+    try:
+        return graph.get_collection_path(start, baus, saida)
+    finally:
+        graph._path_cache = salvo
+
+
+def test_rota_em_cache_depois_de_voltar_de_um_bau():
+    # Seguindo a dica H: depois de voltar por casas já visitadas, o resto
+    # guardado não pode levar de novo a baús já abertos.
+    voltas = 0
+    for seed in range(40):
+        world = World(seed=seed, verbose=False)
+        graph = world.graph
+        restantes = list(world.chest_rooms)
+        rota = graph.get_collection_path(world.start_node, restantes, world.exit_node)
+        vistos = {rota[0]}
+        for node in rota[1:]:
+            voltou = node in vistos
+            vistos.add(node)
+            if node in restantes:
+                restantes.remove(node)
+            em_cache = graph.get_collection_path(node, restantes, world.exit_node)
+            if voltou:
+                voltas += 1
+                nova = _rota_nova(graph, node, restantes, world.exit_node)
+                assert len(em_cache) == len(nova), (seed, world.node_name(node))
+    assert voltas > 0  # os mapas testados têm de fato rotas com volta
+
+
+def test_rota_de_coleta_passa_pela_casa_de_id_0():
+    # Ids inteiros: a casa (0, 0) é o nó 0, falso em "if item"
+    graph = Graph(verbose=False)
+    graph.add_edges_bulk([(1, 0, 1), (1, 2, 1)])
+    assert graph.get_collection_path(1, [0], 2) == [1, 0, 1, 2]
+
+
+def test_rota_com_uma_bfs_por_trecho_igual_a_busca_item_a_item():
+    for seed in range(30):
+        world = World(seed=seed, verbose=False, width=30, height=20)
+        graph = world.graph
+        baus = list(world.chest_rooms)
+        rapida = graph.get_collection_path(world.start_node, baus, world.exit_node)
+        graph._path_cache.clear()
+        # path_fn explícita: uma BFS até cada baú restante, como antes
+        item_a_item = graph.get_collection_path(world.start_node, baus, world.exit_node,
+                                                path_fn=graph.bfs)
+        assert rapida == item_a_item, seed
@@ -0,0 +1,92 @@
+# ===========================================
+# test_interface.py — Contas do Game que não dependem da tela
+# ===========================================
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+pytest.importorskip("pygame")
+
+from fog import FogOfWar
+from graph import Graph
+from Interface import Game
+from world import World
+
+
+def test_custo_da_rota_conta_passos_nos_dois_criterios():
+    graph = Graph(verbose=False)
+    graph.add_edges_bulk([("A", "B", 1), ("B", "C", 1), ("C", "D", 1)])
+    rota = ["A", "B", "C", "D"]
+    jogo = SimpleNamespace(graph=graph)
+
+    assert not graph.weighted
+    sem_peso = Game.route_cost(jogo, rota)
+    graph.weighted = True  # mesmo caminho pelo ramo de path_cost
+    assert sem_peso == Game.route_cost(jogo, rota) == graph.path_cost(rota) == 3
+    assert Game.route_cost(jogo, []) == 0
+
+
+def _jogo(world):
+    from player import Player
+
+    jogo = Game()
+    jogo.set_world(world)
+    fog = FogOfWar(world.map_grid)
+    jogo.player = Player("E", world.start_node, world.coord_of, False, fog=fog,
+                         step_cost=world.graph.edge_weight)
+    jogo.reveal_area()
+    return jogo
+
+
+def test_neblina_salva_so_volta_no_mesmo_mapa(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # save_load grava em data/ na pasta atual
+    world = World(seed=5, verbose=False)
+    jogo = _jogo(world)
+    for x in range(world.width):
+        jogo.player.fog.explored[x] = 1  # primeira linha explorada
+    jogo.do_save()
+    salvo = bytes(jogo.player.fog.explored)
+
+    jogo.do_load()
+    assert jogo.world is world
+    assert bytes(jogo.player.fog.explored) == salvo
+
+    outro = World(seed=6, verbose=False)
+    jogo.set_world(outro)
+    jogo.do_load()  # save de outro mapa: a neblina antiga não vale aqui
+    assert jogo.world is not world
+    assert bytes(jogo.player.fog.explored) != salvo
+    assert not all(jogo.player.fog.explored[:jogo.world.width])
+
+
+def test_mundo_da_janela_nao_imprime_edicoes(capsys):
+    jogo = Game()  # mundo tirado da reserva padrão
+    assert not jogo.world.verbose and not jogo.graph.verbose
+    capsys.readouterr()
+    livre = next(n for n in jogo.graph.adj if type(n) is int)
+    x, y = jogo.world.coord_of(livre)
+    jogo.world.set_cell(x, y, "#")
+    jogo.world.set_cell(x, y, ".")
+    assert capsys.readouterr().out == ""
+
+
+def test_mundo_aberto_gera_blocos_ao_andar_e_na_camera():
+    from Interface import OpenWorldGame
+
+    jogo = OpenWorldGame(headless=True, seed=3)
+    mundo = jogo.world
+    jogo.step([])
+    x0, y0, x1, y1 = jogo.view_area()
+    c = mundo.chunk_size
+    assert {(x0 // c, y0 // c), ((x1 - 1) // c, (y1 - 1) // c)} <= set(mundo.loaded_chunks())
+
+    # anda pela estrada do bloco (0, 0) até o bloco da direita
+    x, y = mundo.start_node
+    for passo in range(1, c):
+        jogo.try_move_player((x + passo, y))
+    assert jogo.player.position == (x + c - 1, y)
+    assert (2, 0) in mundo.loaded_chunks()  # vizinho do bloco (1, 0), gerado antes de chegar
+    assert mundo.loaded_chunks()[-1] == (1, 0)
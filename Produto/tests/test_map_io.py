@@ -0,0 +1,74 @@
+# ===========================================
+# test_map_io.py — Arquivos de mapa (texto e .lmap)
+# ===========================================
+
+import struct
+
+import pytest
+
+import map_io
+from grid import Grid
+from world import World
+
+
+def _mundo():
+    return World(seed=2, width=40, height=30, terrain=True, verbose=False)
+
+
+def test_lmap_abre_sem_varrer_o_mapa(tmp_path, monkeypatch):
+    world = _mundo()
+    caminho = str(tmp_path / "fase.lmap")
+    map_io.save_map(world.map_grid, caminho)
+
+    def varredura(self, char):
+        raise AssertionError(f"mapa varrido atrás de {char!r}")
+
+    monkeypatch.setattr(Grid, "find_all", varredura)
+    aberto = World.from_file(caminho, verbose=False, cache=False, lazy_graph=True)
+    assert aberto.room_positions == world.room_positions
+    assert aberto.terrain
+
+
+def test_lmap_antigo_sem_indice(tmp_path):
+    world = _mundo()
+    grid = world.map_grid
+    caminho = tmp_path / "antigo.lmap"
+    caminho.write_bytes(grid.tobytes() + struct.pack("<4sII", b"LMAP", grid.width, grid.height))
+
+    aberto, index = map_io.load_binary(str(caminho))
+    assert index is None and aberto == grid
+    assert World.from_file(str(caminho), verbose=False, cache=False).room_positions == world.room_positions
+
+
+def test_mapa_sem_bau_e_recusado():
+    with pytest.raises(ValueError, match="baú"):
+        map_io.parse_text("P..\n..E\n")
+
+
+def test_grafo_do_grid_e_somente_leitura():
+    world = World(seed=1, verbose=False, lazy_graph=True)
+    vizinho = world.graph.get_neighbors(world.start_node)[0]
+    with pytest.raises(ValueError, match="set_cell"):
+        world.graph.add_edge(world.start_node, vizinho)
+
+
+def test_terreno_pintado_no_grafo_do_grid_pesa_na_rota():
+    # Mapa sem terreno: o GridGraph nasce sem pesos
+    mapa = "P...E\n.###.\n.....\n.#B#.\n"
+    world = World(grid=map_io.parse_text(mapa), verbose=False, lazy_graph=True)
+    assert not world.graph.weighted
+    for x in range(1, 4):
+        world.set_cell(x, 0, "~")  # água no atalho de cima: 4 por passo
+    assert world.graph.weighted
+    caminho = world.graph.shortest_path(world.start_node, world.exit_node)
+    assert world.graph.path_cost(caminho) == 8  # 8 passos secos por baixo, não 16 na água
+    assert world.coord_of(caminho[1]) == (0, 1)
+
+
+def test_terreno_pintado_no_mundo_aberto_liga_os_pesos():
+    from open_world import ChunkedWorld
+
+    mundo = ChunkedWorld(seed=4)
+    assert not mundo.graph.weighted
+    mundo.set_cell(17, 16, ",")  # (16, 16) é a Entrada
+    assert mundo.graph.weighted
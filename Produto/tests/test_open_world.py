@@ -0,0 +1,74 @@
+# ===========================================
+# test_open_world.py — Buscas no mundo aberto ficam limitadas
+# ===========================================
+
+import pytest
+
+from open_world import EXIT_DISTANCE, SEARCH_MARGIN, ChunkedWorld
+
+
+def _alvo_cercado(mundo, x, y):
+    """Casa livre com as 4 vizinhas fechadas: nenhuma busca chega nela."""
+    mundo.set_cell(x, y, ".")
+    for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+        mundo.set_cell(nx, ny, "#")
+    return x, y
+
+
+@pytest.mark.parametrize("busca", ["bfs", "astar", "dijkstra", "bidirectional_bfs", "shortest_path"])
+def test_busca_sem_caminho_nao_sai_da_janela(busca):
+    mundo = ChunkedWorld(seed=4)
+    inicio = (mundo.chunk_size // 2, mundo.chunk_size // 2)  # estrada do bloco (0, 0)
+    alvo = _alvo_cercado(mundo, 3, 3)
+    tocados = set()
+    chunk = mundo.chunk
+
+    def chunk_registrado(cx, cy):
+        tocados.add((cx, cy))
+        return chunk(cx, cy)
+
+    mundo.chunk = chunk_registrado
+    assert getattr(mundo.graph, busca)(inicio, alvo) == []
+    assert tocados
+    assert all(abs(cx) <= SEARCH_MARGIN and abs(cy) <= SEARCH_MARGIN for cx, cy in tocados)
+
+
+@pytest.mark.parametrize("metodo", ["distances_to", "path_to", "dfs"])
+def test_percorrer_o_mapa_inteiro_e_recusado(metodo):
+    mundo = ChunkedWorld(seed=4)
+    with pytest.raises(ValueError):
+        getattr(mundo.graph, metodo)((16, 16), (16, 40))
+
+
+def test_caminho_guardado_e_reusado_na_mesma_janela(monkeypatch):
+    mundo = ChunkedWorld(seed=4)
+    graph = mundo.graph
+    caminho = graph.shortest_path((16, 16), (16, 90))
+    assert caminho
+    limpezas = []
+    invalidate = graph._invalidate_paths
+    monkeypatch.setattr(graph, "_invalidate_paths", lambda: limpezas.append(1) or invalidate())
+    assert graph.shortest_path(caminho[1], (16, 90)) == caminho[1:]
+    assert not limpezas
+
+
+def test_chave_e_portao_em_lados_opostos_e_bau_aberto_nao_volta():
+    from player import Player
+
+    mundo = ChunkedWorld(seed=7, max_chunks=4)
+    (ex, ey), (kx, ky) = mundo.exit_chunk, mundo.key_chunk
+    assert max(abs(ex), abs(ey)) == EXIT_DISTANCE and (kx, ky) == (-ex, -ey)
+    casa, conteudo = mundo.chest_in(kx, ky)
+    assert conteudo == "Chave" and mundo.is_walkable(*casa)
+
+    jogador = Player("E", casa, mundo.coord_of, False)
+    assert mundo.check_event(jogador) == (False, "Você encontrou a CHAVE!")
+    for cx in range(10):  # descarta o bloco da chave e gera de novo
+        mundo.chunk(cx, 50)
+    assert mundo.chest_at(*casa) is None
+    assert mundo.check_event(jogador) == (False, None)
+
+    jogador.position = mundo.exit_node
+    assert mundo.check_event(jogador)[0]
+    with pytest.raises(ValueError, match="sala"):
+        mundo.set_cell(*mundo.exit_node, "#")
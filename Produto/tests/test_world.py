@@ -0,0 +1,55 @@
+# ===========================================
+# test_world.py — Nós do World (ids de casa, nomes, salas)
+# ===========================================
+
+import pytest
+
+from map_io import parse_text
+from open_world import ChunkedWorld
+from world import World
+
+MAPA_CANTO_LIVRE = ".P..\n#..B\n#..E\n"
+
+
+def test_casa_0_0_e_um_no_valido():
+    # O id da casa (0, 0) é 0: falso em "if node", mas um nó como outro qualquer
+    world = World(grid=parse_text(MAPA_CANTO_LIVRE), verbose=False)
+    assert world.node_at(0, 0) == 0
+    assert world.coord_of(0) == (0, 0)
+    assert 0 in world.graph.get_neighbors(world.start_node)
+    assert world.node_name(0) == "N0_0"
+    assert world.parse_node("N0_0") == 0  # save feito na casa (0, 0)
+    assert world.parse_node("N0_1") is None  # parede
+
+
+def test_nomes_de_exibicao_voltam_ao_mesmo_no():
+    world = World(seed=3, verbose=False)
+    for node in world.graph.adj:
+        assert world.parse_node(world.node_name(node)) == node
+
+
+@pytest.mark.parametrize("sala", ["P", "B", "E"])
+def test_set_cell_nao_cria_salas(sala):
+    world = World(grid=parse_text(MAPA_CANTO_LIVRE), verbose=False)
+    with pytest.raises(ValueError):
+        world.set_cell(2, 0, sala)
+    assert world.map_grid.get(2, 0) == "."
+    world.set_cell(2, 0, "~")  # terreno continua permitido
+    assert world.graph.edge_weight(world.node_at(2, 0), world.start_node) == 4
+
+
+@pytest.mark.parametrize("sala", ["P", "B", "E"])
+def test_set_cell_do_mundo_aberto_nao_cria_salas(sala):
+    mundo = ChunkedWorld(seed=1)
+    with pytest.raises(ValueError):
+        mundo.set_cell(3, 3, sala)
+
+
+@pytest.mark.parametrize("x, y", [(-1, 0), (0, -1), (15, 0), (0, 15)])
+def test_set_cell_fora_do_mapa(x, y):
+    # Grid.set com índice y * largura + x cairia em outra casa (ou no Portão)
+    world = World(seed=3, verbose=False)
+    antes = world.map_grid.copy()
+    with pytest.raises(ValueError, match="fora do mapa"):
+        world.set_cell(x, y, "#")
+    assert world.map_grid == antes
@@ -1,295 +1,588 @@
-# ===========================================
-# world.py — Geração do mundo 15×15 
-# ===========================================
-
-from graph import Graph
-import random
-
-class World:
-    """Representa o mundo (labirinto) do jogo."""
-
-    def __init__(self):
-        self.graph = Graph()
-        self.start_node = "Entrada"
-        self.exit_node = "Portão"
-
-        self.chest_rooms = []       
-        self.all_chests_backup = [] # nomes dos baús
-        self.chest_contents = {}     # item que cada baú contém
-        self.key_room = None         # baú que contém a chave
-
-        # Mapa 15×15
-        self.map_grid = self._generate_map()
-
-        # Detectar salas especiais
-        self.room_positions = self._assign_rooms()
-
-        # Montar grafo baseado no layout
-        self._build_graph()
-
-        # Garantir distribuição fixa dos itens
-        self._assign_items()
-
-    # ===============================================================
-    # 1. Mapa Fixo 15×15
-    # ===============================================================
-    def _generate_map(self):
-        """
-        Tenta gerar um mapa válido. Se gerar um mapa impossível (sem saída),
-        tenta novamente até conseguir.
-        """
-        attempt = 1
-        while True:
-            # 1. Gera um layout candidato
-            grid = self._create_candidate_layout()
-            
-            # 2. Verifica se é possível ir do Início (0,0) ao Fim (14,14)
-            if self._is_solvable(grid):
-                return grid
-            
-            attempt += 1
-            # Segurança para não travar loop infinito 
-            if attempt > 100:
-                print("ERRO CRÍTICO: Não foi possível gerar mapa aleatório. Usando fallback.")
-                return self._create_fallback_map()
-
-    def _create_candidate_layout(self):
-        """Gera a matriz 15x15 com paredes aleatórias ."""
-        width, height = 15, 15
-        grid = [['.' for _ in range(width)] for _ in range(height)]
-        
-        # Marca Entrada e Saída
-        grid[0][0] = "P"
-        grid[14][14] = "E"
-        
-        import random
-        # Paredes aleatórias
-        for y in range(height):
-            for x in range(width):
-                # Protege a área de start e end para não bloquear de cara
-                if (x, y) in [(0,0), (14,14), (0,1), (1,0), (14,13), (13,14)]:
-                    continue
-                
-                # 25% de chance de parede 
-                if random.random() < 0.25: 
-                    grid[y][x] = "#"
-        
-        # Distribui 6 Baús em posições livres
-        count_baus = 0
-        while count_baus < 6:
-            rx = random.randint(0, 14)
-            ry = random.randint(0, 14)
-            if grid[ry][rx] == ".":
-                grid[ry][rx] = "B"
-                count_baus += 1
-                
-        return grid
-
-    def _is_solvable(self, grid):
-        """
-        Verifica se é possível ir do Início (P) para a Saída (E)
-        E tambem se todos os baús (B) são acessíveis.
-        """
-        start = (0, 0)
-        # Encontra coordenadas de todos os baús e da saída
-        targets = []
-        rows = len(grid)
-        cols = len(grid[0])
-        
-        for y in range(rows):
-            for x in range(cols):
-                if grid[y][x] == "E":
-                    targets.append((x, y)) # Saída é obrigatória
-                elif grid[y][x] == "B":
-                    targets.append((x, y)) # Baús são obrigatórios
-        
-        # BFS para encontrar tudo que é alcançável
-        queue = [start]
-        visited = set()
-        visited.add(start)
-        reachable_targets = 0
-        
-        while queue:
-            cx, cy = queue.pop(0)
-            
-            # Se chegamos em um alvo (Exit ou Bau), contamos
-            if (cx, cy) in targets:
-                reachable_targets += 1
-                # Se já achou todos, pode parar cedo
-                if reachable_targets == len(targets):
-                    return True
-
-            # Vizinhos
-            for dx, dy in [(0,1), (0,-1), (1,0), (-1,0)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < cols and 0 <= ny < rows:
-                    if (nx, ny) not in visited and grid[ny][nx] != "#":
-                        visited.add((nx, ny))
-                        queue.append((nx, ny))
-        
-        # Só retorna True se achou TODOS os alvos 
-        return reachable_targets == len(targets)
-
-    def _create_fallback_map(self):
-        """Retorna o mapa fixo original caso o aleatório falhe (segurança)."""
-        raw = [
-            "###############",
-            "#P........#..B#",
-            "#.#######.###.#",
-            "#.......#...#.#",
-            "#.#######.###.#",
-            "#.#...#.......#",
-            "#.#.#####.#####",
-            "#.......#.....#",
-            "#######.#####.#",
-            "#B..#...#...#B#",
-            "#.###.#####.#.#",
-            "#...#...#B..#.#",
-            "###.###.###.#.#",
-            "#.....B......E#",
-            "###############"
-        ]
-        return [list(row) for row in raw]
-
-    # ===============================================================
-    # 2. Detectar salas reais (Entrada, Baús, Portão)
-    # ===============================================================
-    def _assign_rooms(self):
-        rooms = {}
-        baus_encontrados = 0
-
-        for y in range(15):
-            for x in range(15):
-                cell = self.map_grid[y][x]
-
-                if cell == "P":
-                    rooms["Entrada"] = (x, y)
-
-                elif cell == "E":
-                    rooms["Portão"] = (x, y)
-
-                elif cell == "B":
-                    baus_encontrados += 1
-                    nome = f"Bau_{baus_encontrados}"
-                    rooms[nome] = (x, y)
-                    self.chest_rooms.append(nome)
-        self.all_chests_backup = list(self.chest_rooms)
-        return rooms
-
-    # ===============================================================
-    # 3. Gerar grafo com corredores intermediários
-    # ===============================================================
-    def _build_graph(self):
-        # (A) Criar vértices das salas
-        for sala in self.room_positions:
-            self.graph.add_vertex(sala)
-
-        intermediarios = {}
-
-        def add_inter(x, y):
-            name = f"N{x}_{y}"
-            if name not in intermediarios:
-                intermediarios[name] = (x, y)
-                self.graph.add_vertex(name)
-            return name
-
-        def walkable(x, y):
-            if 0 <= x < 15 and 0 <= y < 15:
-                return self.map_grid[y][x] in (".", "P", "B", "E")
-            return False
-
-        for y in range(15):
-            for x in range(15):
-                if not walkable(x, y):
-                    continue
-
-                sala = None
-                for nome, pos in self.room_positions.items():
-                    if pos == (x, y):
-                        sala = nome
-                        break
-
-                if not sala:
-                    sala = add_inter(x, y)
-
-                for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                    nx, ny = x + dx, y + dy
-                    if walkable(nx, ny):
-                        viz = None
-                        for nome, pos in self.room_positions.items():
-                            if pos == (nx, ny):
-                                viz = nome
-                                break
-                        if not viz:
-                            viz = add_inter(nx, ny)
-
-                        self.graph.add_edge(sala, viz)
-
-    # ===============================================================
-    # 4. Distribuir os itens corretamente pelos 3 baús
-    # ==============================================================
-
-    def _assign_items(self):
-        """Distribui itens ÚNICOS: Chave (Fixa) + 5 Aleatórios sem repetição."""
-        if not self.chest_rooms: return
-
-        import random
-        baus = self.chest_rooms.copy()
-        random.shuffle(baus)
-        
-        # 1. Garante a Chave no primeiro baú da lista embaralhada
-        self.key_room = baus[0]
-        self.chest_contents[self.key_room] = "Chave"
-        
-        # 2. Pool de itens possíveis 
-        pool_de_itens = [
-            "Poção Azul", "Poção Vermelha", "Ouro", "Diamante", 
-            "Rubi", "Esmeralda", "Pergaminho", "Cálice", 
-            "Anel", "Colar", "Coroa", "Espada Velha"
-        ]
-        
-        qtd_para_preencher = len(baus) - 1
-        
-        # 3. Seleciona itens aleatorios e unicos do pool
-        if qtd_para_preencher > 0:
-            itens_escolhidos = random.sample(pool_de_itens, qtd_para_preencher)
-            
-            # Preenche os baús restantes
-            for i, sala in enumerate(baus[1:]):
-                self.chest_contents[sala] = itens_escolhidos[i]
-
-    # ===============================================================
-    # 5. Eventos ao entrar em sala
-    # ===============================================================
-    def check_event(self, player):
-        sala = player.position
-
-        # ----- BAÚ -----
-        if sala in self.chest_rooms:
-            conteudo = self.chest_contents.get(sala, None)
-
-            self.chest_rooms.remove(sala)
-
-            if conteudo == "Chave":
-                player.open_chest("Chave", "Abre o portão final")
-                return False, "Você encontrou a CHAVE!"
-
-            elif conteudo: # 
-                player.open_chest(conteudo, "Item encontrado.")
-                return False, f"Você encontrou: {conteudo}"
-        # -----------------------
-            else:
-                return False, "O baú está vazio."
-
-        # ----- PORTÃO -----
-        if sala == self.exit_node:
-            if player.has_item("Chave"):
-                return True, "🏆 Você usou a chave e escapou!"
-            else:
-                return False, "Você precisa da CHAVE para abrir o portão."
-
-        return False, None
-
-    # ===============================================================
-    def show_map(self):
-        self.graph.show()
+# ===========================================
+# world.py — Geração do mundo (15×15 por padrão)
+# ===========================================
+
+from graph import Graph
+from grid import Grid, WALL
+from collections import deque
+from pathfinding import SEARCHES, jump_point_path
+import graph_cache
+import profiler
+import random
+
+# Custo de movimento por tipo de casa ("#" = parede, intransponível)
+TERRAIN_COSTS = {
+    ".": 1, "P": 1, "B": 1, "E": 1,
+    ",": 2,   # lama
+    "=": 3,   # escada
+    "~": 4,   # água
+}
+# Chance de cada terreno por casa livre em World(terrain=True)
+TERRAIN_CHANCES = ((",", 0.10), ("=", 0.03), ("~", 0.05))
+# O que set_cell pode pintar: parede, corredor e terrenos (salas, não)
+EDITABLE_CELLS = frozenset("#.") | {c for c, _ in TERRAIN_CHANCES}
+# Itens dos baús (além da Chave)
+ITEM_POOL = (
+    "Poção Azul", "Poção Vermelha", "Ouro", "Diamante",
+    "Rubi", "Esmeralda", "Pergaminho", "Cálice",
+    "Anel", "Colar", "Coroa", "Espada Velha",
+)
+# A partir deste nº de casas o grafo não é montado: vizinhos saem do grid
+LAZY_GRAPH_CELLS = 4_000_000
+
+class World:
+    """Representa o mundo (labirinto) do jogo."""
+
+    def __init__(self, seed=None, verbose=True, width=15, height=15, search="bfs", terrain=False,
+                 grid=None, lazy_graph=None, cache=False, index=None):
+        # Gerador próprio: mesma seed -> mesmo mundo (simulação / testes)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.verbose = verbose
+        self.width = width
+        self.height = height
+        self.search = search  # "bfs", "astar", "bidir", "dijkstra" (pathfinding.SEARCHES) ou "jps"
+        self.terrain = terrain  # sorteia lama / água / escada (arestas com peso)
+
+        self.graph = Graph(verbose=verbose)
+        self.graph.search = search
+        self.start_node = "Entrada"
+        self.exit_node = "Portão"
+
+        self.chest_rooms = []       
+        self.all_chests_backup = [] # nomes dos baús
+        self.chest_contents = {}     # item que cada baú contém
+        self.key_room = None         # baú que contém a chave
+
+        # Mapa W×H (15×15 por padrão) ou um mapa pronto (map_io.load_level).
+        # 'index' (salas e terreno, do arquivo .lmap) evita varrer o mapa.
+        if grid is not None:
+            self.map_grid = grid
+            if index is not None:
+                self.terrain = index["terrain"]
+            else:
+                self.terrain = any(grid.data.find(c.encode()) != -1 for c, _ in TERRAIN_CHANCES)
+        else:
+            with profiler.section("world.generate_map"):
+                self.map_grid = self._generate_map()
+        # O mapa reserva pode ter outro tamanho
+        self.height = self.map_grid.height
+        self.width = self.map_grid.width
+
+        if lazy_graph is None:
+            lazy_graph = self.width * self.height >= LAZY_GRAPH_CELLS
+        self.lazy_graph = lazy_graph
+
+        # Salas e grafo: do cache em disco (cache=True, mapa já visto) ou
+        # montados agora. Grafo sob demanda não tem o que guardar.
+        self._cache_key = None
+        self._room_distances = None
+        cached = None
+        if cache and not lazy_graph:
+            self._cache_key = graph_cache.map_key(self.map_grid)
+            cached = graph_cache.load(self._cache_key)
+        if cached:
+            self.room_positions = self._index_rooms(cached["rooms"])
+            self.graph.adj = cached["adj"]
+            self.graph.weighted = cached["weighted"]
+            self._room_distances = cached["room_distances"]
+        else:
+            # Detectar salas especiais
+            self.room_positions = self._assign_rooms(index)
+
+            # Montar grafo baseado no layout (mapas enormes: vizinhos sob demanda)
+            if lazy_graph:
+                self._use_lazy_graph()
+            else:
+                with profiler.section("world.build_graph"):
+                    self._build_graph()
+            if self._cache_key:
+                self._store_cache()
+        self.graph.locate = self.coord_of  # heurística Manhattan do A*
+        self.graph.label = self.node_name
+        self.graph.grid_search = self.jump_search  # Graph.search = "jps"
+        self._hierarchy = None  # ClusterMap (hpa.py), montado sob demanda
+
+        # Garantir distribuição fixa dos itens
+        self._assign_items()
+
+    # ===============================================================
+    # 1. Mapa Fixo 15×15
+    # ===============================================================
+    def _generate_map(self):
+        """
+        Tenta gerar um mapa válido. Se gerar um mapa impossível (sem saída),
+        tenta novamente até conseguir.
+        """
+        attempt = 1
+        while True:
+            # 1. Gera um layout candidato
+            grid = self._create_candidate_layout()
+            
+            # 2. Verifica se é possível ir do Início (0,0) ao Fim (W-1,H-1)
+            if self._is_solvable(grid):
+                if profiler.ENABLED:
+                    profiler.observe("world.generate_attempts", attempt)
+                return grid
+            
+            attempt += 1
+            # Segurança para não travar loop infinito 
+            if attempt > 100:
+                profiler.count("world.generate_fallbacks")
+                if self.verbose:
+                    print("ERRO CRÍTICO: Não foi possível gerar mapa aleatório. Usando fallback.")
+                return self._create_fallback_map()
+
+    def _create_candidate_layout(self):
+        """Gera a matriz WxH com paredes aleatórias ."""
+        width, height = self.width, self.height
+        ex, ey = width - 1, height - 1
+        grid = Grid(width, height, ".")
+        cells = grid.data  # índice y * width + x
+        
+        # Marca Entrada e Saída
+        grid.set(0, 0, "P")
+        grid.set(ex, ey, "E")
+        
+        rng = self.rng
+        protegidas = {(0,0), (ex,ey), (0,1), (1,0), (ex,ey-1), (ex-1,ey)}
+        protegidos = {y * width + x for x, y in protegidas}
+        # Paredes aleatórias (mesma ordem de sorteio: a seed gera o mesmo mapa)
+        for i in range(width * height):
+            # Protege a área de start e end para não bloquear de cara
+            if i in protegidos:
+                continue
+            
+            # 25% de chance de parede 
+            if rng.random() < 0.25: 
+                cells[i] = WALL
+        
+        # Distribui 6 Baús em posições livres
+        count_baus = 0
+        while count_baus < 6:
+            rx = rng.randint(0, ex)
+            ry = rng.randint(0, ey)
+            if grid.get(rx, ry) == ".":
+                grid.set(rx, ry, "B")
+                count_baus += 1
+
+        # Terrenos com custo (só com terrain=True: mundos antigos não mudam)
+        if self.terrain:
+            chao = ord(".")
+            codigos = [(ord(char), chance) for char, chance in TERRAIN_CHANCES]
+            for i in range(width * height):
+                if cells[i] != chao or i in protegidos:
+                    continue
+                r = rng.random()
+                for codigo, chance in codigos:
+                    if r < chance:
+                        cells[i] = codigo
+                        break
+                    r -= chance
+                
+        return grid
+
+    def _is_solvable(self, grid):
+        """
+        Verifica se é possível ir do Início (P) para a Saída (E)
+        E tambem se todos os baús (B) são acessíveis.
+        Com self.search != "bfs", cada alvo é buscado separadamente
+        pela busca escolhida (A* / bidirecional) direto sobre o grid.
+        """
+        start = (0, 0)
+        # Encontra coordenadas de todos os baús e da saída (obrigatórios)
+        targets = set(grid.find_all("E")) | set(grid.find_all("B"))
+        rows, cols = grid.height, grid.width
+        cells = grid.data
+        
+        if self.search in ("astar", "bidir"):
+            return self._targets_reachable(grid, start, targets)
+
+        # BFS para encontrar tudo que é alcançável, em índices y * largura + x
+        # (bytearray de visitados: nada de tuplas nem set por casa)
+        alvos = {y * cols + x for x, y in targets}
+        faltam = len(alvos)
+        n, ultima = rows * cols, cols - 1
+        visitado = bytearray(n)
+        visitado[0] = 1
+        queue = deque([0])
+
+        while queue:
+            i = queue.popleft()
+
+            # Se chegamos em um alvo (Exit ou Bau), contamos
+            if i in alvos:
+                faltam -= 1
+                # Se já achou todos, pode parar cedo
+                if not faltam:
+                    return True
+
+            # Vizinhos (mesma ordem: baixo, cima, direita, esquerda)
+            x = i % cols
+            for j in (i + cols if i + cols < n else -1, i - cols,
+                      i + 1 if x < ultima else -1, i - 1 if x > 0 else -1):
+                if j >= 0 and not visitado[j] and cells[j] != WALL:
+                    visitado[j] = 1
+                    queue.append(j)
+
+        # Só retorna True se achou TODOS os alvos
+        return faltam == 0
+
+    def _targets_reachable(self, grid, start, targets):
+        """Um caminho por alvo com a busca self.search, parando no primeiro impossível."""
+        rows, cols, cells = grid.height, grid.width, grid.data
+
+        def vizinhos(c):
+            cx, cy = c
+            for nx, ny in ((cx, cy + 1), (cx, cy - 1), (cx + 1, cy), (cx - 1, cy)):
+                if 0 <= nx < cols and 0 <= ny < rows and cells[ny * cols + nx] != WALL:
+                    yield nx, ny
+
+        busca = SEARCHES[self.search]
+        for tx, ty in targets:
+            h = lambda c, tx=tx, ty=ty: abs(c[0] - tx) + abs(c[1] - ty)
+            caminho, _ = busca(start, (tx, ty), vizinhos, h)
+            if not caminho:
+                return False
+        return True
+
+    def _create_fallback_map(self):
+        """Retorna o mapa fixo original caso o aleatório falhe (segurança)."""
+        raw = [
+            "###############",
+            "#P........#..B#",
+            "#.#######.###.#",
+            "#.......#...#.#",
+            "#.#######.###.#",
+            "#.#...#.......#",
+            "#.#.#####.#####",
+            "#.......#.....#",
+            "#######.#####.#",
+            "#B..#...#...#B#",
+            "#.###.#####.#.#",
+            "#...#...#B..#.#",
+            "###.###.###.#.#",
+            "#.....B......E#",
+            "###############"
+        ]
+        return Grid.from_rows(raw)
+
+    # ===============================================================
+    # 2. Detectar salas reais (Entrada, Baús, Portão)
+    # ===============================================================
+    def _assign_rooms(self, index=None):
+        rooms = {}
+        if index is not None:
+            achados = index["rooms"]  # do arquivo .lmap: nada a varrer
+        else:
+            # find_all percorre o bytearray em C, em ordem de linha
+            achados = {char: self.map_grid.find_all(char) for char in "PEB"}
+
+        for pos in achados["P"]:
+            rooms["Entrada"] = pos
+        for pos in achados["E"]:
+            rooms["Portão"] = pos
+        for i, pos in enumerate(achados["B"], start=1):
+            rooms[f"Bau_{i}"] = pos
+        return self._index_rooms(rooms)
+
+    def _index_rooms(self, rooms):
+        """Lista de baús e índice reverso (x, y) -> sala, usado por node_at."""
+        self.chest_rooms = [nome for nome in rooms if nome.startswith("Bau_")]
+        self.all_chests_backup = list(self.chest_rooms)
+        self._room_at = {pos: nome for nome, pos in rooms.items()}
+        return rooms
+
+    # ===============================================================
+    # Conversão nó <-> coordenada
+    # ===============================================================
+    # Salas são nós com nome ("Entrada", "Bau_3"...); corredores são o id
+    # inteiro da casa, y * largura + x. Conversão id <-> (x, y) é só
+    # aritmética; o texto "Nx_y" só é criado para exibir (node_name).
+    def coord_of(self, node):
+        """Converte um nó (id de casa ou nome de sala) para (x, y) no grid (ou None)."""
+        if type(node) is int:
+            return node % self.width, node // self.width
+        return self.room_positions.get(node)
+
+    def node_at(self, x, y):
+        """Nó na posição (x, y) do grid: nome da sala, id da casa ou None se for parede."""
+        sala = self._room_at.get((x, y))
+        if sala:
+            return sala
+        if 0 <= x < self.width and 0 <= y < self.height:
+            if self.map_grid.get(x, y) in TERRAIN_COSTS:
+                return y * self.width + x
+        return None
+
+    def node_name(self, node):
+        """Nome de exibição: a própria sala ou "Nx_y" para corredores."""
+        if type(node) is int:
+            return f"N{node % self.width}_{node // self.width}"
+        return node
+
+    def parse_node(self, text):
+        """Nó a partir do nome exibido ("Bau_2", "N3_7"), ex.: save ou entrada do terminal."""
+        if text in self.room_positions:
+            return text
+        if isinstance(text, str) and text.startswith("N"):
+            try:
+                x, y = (int(p) for p in text[1:].split("_"))
+            except ValueError:
+                return None
+            return self.node_at(x, y)
+        return None
+
+    # ===============================================================
+    # 3. Gerar grafo com corredores intermediários
+    # ===============================================================
+    def _build_graph(self):
+        # (A) Criar vértices das salas
+        for sala in self.room_positions:
+            self.graph.add_vertex(sala)
+
+        # (B) Nó de cada casa livre (nome da sala ou id y*W+x); None = parede
+        livres = TERRAIN_COSTS
+        room_at = self._room_at
+        linhas = [self.map_grid.row_text(y) for y in range(self.height)]
+        nomes = []
+        for y, row in enumerate(linhas):
+            base = y * self.width
+            nomes.append([(room_at.get((x, y)) or base + x) if c in livres else None
+                          for x, c in enumerate(row)])
+
+        # (C) Cada aresta uma vez: vizinho da direita e de baixo. Peso =
+        #     custo do terreno mais caro das duas casas (entrar ou sair da
+        #     água custa o mesmo, já que o grafo não é direcionado)
+        def arestas():
+            for y, linha in enumerate(nomes):
+                abaixo = nomes[y + 1] if y + 1 < self.height else None
+                row = linhas[y]
+                for x, nome in enumerate(linha):
+                    if nome is None:
+                        continue
+                    custo = TERRAIN_COSTS[row[x]]
+                    if x + 1 < self.width and linha[x + 1] is not None:
+                        yield nome, linha[x + 1], max(custo, TERRAIN_COSTS[row[x + 1]])
+                    if abaixo is not None and abaixo[x] is not None:
+                        yield nome, abaixo[x], max(custo, TERRAIN_COSTS[linhas[y + 1][x]])
+
+        casas = (nome for linha in nomes for nome in linha if nome is not None)
+        self.graph.add_edges_bulk(arestas(), vertices=casas)
+
+    def _use_lazy_graph(self):
+        """Troca o Graph por um GridGraph (lazy_graph.py) que lê o map_grid."""
+        from lazy_graph import GridGraph, LazyAdjacency
+
+        adjacency = LazyAdjacency(self.coord_of, self.node_at, self.map_grid.get,
+                                  size=(self.width, self.height))
+        graph = GridGraph(adjacency, weighted=self.terrain, verbose=self.verbose)
+        graph.search = self.search
+        self.graph = graph
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """
+        World a partir de um arquivo de mapa (texto ou .lmap, ver map_io.py).
+        O grafo montado vai para o cache em disco: abrir de novo a mesma
+        fase só carrega o que já foi calculado.
+        """
+        from map_io import load_level
+
+        grid, index = load_level(path)
+        kwargs.setdefault("cache", True)
+        return cls(grid=grid, index=index, **kwargs)
+
+    def _store_cache(self):
+        graph_cache.store(self._cache_key, {
+            "rooms": self.room_positions,
+            "adj": self.graph.adj,
+            "weighted": self.graph.weighted,
+            "room_distances": self._room_distances,
+        })
+
+    def map_id(self):
+        """Identificador do mapa (hash do grid), gravado no save para reconhecê-lo."""
+        return graph_cache.map_key(self.map_grid)
+
+    def room_distances(self):
+        """
+        Custo mínimo entre cada par de salas: {sala: {sala: custo}}. Uma
+        busca completa por sala na primeira chamada (as árvores ficam no
+        Graph, a da saída serve à dica B); com cache, a tabela é salva.
+        """
+        if self._room_distances is None:
+            salas = list(self.room_positions)
+            tabela = {}
+            for sala in salas:
+                dist = self.graph.distances_to(sala)
+                tabela[sala] = {outra: dist[outra] for outra in salas if outra in dist}
+            self._room_distances = tabela
+            if self._cache_key:
+                self._store_cache()
+        return self._room_distances
+
+    # ===============================================================
+    # 4. Distribuir os itens corretamente pelos 3 baús
+    # ==============================================================
+
+    def _assign_items(self):
+        """Distribui itens ÚNICOS: Chave (Fixa) + 5 Aleatórios sem repetição."""
+        if not self.chest_rooms: return
+
+        baus = self.chest_rooms.copy()
+        self.rng.shuffle(baus)
+        
+        # 1. Garante a Chave no primeiro baú da lista embaralhada
+        self.key_room = baus[0]
+        self.chest_contents[self.key_room] = "Chave"
+        
+        # 2. Pool de itens possíveis 
+        pool_de_itens = list(ITEM_POOL)
+        
+        # Mapas carregados de arquivo podem ter mais baús que itens: os
+        # que sobrarem ficam vazios
+        qtd_para_preencher = min(len(baus) - 1, len(pool_de_itens))
+        
+        # 3. Seleciona itens aleatorios e unicos do pool
+        if qtd_para_preencher > 0:
+            itens_escolhidos = self.rng.sample(pool_de_itens, qtd_para_preencher)
+            
+            # Preenche os baús restantes
+            for sala, item in zip(baus[1:], itens_escolhidos):
+                self.chest_contents[sala] = item
+
+    # ===============================================================
+    # 5. Eventos ao entrar em sala
+    # ===============================================================
+    def check_event(self, player):
+        sala = player.position
+
+        # ----- BAÚ -----
+        if sala in self.chest_rooms:
+            conteudo = self.chest_contents.get(sala, None)
+
+            self.chest_rooms.remove(sala)
+
+            if conteudo == "Chave":
+                player.open_chest("Chave", "Abre o portão final")
+                return False, "Você encontrou a CHAVE!"
+
+            elif conteudo: # 
+                player.open_chest(conteudo, "Item encontrado.")
+                return False, f"Você encontrou: {conteudo}"
+        # -----------------------
+            else:
+                return False, "O baú está vazio."
+
+        # ----- PORTÃO -----
+        if sala == self.exit_node:
+            if player.has_item("Chave"):
+                return True, "🏆 Você usou a chave e escapou!"
+            else:
+                return False, "Você precisa da CHAVE para abrir o portão."
+
+        return False, None
+
+    # ===============================================================
+    # ===============================================================
+    # Análise do mapa (gargalos)
+    # ===============================================================
+    def chokepoints(self):
+        """
+        Gargalos do mapa numa passada linear (Tarjan): casas que, se
+        bloqueadas, separam o mapa (ordenadas por linha/coluna) e corredores
+        (arestas) sem caminho alternativo.
+        """
+        pontes, articulacoes = self.graph.bridges_and_articulation_points()
+        ordem = lambda node: self.coord_of(node)[::-1]
+        return sorted(articulacoes, key=ordem), pontes
+
+    def unreachable_rooms(self):
+        """Salas fora do componente conexo da Entrada (deveria ser vazio)."""
+        alcancaveis = set(self.graph.iter_dfs(self.start_node))
+        return [sala for sala in self.room_positions if sala not in alcancaveis]
+
+    # ===============================================================
+    # Busca hierárquica (mapas grandes) e edição do mapa
+    # ===============================================================
+    def jump_search(self, start, goal):
+        """
+        Jump Point Search direto no map_grid entre dois nós. Devolve
+        (caminho em nomes de nó, pontos de salto expandidos), como as
+        buscas do pathfinding. Só vale para custo uniforme: com terreno,
+        o Graph troca "jps" por Dijkstra antes de chegar aqui.
+        """
+        a, b = self.coord_of(start), self.coord_of(goal)
+        if a is None or b is None:
+            return [], 0
+        cells, w, h = self.map_grid.data, self.width, self.height
+
+        def walkable(x, y):
+            return 0 <= x < w and 0 <= y < h and cells[y * w + x] != WALL
+
+        casas, expandidos = jump_point_path(a, b, walkable)
+        return [self.node_at(x, y) for x, y in casas], expandidos
+
+    def hierarchy(self, cluster_size=None):
+        """Abstração em blocos do mapa (hpa.ClusterMap), montada na 1ª chamada."""
+        if self._hierarchy is None or (cluster_size and cluster_size != self._hierarchy.size):
+            from hpa import ClusterMap, CLUSTER_SIZE
+            with profiler.section("world.build_hierarchy"):
+                self._hierarchy = ClusterMap(self, cluster_size or CLUSTER_SIZE)
+        return self._hierarchy
+
+    def hierarchical_path(self, start, goal):
+        """
+        Caminho entre dois nós pela busca em blocos: A* no grafo abstrato
+        e refino local. Custo igual ou um pouco acima do ótimo, mas o
+        tempo quase não cresce com o tamanho do mapa.
+        """
+        a, b = self.coord_of(start), self.coord_of(goal)
+        if a is None or b is None:
+            return []
+        with profiler.section("world.hierarchical_path"):
+            casas = self.hierarchy().find_path(a, b)
+        return [self.node_at(x, y) for x, y in casas]
+
+    def set_cell(self, x, y, char):
+        """
+        Troca o tipo de uma casa de corredor ("#" fecha, "." / "," / "=" /
+        "~" abre ou muda o terreno) e atualiza o grafo e só o bloco afetado
+        da abstração hierárquica.
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise ValueError(f"A casa ({x}, {y}) está fora do mapa {self.width}x{self.height}.")
+        if (x, y) in self._room_at:
+            raise ValueError(f"A casa ({x}, {y}) é uma sala e não pode ser alterada.")
+        if char not in EDITABLE_CELLS:
+            raise ValueError(f"Tipo de casa inválido para set_cell: {char!r} "
+                             f"(use um de {''.join(sorted(EDITABLE_CELLS))!r}; salas não são criadas assim).")
+
+        nome = y * self.width + x
+        self.map_grid.set(x, y, char)
+        self._room_distances = None
+        self._cache_key = None  # o mapa editado não é mais o do arquivo de cache
+        if self.lazy_graph:
+            self.graph._invalidate_paths()  # GridGraph: os vizinhos já saem do grid
+            if TERRAIN_COSTS.get(char, 1) != 1:
+                self.graph.weighted = True  # o Graph montado liga sozinho em add_edges_bulk
+        elif nome in self.graph.adj:
+            self.graph.remove_vertex(nome)
+        if char != "#" and not self.lazy_graph:
+            custo = TERRAIN_COSTS[char]
+            arestas = []
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                vizinho = self.node_at(nx, ny)
+                if vizinho is not None:
+                    arestas.append((nome, vizinho, max(custo, TERRAIN_COSTS[self.map_grid.get(nx, ny)])))
+            self.graph.add_edges_bulk(arestas, vertices=(nome,))
+        if self._hierarchy is not None:
+            self._hierarchy.update_cell(x, y)
+
+    def show_map(self):
+        self.graph.show()
+        gargalos, pontes = self.chokepoints()
+        print(f"[MAPA] {len(self.graph.connected_components())} região(ões) conexa(s)")
+        print(f"[MAPA] Gargalos (casas): {gargalos}")
+        print(f"[MAPA] Corredores sem alternativa: {len(pontes)}")
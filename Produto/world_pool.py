@@ -0,0 +1,93 @@
+# ===========================================
+# world_pool.py — Reserva de mundos pré-gerados
+# ===========================================
+# World() faz geração por rejeição (até 100 tentativas) + montagem do
+# grafo. Para não travar o "Novo Jogo", uma thread em segundo plano mantém
+# uma pequena fila de mundos prontos: get() retira um em O(1) e a thread
+# repõe a fila sozinha. Se a fila estiver vazia, o mundo é gerado na hora.
+# ===========================================
+
+import queue
+import threading
+
+from world import World
+
+
+class WorldPool:
+    """Fila de mundos prontos reabastecida por uma thread em segundo plano."""
+
+    def __init__(self, size=3, verbose=True, **world_kwargs):
+        self.size = size
+        self.verbose = verbose            # verbosidade do mundo entregue
+        self.world_kwargs = world_kwargs  # repassados para World(...)
+        self._ready = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ===============================
+    # Ciclo de vida
+    # ===============================
+    def start(self):
+        """Inicia a thread de reabastecimento (idempotente)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._fill, name="WorldPool", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Pede para a thread parar (mundos já prontos continuam na fila)."""
+        self._stop.set()
+
+    def _fill(self):
+        while not self._stop.is_set():
+            world = self._build()
+            # put com timeout para conseguir notar o stop com a fila cheia
+            while not self._stop.is_set():
+                try:
+                    self._ready.put(world, timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
+
+    def _build(self):
+        # Gera em silêncio; os logs voltam ao entregar o mundo
+        return World(verbose=False, **self.world_kwargs)
+
+    # ===============================
+    # Consumo
+    # ===============================
+    def get(self, verbose=None):
+        """
+        Retorna um mundo pronto (O(1)) ou gera um na hora se a fila estiver
+        vazia. 'verbose' troca a verbosidade do pool só para este mundo.
+        """
+        self.start()
+        try:
+            world = self._ready.get_nowait()
+        except queue.Empty:
+            world = self._build()
+        world.verbose = world.graph.verbose = self.verbose if verbose is None else verbose
+        return world
+
+    def ready_count(self):
+        return self._ready.qsize()
+
+
+# ===============================
+# Reserva padrão do jogo
+# ===============================
+_default_pool = None
+
+
+def get_pool():
+    """Reserva compartilhada por main.py e Interface.py (criada sob demanda)."""
+    global _default_pool
+    if _default_pool is None:
+        _default_pool = WorldPool().start()
+    return _default_pool
+
+
+def get_world(verbose=None):
+    """Atalho para retirar um mundo novo da reserva padrão."""
+    return get_pool().get(verbose)